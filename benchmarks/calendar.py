@@ -0,0 +1,136 @@
+import collections
+import datetime
+
+import doubledate as dtwo
+
+
+def test_construction(benchmark, dates):
+    benchmark(dtwo.Calendar, dates)
+
+
+def test_getitem(benchmark, calendar, size):
+    benchmark(calendar.__getitem__, size // 2)
+
+
+def test_slice_by_index(benchmark, calendar, size):
+    benchmark(calendar.__getitem__, slice(size // 4, size // 2))
+
+
+def test_slice_by_date(benchmark, calendar, dates):
+    benchmark(calendar.__getitem__, slice(dates[len(dates) // 4], dates[-1]))
+
+
+def test_getitem_positions(benchmark, calendar, size):
+    benchmark(calendar.__getitem__, list(range(0, size, 3)))
+
+
+def test_getitem_mask(benchmark, calendar, size):
+    benchmark(calendar.__getitem__, [i % 3 == 0 for i in range(size)])
+
+
+def test_iterrange(benchmark, calendar, size):
+    benchmark(lambda: collections.deque(calendar.iterrange(size // 4, size // 2), 0))
+
+
+def test_iterperiods_month(benchmark, calendar):
+    benchmark(lambda: collections.deque(calendar.iterperiods("M"), 0))
+
+
+def test_contains(benchmark, calendar, middle):
+    benchmark(calendar.__contains__, middle)
+
+
+def test_index(benchmark, calendar, middle):
+    benchmark(calendar.index, middle)
+
+
+def test_index_many(benchmark, calendar, other):
+    benchmark(calendar.index, other.dates, default=-1)
+
+
+def test_isin(benchmark, calendar, other):
+    benchmark(calendar.isin, other.dates)
+
+
+def test_roll(benchmark, calendar, dates):
+    # every calendar day over the first half of the calendar
+    days = [
+        dates[0] + datetime.timedelta(i)
+        for i in range((dates[-1] - dates[0]).days // 2)
+    ]
+    benchmark(calendar.roll, days, "modified_following")
+
+
+def test_groupby_month(benchmark, calendar):
+    benchmark(calendar.groupby, "M")
+
+
+def test_groupby_week(benchmark, calendar):
+    benchmark(calendar.groupby, "W")
+
+
+def test_groupby_callable(benchmark, calendar):
+    benchmark(calendar.groupby, lambda date: (date.year, date.month))
+
+
+def test_resample_quarter(benchmark, calendar):
+    benchmark(calendar.resample, "Q")
+
+
+def test_bd_resolve(benchmark, calendar):
+    benchmark(dtwo.BD(5, "M").resolve, calendar)
+
+
+def test_split(benchmark, calendar):
+    benchmark(calendar.split, dtwo.BD(1, "M"))
+
+
+def test_fa(benchmark, calendar, middle):
+    benchmark(calendar.fa, middle)
+
+
+def test_lb(benchmark, calendar, middle):
+    benchmark(calendar.lb, middle)
+
+
+def test_asof(benchmark, calendar, middle):
+    benchmark(
+        calendar.asof, middle + datetime.timedelta(days=(5 - middle.weekday()) % 7)
+    )
+
+
+def test_offset(benchmark, calendar, middle):
+    benchmark(calendar.offset, middle, 10)
+
+
+def test_daysbetween(benchmark, calendar, dates):
+    benchmark(calendar.daysbetween, dates[len(dates) // 4], dates[-len(dates) // 4])
+
+
+def test_union(benchmark, calendar, other):
+    benchmark(calendar.union, other)
+
+
+def test_intersection(benchmark, calendar, other):
+    benchmark(calendar.intersection, other)
+
+
+def test_difference(benchmark, calendar, other):
+    benchmark(calendar.difference, other)
+
+
+def test_dayof(benchmark, calendar):
+    benchmark(dtwo.dayof, "M", calendar=calendar)
+
+
+def test_daysfrom(benchmark, calendar):
+    benchmark(dtwo.daysfrom, "QS", calendar=calendar)
+
+
+def test_daysto(benchmark, calendar):
+    benchmark(dtwo.daysto, "ME", calendar=calendar)
+
+
+def test_dayof_cached(benchmark, calendar):
+    calendar.dayof("M")
+    benchmark(calendar.dayof, "M")
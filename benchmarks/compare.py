@@ -0,0 +1,159 @@
+"""
+Compares the benchmark suite between two commits (or stored baselines) and reports
+regressions.
+
+Usage::
+
+    $ python benchmarks/compare.py BASE [HEAD] [--sizes 1000,10000] [--threshold 0.1]
+
+where :code:`BASE` and :code:`HEAD` are either git revisions (:code:`HEAD` defaults to
+the working tree) or paths to JSON files produced by
+:code:`pytest benchmarks --benchmark-json=...` (such as the stored baselines in
+:code:`benchmarks/baselines`).
+
+For git revisions, the *current* benchmark suite is run against the package as of
+that revision, in a temporary git worktree, so that both sides run the same
+benchmarks.
+
+The script compares the minimum time of each benchmark and exits with status 1 if
+any benchmark is slower than the base by more than the threshold (default 10%).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS = os.path.join(ROOT, "benchmarks")
+
+
+def run(directory: str, sizes: str, output: str):
+    """
+    Runs the benchmark suite from the given directory, writing results to output.
+    """
+    env = dict(os.environ)
+    if sizes:
+        env["DOUBLEDATE_BENCHMARK_SIZES"] = sizes
+    # benchmarks of features missing at a given revision fail, and are then
+    # reported as only present on one side of the comparison
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "benchmarks",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            f"--benchmark-json={output}",
+        ],
+        cwd=directory,
+        env=env,
+        check=False,
+    )
+
+
+def results(revision: str, sizes: str) -> dict:
+    """
+    Returns the benchmark results of a JSON file or of a git revision (None for
+    the working tree), as a mapping of benchmark name to minimum time.
+    """
+    if revision is not None and os.path.isfile(revision):
+        with open(revision) as file:
+            report = json.load(file)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            if revision is None:
+                run(ROOT, sizes, output)
+            else:
+                worktree = os.path.join(tmp, "worktree")
+                subprocess.run(
+                    ["git", "worktree", "add", "--detach", worktree, revision],
+                    cwd=ROOT,
+                    check=True,
+                    capture_output=True,
+                )
+                try:
+                    # always run the current suite, which may not exist at revision
+                    shutil.rmtree(os.path.join(worktree, "benchmarks"), True)
+                    shutil.copytree(
+                        BENCHMARKS,
+                        os.path.join(worktree, "benchmarks"),
+                        ignore=shutil.ignore_patterns("baselines", "__pycache__"),
+                    )
+                    run(worktree, sizes, output)
+                finally:
+                    subprocess.run(
+                        ["git", "worktree", "remove", "--force", worktree],
+                        cwd=ROOT,
+                        check=True,
+                        capture_output=True,
+                    )
+            with open(output) as file:
+                report = json.load(file)
+
+    return {
+        benchmark["fullname"].split("::", 1)[-1]: benchmark["stats"]["min"]
+        for benchmark in report["benchmarks"]
+    }
+
+
+def compare(base: dict, head: dict, threshold: float) -> list:
+    """
+    Prints the comparison table and returns the names of regressed benchmarks.
+    """
+    width = max([len(name) for name in base] + [9])
+    print(f"{'benchmark':<{width}}  {'base (us)':>12}  {'head (us)':>12}  {'ratio':>7}")
+
+    regressions = []
+    for name in sorted(set(base) & set(head)):
+        ratio = head[name] / base[name]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        elif ratio < 1 - threshold:
+            flag = "  improvement"
+        print(
+            f"{name:<{width}}  {base[name] * 1e6:>12,.1f}  {head[name] * 1e6:>12,.1f}"
+            f"  {ratio:>7.2f}{flag}"
+        )
+
+    for name in sorted(set(base) ^ set(head)):
+        print(f"{name:<{width}}  (only in {'base' if name in base else 'head'})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("base", help="git revision or JSON results")
+    parser.add_argument(
+        "head", nargs="?", help="git revision or JSON results (default: working tree)"
+    )
+    parser.add_argument(
+        "--sizes", default="", help="comma-separated calendar sizes, e.g. 1000,10000"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown to report"
+    )
+    args = parser.parse_args(argv)
+
+    regressions = compare(
+        results(args.base, args.sizes),
+        results(args.head, args.sizes),
+        args.threshold,
+    )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Benchmark suite, run with pytest-benchmark::
+
+    $ pip install pytest-benchmark
+    $ python -m pytest benchmarks
+
+Calendar sizes default to 1k, 10k, 100k and 1M dates; use the
+:code:`DOUBLEDATE_BENCHMARK_SIZES` environment variable to restrict them, e.g.::
+
+    $ DOUBLEDATE_BENCHMARK_SIZES=1000,10000 python -m pytest benchmarks
+
+See :code:`benchmarks/compare.py` to compare two commits.
+"""
+
+import datetime
+import functools
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import doubledate as dtwo
+
+SIZES = [
+    int(size)
+    for size in os.environ.get(
+        "DOUBLEDATE_BENCHMARK_SIZES", "1000,10000,100000,1000000"
+    ).split(",")
+]
+
+# first date of the generated calendars
+START = datetime.date(1000, 1, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def weekdays(size: int) -> list:
+    """
+    Returns the first :code:`size` weekdays on or after :code:`START`.
+    """
+    dates, ordinal = [], START.toordinal()
+    while len(dates) < size:
+        date = datetime.date.fromordinal(ordinal)
+        if date.weekday() < 5:
+            dates.append(date)
+        ordinal += 1
+    return dates
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size:_}")
+def size(request):
+    return request.param
+
+
+@pytest.fixture
+def dates(size):
+    return weekdays(size)
+
+
+@pytest.fixture
+def calendar(dates):
+    return dtwo.Calendar(dates)
+
+
+@pytest.fixture
+def other(dates):
+    # every third weekday, shifted by one week
+    return dtwo.Calendar([date + datetime.timedelta(7) for date in dates[::3]])
+
+
+@pytest.fixture
+def middle(dates):
+    return dates[len(dates) // 2]
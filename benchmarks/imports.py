@@ -0,0 +1,16 @@
+"""
+Import time of the package, i.e. of :code:`import doubledate` in a fresh
+interpreter (whose own startup time is included).
+"""
+
+import subprocess
+import sys
+
+
+def test_import(benchmark):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import doubledate"],),
+        kwargs={"check": True},
+        rounds=20,
+    )
@@ -0,0 +1,86 @@
+"""
+Per-instance memory overhead of the doubledate classes.
+
+Usage::
+
+    $ python benchmarks/memory.py
+
+For each class, the script allocates 100,000 instances and reports the average
+number of bytes allocated per instance (as traced by :code:`tracemalloc`), as well
+as the size of the instance itself (excluding the objects it references).
+
+Results on CPython 3.11 (x86_64), 5 dates per calendar:
+
+=============  ============  ===========
+class          dict layout   slotted
+=============  ============  ===========
+Calendar       1,928 bytes   1,824 bytes
+Collection       152 bytes     112 bytes
+BD                96 bytes      56 bytes
+diem              96 bytes      56 bytes
+datemap          304 bytes     264 bytes
+=============  ============  ===========
+
+where the dict layout figures were obtained at the commit preceding the
+introduction of :code:`__slots__` (including the eagerly allocated, empty
+:code:`__datemaps__` dictionary of each :code:`Calendar`).
+"""
+
+import datetime
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import doubledate as dtwo
+
+COUNT = 100_000
+
+DATES = [datetime.date(2020, 1, 1) + datetime.timedelta(i) for i in range(5)]
+
+
+def measure(factory, count=COUNT):
+    """
+    Returns the average number of bytes allocated by the factory.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # the list holding the instances is not part of the overhead
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def shallow(instance):
+    """
+    Returns the size of the instance and of its __dict__, if any.
+    """
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def main():
+    calendar = dtwo.Calendar(DATES)
+    factories = {
+        "Calendar": lambda: dtwo.Calendar(DATES),
+        "Collection": lambda: dtwo.calendar.Collection([calendar]),
+        "BD": lambda: dtwo.BD(1, "M"),
+        "diem": lambda: dtwo.diem(6, 17),
+        "datemap": lambda: dtwo.datemap({date: 0 for date in DATES}),
+    }
+
+    print(f"{'class':<12}{'allocated':>12}{'shallow':>10}")
+    for name, factory in factories.items():
+        print(f"{name:<12}{measure(factory):>12,.0f}{shallow(factory()):>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Scalar utility functions; these do not depend on the calendar size.
+"""
+
+import datetime
+
+import pytest
+
+import doubledate as dtwo
+
+DATE = datetime.date(2020, 1, 31)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        dtwo.quarter,
+        dtwo.semester,
+        dtwo.trimester,
+        dtwo.sow,
+        dtwo.eow,
+        dtwo.som,
+        dtwo.eom,
+        dtwo.soq,
+        dtwo.eoq,
+        dtwo.sot,
+        dtwo.eot,
+        dtwo.sos,
+        dtwo.eos,
+        dtwo.soy,
+        dtwo.eoy,
+        dtwo.isleap,
+    ],
+    ids=lambda func: func.__name__,
+)
+def test_scalar(benchmark, func):
+    benchmark(func, DATE)
+
+
+@pytest.mark.parametrize("frequency", ["Y", "H", "Q", "M", "W", "W-WED"])
+def test_floor(benchmark, frequency):
+    benchmark(dtwo.floor, DATE, frequency)
+
+
+@pytest.mark.parametrize("frequency", ["Y", "H", "Q", "M", "W", "W-WED"])
+def test_ceil(benchmark, frequency):
+    benchmark(dtwo.ceil, DATE, frequency)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"days": 10},
+        {"weekdays": 10},
+        {"weeks": 2},
+        {"months": 1},
+        {"years": 1},
+        {"to": "EOQ"},
+        {"to": "FRI"},
+    ],
+    ids=lambda kwargs: "-".join(f"{k}={v}" for k, v in kwargs.items()),
+)
+def test_offset(benchmark, kwargs):
+    benchmark(dtwo.offset, DATE, **kwargs)
+
+
+def test_dayof(benchmark):
+    benchmark(dtwo.dayof, "Q", DATE)
+
+
+def test_daysto(benchmark):
+    benchmark(dtwo.daysto, "QE", DATE)
+
+
+def test_weekdayof(benchmark):
+    benchmark(dtwo.weekdayof, "M", DATE)
+
+
+def test_parse(benchmark):
+    benchmark(dtwo.parse, "2020-01-31")
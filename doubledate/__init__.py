@@ -6,6 +6,12 @@ from datetime import date, datetime, time, timedelta, timezone, tzinfo
 from .diem import diem
 from .constants import Y, H, T, Q, M, W, MON, TUE, WED, THU, FRI, SAT, SUN, WEEKDAYS
 from .calendar import Calendar, BD
+from .registry import Registry
+from .builder import CalendarBuilder
+from .markets import Markets
+from .schedule import Schedule
+from . import profiling
+from . import daycount
 from .utils import (
     quarter,
     trimester,
@@ -44,6 +50,12 @@ __all__ = [
     "diem",
     "Calendar",
     "BD",
+    "Registry",
+    "CalendarBuilder",
+    "Markets",
+    "Schedule",
+    "profiling",
+    "daycount",
     "Y",
     "H",
     "T",
@@ -0,0 +1,214 @@
+"""
+Incremental construction of calendars.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> builder = dtwo.CalendarBuilder(track=["M"])
+    >>> for date in feed:  # e.g. trading dates discovered by a market-data ingest
+    ...     builder.append(date)
+    ...     calendar = builder.freeze()  # cheap, immutable snapshot
+    ...     calendar.dayof("M")[date]
+"""
+
+import array
+import bisect
+import datetime
+
+from doubledate import cache, storage, utils
+from doubledate.calendar import Calendar
+
+
+class CalendarBuilder:
+    """
+    Append-only builder of calendars of dates.
+
+    Dates are kept as ordinals in a buffer with spare capacity, so that
+    appending a date after the last one is O(1) amortized; dates appended out of
+    order are inserted at their position (O(n)), and duplicates are ignored.
+
+    :code:`freeze` returns an immutable :code:`Calendar` sharing the builder's
+    buffer (O(1)), which later appends leave untouched: new dates are written
+    past the end of the snapshot, and the buffer is copied before any insertion
+    within it.
+
+    Parameters
+    ----------
+    dates : iterable, optional
+        initial dates
+    track : iterable, optional
+        frequencies (see :code:`Calendar.dayof`) whose day-of index is
+        maintained incrementally, and handed to the snapshots so that
+        :code:`snapshot.dayof(frequency)` does not recompute it
+
+    Raises
+    ------
+    TypeError
+        if a date is a datetime
+    ValueError
+        if a tracked frequency is not supported
+
+    Example
+    -------
+    .. code-block::
+
+        >>> builder = CalendarBuilder([datetime.date(2024, 1, 2)])
+        >>> builder.append(datetime.date(2024, 1, 3))
+        >>> builder.freeze()
+        <doubledate.calendar.Calendar at 0x17...>
+    """
+
+    __slots__ = ("_buffer", "_length", "_shared", "_snapshot", "_tracked")
+
+    def __init__(self, dates=(), *, track=()):
+        self._buffer = array.array("i")
+        self._length = 0
+        # whether the buffer is shared with snapshots
+        self._shared = False
+        # snapshot of the current dates, if any
+        self._snapshot = None
+        # frequency -> [buffer of counters, end of the last period]
+        self._tracked = {}
+        for frequency in track:
+            # validates the frequency
+            utils.dayof(frequency, calendar=())
+            self._tracked[frequency] = [array.array("i"), None]
+        self.extend(dates)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, datetime.date) or isinstance(date, datetime.datetime):
+            return False
+        ordinal = date.toordinal()
+        i = bisect.bisect_left(self._buffer, ordinal, 0, self._length)
+        return i < self._length and self._buffer[i] == ordinal
+
+    @property
+    def last(self) -> datetime.date:
+        """
+        Returns the last date.
+
+        Raises
+        ------
+        IndexError
+            if the builder is empty
+        """
+        if self._length == 0:
+            raise IndexError("Builder is empty")
+        return datetime.date.fromordinal(self._buffer[self._length - 1])
+
+    def append(self, date: datetime.date) -> "CalendarBuilder":
+        """
+        Adds a date.
+
+        Returns
+        -------
+        CalendarBuilder
+            the builder itself
+        """
+        ordinal = storage.key(date)
+        n = self._length
+
+        if n == 0 or ordinal > self._buffer[n - 1]:
+            # fast path: written past the end of all snapshots
+            if n == len(self._buffer):
+                self._reallocate(max(16, 2 * n))
+            self._buffer[n] = ordinal
+            for frequency, tracked in self._tracked.items():
+                counters, end = tracked
+                if n == 0 or date > end:
+                    tracked[1], counters[n] = utils.ceil(date, frequency), 1
+                else:
+                    counters[n] = counters[n - 1] + 1
+            self._length += 1
+            self._snapshot = None
+            return self
+
+        i = bisect.bisect_left(self._buffer, ordinal, 0, n)
+        if self._buffer[i] == ordinal:
+            return self
+
+        # the buffer is shared with snapshots, or full
+        if self._shared or n == len(self._buffer):
+            self._reallocate(max(16, 2 * n))
+        self._buffer[i + 1 : n + 1] = self._buffer[i:n]
+        self._buffer[i] = ordinal
+        self._length += 1
+        self._snapshot = None
+        self._recount()
+        return self
+
+    def extend(self, dates) -> "CalendarBuilder":
+        """
+        Adds the dates.
+
+        Returns
+        -------
+        CalendarBuilder
+            the builder itself
+        """
+        for date in dates:
+            self.append(date)
+        return self
+
+    def freeze(self) -> Calendar:
+        """
+        Returns an immutable snapshot of the dates added so far.
+
+        The snapshot shares the builder's storage (it is not copied), and is
+        not affected by later additions to the builder.
+
+        Returns
+        -------
+        Calendar
+        """
+        if self._snapshot is not None:
+            # no date was added since the last snapshot (and its cache is kept)
+            return self._snapshot
+
+        n = self._length
+        self._shared = True
+        calendar = Calendar._fromordinals(memoryview(self._buffer)[:n])
+        calendar.__cache__ = cache.Cache(calendar.cachesize)
+        for frequency, (counters, _) in self._tracked.items():
+            counters = memoryview(counters)[:n]
+            calendar.__cache__.seed(
+                ("dayof", frequency, 1),
+                lambda counters=counters: utils.datemap(dict(zip(calendar, counters))),
+            )
+        self._snapshot = calendar
+        return calendar
+
+    def _reallocate(self, capacity: int):
+        """
+        Copies the dates (and tracked counters) to new buffers of the given
+        capacity, leaving the previous buffers to the snapshots.
+        """
+        n = self._length
+        buffer = array.array("i", [0]) * capacity
+        buffer[:n] = self._buffer[:n]
+        self._buffer = buffer
+        for tracked in self._tracked.values():
+            counters = array.array("i", [0]) * capacity
+            counters[:n] = tracked[0][:n]
+            tracked[0] = counters
+        self._shared = False
+
+    def _recount(self):
+        """
+        Recomputes the tracked counters, after a date was inserted.
+        """
+        for frequency, tracked in self._tracked.items():
+            counters, end = tracked[0], None
+            for i in range(self._length):
+                date = datetime.date.fromordinal(self._buffer[i])
+                if i == 0 or date > end:
+                    end, counters[i] = utils.ceil(date, frequency), 1
+                else:
+                    counters[i] = counters[i - 1] + 1
+            tracked[1] = end
@@ -0,0 +1,117 @@
+import collections
+import threading
+
+
+class Cache:
+    """
+    Thread-safe, size-bounded (LRU) cache with single-flight computation.
+
+    Concurrent lookups of a missing key wait for the first caller to compute the
+    value, rather than computing it several times.
+
+    Parameters
+    ----------
+    maxsize : int, None
+        the maximum number of values to keep; None for an unbounded cache
+
+    Example
+    -------
+    .. code-block::
+
+        >>> cache = Cache(maxsize=2)
+        >>> cache.get("key", lambda: expensive())
+    """
+
+    __slots__ = ("_lock", "_pending", "_seeds", "_values", "maxsize")
+
+    def __init__(self, maxsize: int = 32):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(
+                f"Expected maxsize to be a positive integer, received {maxsize}"
+            )
+        self.maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._pending = {}
+        self._seeds = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, func):
+        """
+        Returns the cached value for the key, computing it with :code:`func()`
+        if it is not in the cache.
+
+        Parameters
+        ----------
+        key : hashable
+            the key
+        func : callable
+            function (without arguments) computing the value
+
+        Note
+        ----
+        If :code:`func` raises, the exception is propagated to the caller and
+        the value is not cached; callers waiting on the same key then compute the
+        value themselves.
+        """
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self._values.move_to_end(key)
+                    return self._values[key]
+                event = self._pending.get(key)
+                if event is None:
+                    event = self._pending[key] = threading.Event()
+                    func = self._seeds.pop(key, func)
+                    break
+            # another thread is computing the value
+            event.wait()
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+
+        try:
+            value = func()
+        except BaseException:
+            with self._lock:
+                del self._pending[key]
+            event.set()
+            raise
+
+        with self._lock:
+            self._values[key] = value
+            if self.maxsize is not None and len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+            del self._pending[key]
+        event.set()
+        return value
+
+    def seed(self, key, func):
+        """
+        Registers a function computing the value of the key, used instead of the
+        function passed to :code:`get` on the first lookup of the key (e.g. to
+        build the value from data which is already available).
+        """
+        with self._lock:
+            if key not in self._values:
+                self._seeds[key] = func
+
+    def clear(self):
+        """
+        Removes all values from the cache.
+        """
+        with self._lock:
+            self._values.clear()
+            self._seeds.clear()
+
+    def keys(self) -> list:
+        """
+        Returns the keys currently in the cache, from least to most recently used.
+        """
+        with self._lock:
+            return list(self._values)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
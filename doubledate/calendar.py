@@ -1,13 +1,193 @@
-import sortedcontainers
+import array
+import bisect
 import collections
 import collections.abc
 import datetime
+import functools
+import itertools
+import math
 import numbers
-import dateutil.rrule
+import operator
+import os
+import sys
+import threading
 import warnings
 
 import doubledate.utils as utils
 import doubledate.constants as constants
+from doubledate import cache, storage
+from doubledate.diem import diem
+
+# guards the lazy allocation of each calendar's cache
+CACHELOCK = threading.Lock()
+
+
+def keyfunc(frequency: str):
+    """
+    Returns the function mapping dates to the key of their period in the given
+    frequency (see :code:`Calendar.groupby`).
+    """
+    if frequency == "W":
+        return lambda date: tuple(date.isocalendar()[:2])
+    elif frequency in [
+        "W-MON",
+        "W-TUE",
+        "W-WED",
+        "W-THU",
+        "W-FRI",
+        "W-SAT",
+        "W-SUN",
+    ]:
+        return lambda date: utils.eow(date, weekday=frequency[-3:])
+    elif frequency == "M":
+        return lambda date: (date.year, date.month)
+    elif frequency == "Q":
+        return lambda date: (date.year, utils.quarter(date))
+    elif frequency == "T":
+        return lambda date: (date.year, utils.trimester(date))
+    elif frequency == "H":
+        return lambda date: (date.year, date.month > 6)
+    elif frequency == "Y":
+        return lambda date: date.year
+    raise ValueError(
+        f"Expected one of 'W', 'W-MON', 'W-TUE', ..., 'M', 'Q', 'T', 'H' or 'Y'; '{frequency}' given"
+    )
+
+
+# number of months in each period, by frequency
+MONTHS = {"M": 1, "Q": 3, "T": 4, "H": 6, "Y": 12}
+
+
+def nextperiod(frequency: str):
+    """
+    Returns the function mapping an ordinal to the ordinal of the start of the
+    next period in the given frequency (see :code:`Calendar.groupby`).
+    """
+    if frequency == "W" or frequency.startswith("W-"):
+        # ordinal 1 (0001-01-01) is a Monday; weeks end on Sundays by default
+        end = constants.WEEKDAYS[frequency[2:] or "SUN"]
+        return lambda ordinal: ordinal + (end - ordinal + 1) % 7 + 1
+
+    months = MONTHS[frequency]
+
+    def start(ordinal: int) -> int:
+        date = datetime.date.fromordinal(ordinal)
+        index = ((date.year * 12 + date.month - 1) // months + 1) * months
+        if index // 12 > datetime.MAXYEAR:
+            return sys.maxsize
+        return datetime.date(index // 12, index % 12 + 1, 1).toordinal()
+
+    return start
+
+
+def boundaries(calendar, frequency: str):
+    """
+    Yields the positions of the first and (one past the) last date of each
+    period of the calendar in the given frequency.
+
+    The start of each period is found by bisecting the calendar's sorted
+    ordinals for the start of the next period, so that dates are only
+    converted once per period; calendars of datetimes fall back to comparing
+    the key of consecutive dates.
+    """
+    try:
+        ordinals = calendar.__ordinals__()
+    except TypeError:
+        key, previous, start = keyfunc(frequency), None, 0
+        for position, value in enumerate(map(key, calendar)):
+            if position and value != previous:
+                yield start, position
+                start = position
+            previous = value
+        if len(calendar):
+            yield start, len(calendar)
+        return
+
+    keyfunc(frequency)  # validates the frequency
+    following, length, start = nextperiod(frequency), len(ordinals), 0
+    while start < length:
+        stop = bisect.bisect_left(ordinals, following(ordinals[start]), start)
+        yield start, stop
+        start = stop
+
+
+def runs(dates, key):
+    """
+    Yields the key, first and last date of each run of consecutive dates with
+    the same key.
+    """
+    dates = iter(dates)
+    for first in dates:
+        break
+    else:
+        return
+
+    current, start, end = key(first), first, first
+    for date in dates:
+        value = key(date)
+        if value != current:
+            yield current, start, end
+            current, start = value, date
+        end = date
+    yield current, start, end
+
+
+class PeriodTable:
+    """
+    Columnar summary of the periods of a calendar (see
+    :code:`Calendar.periodtable`).
+
+    Each column holds one value per period, in chronological order.
+
+    Attributes
+    ----------
+    keys : list
+        the key of each period (see :code:`Calendar.groupby`)
+    first : list
+        the first date of each period
+    last : list
+        the last date of each period
+    count : array
+        the number of dates in each period
+    start : array
+        the position (0-based) of the first date of each period in the calendar
+    """
+
+    __slots__ = ("count", "first", "keys", "last", "start")
+
+    def __init__(self, keys, first, last, count, start):
+        self.keys, self.first, self.last = keys, first, last
+        self.count, self.start = count, start
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self):
+        """
+        Returns the iterator of the rows, as tuples of (key, first, last, count,
+        start).
+        """
+        return zip(self.keys, self.first, self.last, self.count, self.start)
+
+    def __getitem__(self, index: int) -> tuple:
+        """
+        Returns the row of a period, as a tuple of (key, first, last, count,
+        start).
+        """
+        return (
+            self.keys[index],
+            self.first[index],
+            self.last[index],
+            self.count[index],
+            self.start[index],
+        )
+
+    def locate(self, position: int) -> int:
+        """
+        Returns the index of the period of the date at the given position in
+        the calendar.
+        """
+        return bisect.bisect_right(self.start, position) - 1
 
 
 class BD:
@@ -24,6 +204,8 @@ class BD:
         whether to consider the index 1-based or 0-based
     """
 
+    __slots__ = ("base", "frequency", "index")
+
     def __init__(self, index: int, frequency: str = "M", *, base: int = 0):
         if not isinstance(index, numbers.Integral):
             raise TypeError(
@@ -68,25 +250,26 @@ class BD:
         if self.frequency == "D":
             return calendar
 
-        dates = []
-        for subcal in calendar.resample(self.frequency):
-            try:
-                dates.append(subcal[self.index - self.base])
-            except Exception as e:
-                if onerror == constants.RAISE:
-                    raise e
-                elif onerror == "drop" or onerror == "skip":
-                    pass
-                elif onerror == "last":
-                    dates.append(subcal[-1])
-                elif onerror == "first":
-                    dates.append(subcal[0])
-                elif callable(onerror):
-                    dates.append(onerror(subcal))
-                else:
-                    raise ValueError(
-                        f"expected onerror to be one of 'raise', 'skip', 'last', 'first' or a callable, received {onerror}"
-                    )
+        dates, index = [], self.index - self.base
+        for _, _, _, count, start in calendar.periodtable(self.frequency):
+            if -count <= index < count:
+                dates.append(calendar[start + index % count])
+            elif onerror == constants.RAISE:
+                raise IndexError(
+                    f"Business day {index} is out of range in a period of {count} dates"
+                )
+            elif onerror == "drop" or onerror == "skip":
+                pass
+            elif onerror == "last":
+                dates.append(calendar[start + count - 1])
+            elif onerror == "first":
+                dates.append(calendar[start])
+            elif callable(onerror):
+                dates.append(onerror(calendar[start : start + count]))
+            else:
+                raise ValueError(
+                    f"expected onerror to be one of 'raise', 'skip', 'last', 'first' or a callable, received {onerror}"
+                )
         return Calendar(dates)
 
 
@@ -126,11 +309,80 @@ class Calendar:
         if dates is not an iterable of datetime objects
     """
 
+    # the cache of derived data (e.g. datemaps) is only allocated on first use
+    __slots__ = ("__cache__", "__dates__")
+
+    # maximum number of derived structures cached by each calendar
+    cachesize = 32
+
     def __init__(self, dates):
         if not all([isinstance(item, datetime.date) for item in dates]):
             raise TypeError("Calendar expected an iterable of date objects")
+
+        # imported lazily to keep `import doubledate` cheap
+        import sortedcontainers
+
         self.__dates__ = sortedcontainers.SortedSet([date for date in dates])
-        self.__datemaps__ = {}
+        self.__cache__ = None
+
+    @classmethod
+    def _fromordinals(cls, ordinals) -> "Calendar":
+        """
+        Creates a calendar backed by strictly increasing ordinals, without
+        sorting or validating them.
+        """
+        calendar = cls.__new__(cls)
+        calendar.__dates__ = storage.OrdinalSet(ordinals)
+        calendar.__cache__ = None
+        return calendar
+
+    def __cached__(self, key, func):
+        """
+        Returns the derived data cached under the key, computing it with
+        :code:`func()` if needed (see :code:`doubledate.cache.Cache`).
+        """
+        if self.__cache__ is None:
+            with CACHELOCK:
+                if self.__cache__ is None:
+                    self.__cache__ = cache.Cache(self.cachesize)
+        return self.__cache__.get(key, func)
+
+    def warm(self, *, dayof=(), daysfrom=(), daysto=()) -> "Calendar":
+        """
+        Pre-computes and caches derived data for the given frequencies.
+
+        Parameters
+        ----------
+        dayof : iterable
+            frequencies for :code:`Calendar.dayof` (with the default base)
+        daysfrom : iterable
+            frequencies for :code:`Calendar.daysfrom`
+        daysto : iterable
+            frequencies for :code:`Calendar.daysto`
+
+        Returns
+        -------
+        Calendar
+            the calendar itself
+
+        Example
+        -------
+        >>> calendar.warm(dayof=["M", "Q"], daysto=["ME"])
+        """
+        for frequency in dayof:
+            self.dayof(frequency)
+        for frequency in daysfrom:
+            self.daysfrom(frequency)
+        for frequency in daysto:
+            self.daysto(frequency)
+        return self
+
+    def clearcache(self):
+        """
+        Clears the derived data (e.g. datemaps) cached by the calendar.
+        """
+        if self.__cache__ is not None:
+            self.__cache__.clear()
 
     def __hash__(self):
         """
@@ -140,6 +392,30 @@ class Calendar:
         # ephemeral generator object
         return hash(tuple(self))
 
+    def __getstate__(self):
+        """
+        Returns the calendar as a compact buffer of delta-encoded ordinals (see
+        :code:`Calendar.to_bytes`), dropping any cached data.
+
+        Calendars containing datetimes fallback to a (sorted) list of dates.
+        """
+        try:
+            return self.to_bytes()
+        except TypeError:
+            return list(self.__dates__)
+
+    def __setstate__(self, state):
+        """
+        Restores the calendar from the state returned by :code:`__getstate__`.
+        """
+        if isinstance(state, bytes):
+            self.__dates__ = storage.OrdinalSet(storage.decode(state))
+        else:
+            import sortedcontainers
+
+            self.__dates__ = sortedcontainers.SortedSet(state)
+        self.__cache__ = None
+
     @classmethod
     def create(
         cls, freq="D", *, starting=None, ending=None, rrule=None, dtype=None, **kwargs
@@ -214,7 +490,14 @@ class Calendar:
             ...     byweekday=dtwo.MO
             ... )
             <doubledate.calendar.Calendar at 0x17045b0f430>
+
+        Note
+        ----
+        :code:`dateutil.rrule` is only imported on the first call to this
+        method, so that :code:`import doubledate` remains cheap.
         """
+        import dateutil.rrule
+
         if rrule is not None:
             if isinstance(rrule, str):
                 rrule = dateutil.rrule.rrulestr(rrule, dtstart=starting)
@@ -324,6 +607,433 @@ class Calendar:
             ]
         )
 
+    @classmethod
+    def from_diems(cls, diems, years, *, fold=None) -> "Calendar":
+        """
+        Creates a new calendar of recurring annual events, resolving each diem
+        in each of the given years.
+
+        Parameters
+        ----------
+        diems : diem, str, iterable
+            the diem(s), or strings which can be parsed as diems
+            (see :code:`diem.parse`)
+        years : iterable
+            the years in which to resolve the diems (e.g. :code:`range(2000, 2100)`)
+        fold : 'back', 'forward', None (default)
+            how to treat 29 Feb in years which are not leap years
+            (defaults to the fold of each diem)
+
+        Returns
+        -------
+        Calendar
+
+        Example
+        -------
+
+        .. code-block::
+
+            >>> import doubledate as dtwo
+
+            >>> calendar = dtwo.Calendar.from_diems(
+            ...     [dtwo.diem(6, 15), dtwo.diem(12, 15)], range(2020, 2030)
+            ... )
+            >>> len(calendar)
+            20
+
+            >>> calendar[0]
+            datetime.date(2020, 6, 15)
+        """
+        if isinstance(diems, (diem, str)):
+            diems = [diems]
+
+        if isinstance(years, numbers.Integral):
+            years = [years]
+        years = list(years)
+
+        dates = []
+        for value in diems:
+            if not isinstance(value, diem):
+                value = diem.parse(value)
+            dates.extend(value.resolve(years, fold=fold))
+        return cls(dates)
+
+    def to_bytes(self, encoding: str = "delta") -> bytes:
+        """
+        Serializes the calendar in a compact binary format.
+
+        Parameters
+        ----------
+        encoding : 'delta' (default), 'raw'
+            whether to store the differences between consecutive dates as
+            variable-length integers (typically 1 byte per date) or the raw
+            ordinals as 4-byte integers (which can be memory-mapped)
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        TypeError
+            if the calendar contains datetime objects (only dates are supported)
+
+        See also
+        --------
+        Calendar.from_bytes
+            Deserializes a calendar
+        Calendar.save
+            Saves the calendar to a file
+        """
+        return storage.encode(storage.toordinals(self.__dates__), encoding)
+
+    @classmethod
+    def from_bytes(cls, buffer) -> "Calendar":
+        """
+        Deserializes a calendar serialized with :code:`Calendar.to_bytes`.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            the serialized calendar
+
+        Returns
+        -------
+        Calendar
+
+        Raises
+        ------
+        ValueError
+            if the buffer is not a valid calendar, or if its checksum does not match
+        """
+        return cls._fromordinals(storage.decode(buffer))
+
+    def save(self, path, *, encoding: str = "delta"):
+        """
+        Saves the calendar to a file, see :code:`Calendar.to_bytes`.
+
+        Parameters
+        ----------
+        path : str, path-like
+            the file path
+        encoding : 'delta' (default), 'raw'
+            the payload encoding; use :code:`'raw'` to allow memory-mapping the
+            file with :code:`Calendar.load(path, mmap=True)`
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes(encoding))
+
+    @classmethod
+    def load(cls, path, *, mmap: bool = False) -> "Calendar":
+        """
+        Loads a calendar saved with :code:`Calendar.save`.
+
+        Parameters
+        ----------
+        path : str, path-like
+            the file path
+        mmap : bool
+            whether to memory-map the file rather than read it; the file must
+            have been saved with :code:`encoding='raw'`
+
+        Returns
+        -------
+        Calendar
+
+        Note
+        ----
+        Memory-mapped calendars are opened in constant time: dates are only read
+        from the file when accessed, and pages are shared between processes
+        mapping the same file. The checksum is not verified in this mode.
+
+        Example
+        -------
+
+        .. code-block::
+
+            >>> calendar.save("holidays.cal", encoding="raw")
+            >>> dtwo.Calendar.load("holidays.cal", mmap=True)
+            <doubledate.calendar.Calendar at 0x17045b0f430>
+        """
+        if mmap:
+            return cls._fromordinals(storage.memorymap(path))
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def to_numpy(self):
+        """
+        Returns the dates as a NumPy :code:`datetime64[D]` array.
+
+        Returns
+        -------
+        numpy.ndarray
+
+        Note
+        ----
+        Requires NumPy. The array is computed from the calendar's ordinals in a
+        single vectorized operation, without creating Python objects.
+        Calendars of datetimes are converted to :code:`datetime64[us]` arrays,
+        date by date.
+
+        Example
+        -------
+        .. code-block::
+
+            >>> calendar.to_numpy()
+            array(['2024-01-02', '2024-01-03', ...], dtype='datetime64[D]')
+        """
+        import numpy
+
+        try:
+            ordinals = self.__ordinals__()
+        except TypeError:
+            return numpy.array(list(self), dtype="datetime64[us]")
+        days = numpy.frombuffer(ordinals, dtype="i").astype("i8") - storage.EPOCH
+        return days.view("datetime64[D]")
+
+    @classmethod
+    def from_numpy(cls, values, *, sort: bool = False) -> "Calendar":
+        """
+        Creates a calendar from a NumPy :code:`datetime64` array.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            the dates, as :code:`datetime64` values (of any unit, truncated to
+            days) or :code:`datetime64` strings
+        sort : bool
+            whether to sort and deduplicate the values; by default the values
+            are trusted to be strictly increasing (and are not checked)
+
+        Returns
+        -------
+        Calendar
+
+        Raises
+        ------
+        ValueError
+            if a value is NaT or out of the range of :code:`datetime.date`
+
+        Note
+        ----
+        Requires NumPy. The calendar is backed by the ordinals computed from
+        the values in a single vectorized operation, without creating Python
+        objects.
+
+        Example
+        -------
+        .. code-block::
+
+            >>> dtwo.Calendar.from_numpy(numpy.arange("2024-01", "2024-02", dtype="datetime64[D]"))
+            <doubledate.calendar.Calendar at 0x17...>
+        """
+        import numpy
+
+        days = numpy.asarray(values, dtype="datetime64[D]").astype("i8")
+        if sort:
+            days = numpy.unique(days)
+        if len(days) and (
+            days.min() < datetime.date.min.toordinal() - storage.EPOCH
+            or days.max() > datetime.date.max.toordinal() - storage.EPOCH
+        ):
+            raise ValueError("Expected dates within the range of datetime.date")
+        ordinals = (days + storage.EPOCH).astype("i")
+        ordinals.flags.writeable = False
+        return cls._fromordinals(memoryview(ordinals))
+
+    def to_pandas(self):
+        """
+        Returns the dates as a pandas :code:`DatetimeIndex`.
+
+        Returns
+        -------
+        pandas.DatetimeIndex
+
+        Note
+        ----
+        Requires pandas. The index is built from :code:`Calendar.to_numpy`.
+        """
+        import pandas
+
+        return pandas.DatetimeIndex(self.to_numpy())
+
+    @classmethod
+    def from_pandas(cls, values) -> "Calendar":
+        """
+        Creates a calendar from a pandas :code:`DatetimeIndex` (or
+        :code:`Series` of datetimes).
+
+        Timestamps are truncated to days; timezone-aware timestamps are
+        converted to their local dates. Values are sorted and deduplicated
+        unless the (truncated) index is already strictly increasing.
+
+        Returns
+        -------
+        Calendar
+
+        Note
+        ----
+        Requires pandas.
+        """
+        import pandas
+
+        index = pandas.DatetimeIndex(values)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        index = index.normalize()
+        return cls.from_numpy(
+            index.to_numpy(),
+            sort=not (index.is_monotonic_increasing and index.is_unique),
+        )
+
+    def to_arrow(self):
+        """
+        Returns the dates as an Apache Arrow :code:`date32` array.
+
+        Returns
+        -------
+        pyarrow.Array
+
+        Note
+        ----
+        Requires pyarrow. The array is computed from the calendar's ordinals
+        with a single vectorized subtraction, without creating Python objects.
+        Calendars of datetimes are converted to :code:`timestamp[us]` arrays,
+        date by date.
+
+        Example
+        -------
+        .. code-block::
+
+            >>> calendar.to_arrow()
+            <pyarrow.lib.Date32Array object at 0x7f...>
+        """
+        import pyarrow
+        import pyarrow.compute
+
+        try:
+            ordinals = self.__ordinals__()
+        except TypeError:
+            return pyarrow.array(list(self), type=pyarrow.timestamp("us"))
+        values = pyarrow.Array.from_buffers(
+            pyarrow.int32(), len(ordinals), [None, pyarrow.py_buffer(ordinals)]
+        )
+        return pyarrow.compute.subtract(
+            values, pyarrow.scalar(storage.EPOCH, pyarrow.int32())
+        ).view(pyarrow.date32())
+
+    @classmethod
+    def from_arrow(cls, values, *, sort: bool = False) -> "Calendar":
+        """
+        Creates a calendar from an Apache Arrow array of dates.
+
+        Parameters
+        ----------
+        values : pyarrow.Array, pyarrow.ChunkedArray
+            the dates, as :code:`date32` values (or values which can be cast to
+            :code:`date32`, e.g. :code:`date64` or timestamps)
+        sort : bool
+            whether to sort and deduplicate the values; by default the values
+            are trusted to be strictly increasing (and are not checked)
+
+        Returns
+        -------
+        Calendar
+
+        Raises
+        ------
+        ValueError
+            if a value is null or out of the range of :code:`datetime.date`
+
+        Note
+        ----
+        Requires pyarrow. The calendar is backed by the ordinals computed from
+        the values with a single vectorized addition, without creating Python
+        objects.
+        """
+        import pyarrow
+        import pyarrow.compute
+
+        if isinstance(values, pyarrow.ChunkedArray):
+            values = values.combine_chunks()
+        elif not isinstance(values, pyarrow.Array):
+            values = pyarrow.array(values)
+        if values.type != pyarrow.date32():
+            values = values.cast(pyarrow.date32())
+        if values.null_count:
+            raise ValueError("Expected dates, received null values")
+        if sort:
+            values = pyarrow.compute.unique(values)
+            values = values.take(pyarrow.compute.sort_indices(values))
+
+        days = values.view(pyarrow.int32())
+        if len(days):
+            bounds = pyarrow.compute.min_max(days)
+            if (
+                bounds["min"].as_py() < datetime.date.min.toordinal() - storage.EPOCH
+                or bounds["max"].as_py() > datetime.date.max.toordinal() - storage.EPOCH
+            ):
+                raise ValueError("Expected dates within the range of datetime.date")
+
+        ordinals = pyarrow.compute.add(
+            days, pyarrow.scalar(storage.EPOCH, pyarrow.int32())
+        )
+        buffer = memoryview(ordinals.buffers()[1]).toreadonly().cast("i")
+        return cls._fromordinals(
+            buffer[ordinals.offset : ordinals.offset + len(ordinals)]
+        )
+
+    def to_parquet(self, path, *, column: str = "date"):
+        """
+        Writes the dates to a Parquet file, as a :code:`date32` column.
+
+        Parameters
+        ----------
+        path : str, path-like
+            the file path
+        column : str
+            the name of the column
+
+        Note
+        ----
+        Requires pyarrow.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(pyarrow.table({column: self.to_arrow()}), str(path))
+
+    @classmethod
+    def from_parquet(
+        cls, path, *, column: str = "date", sort: bool = True
+    ) -> "Calendar":
+        """
+        Reads a calendar from a column of dates of a Parquet file.
+
+        Parameters
+        ----------
+        path : str, path-like
+            the file path
+        column : str
+            the name of the column
+        sort : bool
+            whether to sort and deduplicate the values (see
+            :code:`Calendar.from_arrow`); disable for files written by
+            :code:`Calendar.to_parquet`
+
+        Returns
+        -------
+        Calendar
+
+        Note
+        ----
+        Requires pyarrow.
+        """
+        import pyarrow.parquet
+
+        table = pyarrow.parquet.read_table(str(path), columns=[column])
+        return cls.from_arrow(table.column(column), sort=sort)
+
     @property
     def last(self) -> datetime.date:
         """
@@ -454,28 +1164,191 @@ class Calendar:
         """
         return date in self.__dates__
 
-    def index(self, date) -> int:
+    def index(self, date, default=constants.RAISE) -> int:
         """
         Returns the index (0-based position) of the date.
 
         Parameters
         ----------
-        date : datetime
-            the date whose index is searched
+        date : datetime, iterable
+            the date (or NumPy :code:`datetime64` scalar) whose index is
+            searched, or an iterable (or NumPy :code:`datetime64` array) of
+            dates
+        default : optional
+            the value returned for dates which are not in the calendar
+            if no default value is given, it will raise a ValueError
 
         Raises
         ------
         ValueError
-            If date is not in calendar
+            If date is not in calendar (and no default is given)
 
         Returns
         -------
         int
             Position (0-based) of the date
+        list
+            if passed an iterable of dates
+        numpy.ndarray
+            if passed a NumPy :code:`datetime64` array
+
+        Example
+        -------
+        .. code-block::
+
+            >>> calendar.index(dates, default=-1)
+            [0, 4, -1, 12]
+        """
+        if hasattr(date, "dtype"):
+            import numpy
+
+            if numpy.ndim(date) == 0:
+                # a NumPy scalar (e.g. numpy.datetime64), searched as a date
+                position = int(self.__positions__(numpy.atleast_1d(date))[0])
+                if position < 0:
+                    if default == constants.RAISE:
+                        raise ValueError(f"{date!r} is not in calendar")
+                    return default
+                return position
+
+        if isinstance(date, collections.abc.Iterable) or hasattr(date, "dtype"):
+            if not hasattr(date, "dtype"):
+                date = list(date)
+            positions = self.__positions__(date)
+            if hasattr(positions, "dtype"):
+                import numpy
+
+                if default == constants.RAISE:
+                    if (positions < 0).any():
+                        missing = date[positions < 0][0]
+                        raise ValueError(f"{missing!r} is not in calendar")
+                    return positions
+                return numpy.where(positions < 0, default, positions)
+
+            result = []
+            for d, position in zip(date, positions):
+                if position < 0:
+                    if default == constants.RAISE:
+                        raise ValueError(f"{d!r} is not in calendar")
+                    position = default
+                result.append(position)
+            return result
+
+        try:
+            return self.__dates__.index(date)
+        except ValueError:
+            if default == constants.RAISE:
+                raise
+            return default
+
+    def isin(self, dates):
         """
-        if isinstance(date, collections.abc.Iterable):
-            return [self.index(d) for d in date]
-        return self.__dates__.index(date)
+        Returns, for each date, whether it is in the calendar.
+
+        Parameters
+        ----------
+        dates : iterable
+            an iterable (or NumPy :code:`datetime64` array) of dates
+
+        Returns
+        -------
+        list
+            of booleans
+        numpy.ndarray
+            of booleans, if passed a NumPy :code:`datetime64` array
+
+        Example
+        -------
+        .. code-block::
+
+            >>> calendar.isin(dates)
+            [True, True, False, True]
+        """
+        positions = self.__positions__(dates)
+        if hasattr(positions, "dtype"):
+            return positions >= 0
+        return [position >= 0 for position in positions]
+
+    def __ordinals__(self):
+        """
+        Returns the ordinals of the dates (cached for calendars which are not
+        backed by ordinals).
+
+        Raises
+        ------
+        TypeError
+            if the calendar contains datetimes
+        """
+        if isinstance(self.__dates__, storage.OrdinalSet):
+            return self.__dates__.ordinals
+        return self.__cached__(("ordinals",), lambda: storage.toordinals(self))
+
+    def __rank__(self):
+        """
+        Returns the first ordinal of the calendar and the cumulative rank of each
+        day from it, i.e. the number of dates strictly before each day between
+        the first and the last date (cached).
+
+        Raises
+        ------
+        TypeError
+            if the calendar contains datetimes
+        """
+
+        def rank():
+            ordinals = self.__ordinals__()
+            if len(ordinals) == 0:
+                return None, array.array("i")
+            first = ordinals[0]
+            ranks = array.array("i", [0]) * (ordinals[-1] - first + 1)
+            previous = 0
+            for i, ordinal in enumerate(ordinals):
+                ranks[previous : ordinal - first + 1] = array.array("i", [i]) * (
+                    ordinal - first + 1 - previous
+                )
+                previous = ordinal - first + 1
+            return first, ranks
+
+        return self.__cached__(("rank",), rank)
+
+    def __positions__(self, dates):
+        """
+        Returns the positions of the dates in the calendar, -1 for missing dates,
+        searching the sorted ordinals (with NumPy for :code:`datetime64` arrays).
+        """
+        if hasattr(dates, "dtype") and dates.dtype.kind == "M":
+            import numpy
+
+            try:
+                ordinals = numpy.frombuffer(self.__ordinals__(), dtype="i")
+            except TypeError:
+                return numpy.array(
+                    self.__positions__(dates.astype("datetime64[D]").tolist())
+                )
+            values = dates.astype("datetime64[D]").astype("i8") + storage.EPOCH
+            positions = numpy.searchsorted(ordinals, values)
+            found = positions < len(ordinals)
+            found[found] = ordinals[positions[found]] == values[found]
+            return numpy.where(found, positions, -1)
+
+        try:
+            ordinals = self.__ordinals__()
+        except TypeError:
+            ordinals = None
+
+        positions, length = [], len(self)
+        for date in dates:
+            if (
+                ordinals is None
+                or not isinstance(date, datetime.date)
+                or isinstance(date, datetime.datetime)
+            ):
+                positions.append(self.__dates__.index(date) if date in self else -1)
+                continue
+            ordinal = date.toordinal()
+            i = bisect.bisect_left(ordinals, ordinal)
+            positions.append(i if i < length and ordinals[i] == ordinal else -1)
+        return positions
 
     def __iter__(self):
         """
@@ -485,24 +1358,42 @@ class Calendar:
 
     def __getitem__(self, value):
         """
-        Retrieves a date by index or slices a calendar.
+        Retrieves a date by index, slices a calendar or selects dates by
+        integer positions or boolean mask.
 
         If `value` is a slice, the start and stop values can be
         either integers or datetime.date objects.
 
+        If `value` is a list (or NumPy array) of integers, the dates at these
+        positions are selected; if it is a list (or NumPy array) of booleans of
+        the same length as the calendar, the dates where the mask is True are
+        selected.
+
         Returns
         -------
         datetime.date
             if passed an index
         Calendar
-            if passed a slice
+            if passed a slice, integer positions or a boolean mask
+
+        Raises
+        ------
+        TypeError
+            if value is neither an integer, a slice, nor an array of
+            integers or booleans
+        IndexError
+            if an index is out of range, or if the mask is not of the same
+            length as the calendar
+
+        Example
+        -------
+        .. code-block::
 
-        Raises
-        ------
-        TypeError
-            if value is neither an integer nor a slice
-        KeyError
-            if the index is out of range
+            >>> calendar[[0, -1]]  # first and last dates
+            <doubledate.calendar.Calendar at 0x17...>
+
+            >>> calendar[signal > 0]  # dates where a NumPy signal is positive
+            <doubledate.calendar.Calendar at 0x17...>
         """
         if isinstance(value, slice):
             # maintain step component when translating date boundaries
@@ -511,9 +1402,72 @@ class Calendar:
                 start = self.__dates__.bisect_left(start)
             if isinstance(stop, datetime.date):
                 stop = self.__dates__.bisect_right(stop)
+            if isinstance(self.__dates__, storage.OrdinalSet) and (step or 1) > 0:
+                # slices of ordinals remain sorted, no need to rebuild a SortedSet
+                ordinals = self.__dates__.ordinals[start:stop:step]
+                if step not in (None, 1):
+                    # stepped slices of memoryviews (e.g. memory-mapped files)
+                    # are not contiguous, which NumPy and pyarrow require
+                    ordinals = array.array("i", ordinals)
+                return Calendar._fromordinals(ordinals)
             return Calendar(self.__dates__.__getitem__(slice(start, stop, step)))
+        if not isinstance(value, (numbers.Integral, str)) and (
+            isinstance(value, collections.abc.Iterable) or hasattr(value, "dtype")
+        ):
+            return self.__gather__(value)
         return self.__dates__.__getitem__(value)
 
+    def __gather__(self, value) -> "Calendar":
+        """
+        Selects the dates at the given positions, or where the boolean mask is
+        True (see :code:`Calendar.__getitem__`).
+        """
+        dates = self.__dates__
+        if hasattr(value, "dtype") and isinstance(dates, storage.OrdinalSet):
+            # NumPy array: vectorized gather on the ordinals
+            import numpy
+
+            ordinals = numpy.frombuffer(dates.ordinals, dtype="i")
+            if value.dtype.kind == "b":
+                if len(value) != len(ordinals):
+                    raise IndexError(
+                        f"Expected a mask of length {len(ordinals)}, received {len(value)}"
+                    )
+                selected = ordinals[value]
+            elif value.dtype.kind in "iu":
+                # positions may be unordered or repeated
+                selected = numpy.unique(ordinals[value])
+            else:
+                raise TypeError(
+                    f"Expected an array of integers or booleans, received {value.dtype}"
+                )
+            result = array.array("i")
+            result.frombytes(selected.astype("i").tobytes())
+            return Calendar._fromordinals(result)
+
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        value = list(value)
+        source = dates.ordinals if isinstance(dates, storage.OrdinalSet) else dates
+
+        if value and all(isinstance(item, bool) for item in value):
+            if len(value) != len(dates):
+                raise IndexError(
+                    f"Expected a mask of length {len(dates)}, received {len(value)}"
+                )
+            selected = list(itertools.compress(source, value))
+        elif all(
+            isinstance(item, numbers.Integral) and not isinstance(item, bool)
+            for item in value
+        ):
+            selected = sorted({source[operator.index(item)] for item in value})
+        else:
+            raise TypeError("Expected an array of integers or booleans")
+
+        if source is dates:
+            return Calendar(selected)
+        return Calendar._fromordinals(array.array("i", selected))
+
     def __add__(self, other):
         """
         Alias for union.
@@ -555,6 +1509,34 @@ class Calendar:
         except Exception:
             return False
 
+    def lazy(self):
+        """
+        Returns a lazily evaluated expression of the calendar.
+
+        Set operations, date-range slices and filters on the expression build an
+        expression tree, which is optimized and evaluated in a single pass when
+        the result is requested (see :code:`doubledate.lazy`).
+
+        Returns
+        -------
+        doubledate.lazy.Expression
+
+        Example
+        -------
+        >>> (
+        ...     a.lazy()
+        ...     .union(b)
+        ...     .difference(c)
+        ...     .intersection(d)[datetime.date(2024, 1, 1) : datetime.date(2024, 12, 31)]
+        ...     .weekdays()
+        ...     .collect()
+        ... )
+        <doubledate.calendar.Calendar at 0x17045b0f430>
+        """
+        from doubledate import lazy
+
+        return lazy.Leaf(self)
+
     def union(self, *others):
         """
         Combines two calendars by combining dates in self and other.
@@ -859,7 +1841,9 @@ class Calendar:
         ----
         As the Calendar is immutable, the `datemap`
         is cached for efficiency. Repeatedly calling :code:`calendar.dayof("M")`
-        should be of complexity 1 after the first call.
+        should be of complexity 1 after the first call. The cache is bounded
+        by :code:`Calendar.cachesize` (least recently used datemaps are evicted)
+        and can be cleared with :code:`Calendar.clearcache`.
 
 
         Example
@@ -868,11 +1852,10 @@ class Calendar:
         >>> calendar.dayof("M")[datetime.date(2021,1,3)]
         1
         """
-        if ("dayof", frequency, base) not in self.__datemaps__:
-            self.__datemaps__[("dayof", frequency, base)] = utils.dayof(
-                frequency, calendar=self, base=base
-            )
-        return self.__datemaps__[("dayof", frequency, base)]
+        return self.__cached__(
+            ("dayof", frequency, base),
+            lambda: utils.dayof(frequency, calendar=self, base=base),
+        )
 
     def daysfrom(self, frequency: str):
         """
@@ -890,11 +1873,10 @@ class Calendar:
         -------
         datemap
         """
-        if ("daysfrom", frequency) not in self.__datemaps__:
-            self.__datemaps__[("daysfrom", frequency)] = utils.daysfrom(
-                frequency, calendar=self
-            )
-        return self.__datemaps__[("daysfrom", frequency)]
+        return self.__cached__(
+            ("daysfrom", frequency),
+            lambda: utils.daysfrom(frequency, calendar=self),
+        )
 
     def daysto(self, frequency: str):
         """
@@ -905,11 +1887,10 @@ class Calendar:
         -------
         datemap
         """
-        if ("daysto", frequency) not in self.__datemaps__:
-            self.__datemaps__[("daysto", frequency)] = utils.daysto(
-                frequency, calendar=self
-            )
-        return self.__datemaps__[("daysto", frequency)]
+        return self.__cached__(
+            ("daysto", frequency),
+            lambda: utils.daysto(frequency, calendar=self),
+        )
 
     def daysbetween(
         self, this: datetime.date, that: datetime.date, bounds: str = "left"
@@ -932,22 +1913,16 @@ class Calendar:
         int
             The number of dates between this and that
         """
+        start, end = min(this, that), max(this, that)
+        dates = self.__dates__
         if bounds == "both":
-            return len(
-                self.filter(lambda date: min(this, that) <= date <= max(this, that))
-            )
+            return dates.bisect_right(end) - dates.bisect_left(start)
         if bounds == "left":
-            return len(
-                self.filter(lambda date: min(this, that) <= date < max(this, that))
-            )
+            return dates.bisect_left(end) - dates.bisect_left(start)
         if bounds == "right":
-            return len(
-                self.filter(lambda date: min(this, that) < date <= max(this, that))
-            )
+            return dates.bisect_right(end) - dates.bisect_right(start)
         if bounds is None:
-            return len(
-                self.filter(lambda date: min(this, that) < date < max(this, that))
-            )
+            return max(0, dates.bisect_left(end) - dates.bisect_right(start))
         raise ValueError(
             f"bounds should be one of 'both', 'left' or 'right', {bounds} given"
         )
@@ -978,7 +1953,7 @@ class Calendar:
             raise IndexError("Out of bounds")
         return self[self.index(date) + days]
 
-    def groupby(self, grouper):
+    def groupby(self, grouper, *, memoize: bool = False):
         """
         Group dates by the grouper parameter.
 
@@ -991,6 +1966,7 @@ class Calendar:
             - :code:`W-MON`: to :code:`W-SUN` group week ending on a particular weekday
             - :code:`M`: group by month each year
             - :code:`Q`: group by quarter each year
+            - :code:`T`: group by trimester each year
             - :code:`H`: group by semester each year
             - :code:`Y`: group by year each year
 
@@ -998,11 +1974,16 @@ class Calendar:
         ----------
         grouper : str, callable
             the criterion to group dates by
+        memoize : bool
+            with a frequency, whether the lazy collection keeps the calendar of
+            each period once created (default is False)
 
         Returns
         -------
         :class:`doubledate.calendar.Collection`
-            Collection of calendars
+            Collection of calendars; with a frequency, a
+            :class:`doubledate.calendar.LazyCollection`, which only creates the
+            calendar of each period when it is accessed
 
         Example
         -------
@@ -1019,29 +2000,8 @@ class Calendar:
         <doubledate.Collection at 0x7fd0fa52c2e0>
         """
         if isinstance(grouper, str):
-            if grouper == "W":
-                return self.groupby(lambda date: (date.year, date.isocalendar()[1]))
-            elif grouper in [
-                "W-MON",
-                "W-TUE",
-                "W-WED",
-                "W-THU",
-                "W-FRI",
-                "W-SAT",
-                "W-SUN",
-            ]:
-                return self.groupby(lambda date: utils.eow(date, weekday=grouper[-3:]))
-            elif grouper == "M":
-                return self.groupby(lambda date: (date.year, date.month))
-            elif grouper == "Q":
-                return self.groupby(lambda date: (date.year, utils.quarter(date)))
-            elif grouper == "H":
-                return self.groupby(lambda date: (date.year, date.month > 6))
-            elif grouper == "Y":
-                return self.groupby(lambda date: date.year)
-            raise ValueError(
-                f"Expected one of 'W', 'W-MON', 'W-TUE', ..., 'M', 'Q', 'H' or 'Y'; '{grouper}' given"
-            )
+            table = self.periodtable(grouper)
+            return LazyCollection(self, table.start, table.count, memoize=memoize)
 
         if callable(grouper):
             calendars = collections.defaultdict(lambda: [])
@@ -1062,11 +2022,148 @@ class Calendar:
 
         raise ValueError(f"Expected string, iterable or function, received '{grouper}'")
 
-    def resample(self, grouper):
+    def iterrange(self, start=None, end=None, step: int = 1, reverse: bool = False):
+        """
+        Lazily iterates over a range of the calendar, without creating a new
+        calendar.
+
+        The range is defined as for slices: the start and end values can be
+        either integers (positions, end excluded) or datetime.date objects
+        (both included).
+
+        Parameters
+        ----------
+        start : int, datetime.date, optional
+            the start of the range
+        end : int, datetime.date, optional
+            the end of the range
+        step : int
+            the step between yielded dates (must be positive)
+        reverse : bool
+            whether to iterate from the end of the range
+
+        Returns
+        -------
+        iterator
+            of datetime.date
+
+        Example
+        -------
+        >>> for date in calendar.iterrange(datetime.date(2024, 1, 1), datetime.date(2024, 3, 31)):
+        ...     process(date)
+
+        Every fifth date, from the last one
+
+        >>> list(calendar.iterrange(step=5, reverse=True))
+        """
+        if not isinstance(step, numbers.Integral) or step < 1:
+            raise ValueError(f"Expected step to be a positive integer, received {step}")
+        if isinstance(start, datetime.date):
+            start = self.__dates__.bisect_left(start)
+        if isinstance(end, datetime.date):
+            end = self.__dates__.bisect_right(end)
+        start, end, _ = slice(start, end).indices(len(self))
+        if start >= end:
+            return iter(())
+        return itertools.islice(
+            self.__dates__.islice(start, end, reverse=reverse), None, None, step
+        )
+
+    def iterperiods(self, grouper):
+        """
+        Lazily iterates over the periods of the calendar, without creating
+        sub-calendars.
+
+        Parameters
+        ----------
+        grouper : str, callable
+            the frequency (see :code:`Calendar.groupby`) or a callable
+            receiving each date and returning the key of its period
+
+        Returns
+        -------
+        iterator
+            of tuples with the key, first date and last date of each period
+
+        Note
+        ----
+        Periods are runs of consecutive dates with the same key; with a callable
+        returning the same key for non-consecutive dates, the key is yielded
+        once for each run.
+
+        Example
+        -------
+        >>> for key, start, end in calendar.iterperiods("M"):
+        ...     print(key, start, end)
+        (2024, 1) 2024-01-02 2024-01-31
+        (2024, 2) 2024-02-01 2024-02-29
+        ...
+        """
+        if isinstance(grouper, str):
+            key, dates = keyfunc(grouper), self.__dates__
+            return (
+                (key(dates[a]), dates[a], dates[b - 1])
+                for a, b in boundaries(self, grouper)
+            )
+        if callable(grouper):
+            return runs(self, grouper)
+
+        raise ValueError(f"Expected string or function, received '{grouper}'")
+
+    def resample(self, grouper, *, memoize: bool = False):
         """
         Alias for :class:`doubledate.Calendar.groupby`
         """
-        return self.groupby(grouper)
+        return self.groupby(grouper, memoize=memoize)
+
+    def periodtable(self, frequency: str) -> PeriodTable:
+        """
+        Returns the summary of the periods of the calendar: the key, first and
+        last date, number of dates and position of the first date of each
+        period.
+
+        The table is computed in a single pass over the dates and cached; it
+        also backs :code:`groupby` (with a frequency),
+        :code:`BD.resolve` and :code:`som`, ..., :code:`eoy`.
+
+        Parameters
+        ----------
+        frequency : str
+            the frequency (see :code:`Calendar.groupby`)
+
+        Returns
+        -------
+        PeriodTable
+
+        Raises
+        ------
+        ValueError
+            if the frequency is not supported
+
+        Example
+        -------
+        .. code-block::
+
+            >>> table = calendar.periodtable("M")
+            >>> list(table.count)  # number of open days each month
+            [22, 21, 21, ...]
+            >>> table[-1]
+            ((2024, 12), datetime.date(2024, 12, 2), datetime.date(2024, 12, 31), 21, 230)
+        """
+        key = keyfunc(frequency)
+
+        def tabulate():
+            dates, keys, first, last = self.__dates__, [], [], []
+            start, count = array.array("i"), array.array("i")
+            for a, b in boundaries(self, frequency):
+                first.append(dates[a])
+                last.append(dates[b - 1])
+                keys.append(key(first[-1]))
+                start.append(a)
+                count.append(b - a)
+            return PeriodTable(keys, first, last, count, start)
+
+        return self.__cached__(("periodtable", frequency), tabulate)
 
     def split(
         self,
@@ -1279,6 +2376,160 @@ class Calendar:
             return self.fa(date, default=default)
         raise ValueError(f"side should be one of 'left' or 'right', {side} given")
 
+    def roll(self, dates, convention: str = "following", default=constants.RAISE):
+        """
+        Adjusts dates to dates of the calendar (e.g. business days) following a
+        roll convention.
+
+        The convention can be one of:
+            - :code:`unadjusted` (or :code:`U`): dates are not adjusted
+            - :code:`following` (or :code:`F`): the first date on or after
+            - :code:`modified_following` (or :code:`MF`): the first date on or
+              after, unless it is in another month, in which case the last date
+              on or before
+            - :code:`preceding` (or :code:`P`): the last date on or before
+            - :code:`modified_preceding` (or :code:`MP`): the last date on or
+              before, unless it is in another month, in which case the first
+              date on or after
+
+        Parameters
+        ----------
+        dates : datetime.date, iterable
+            the date, or an iterable (or NumPy :code:`datetime64` array) of dates
+        convention : str
+            the roll convention (default is :code:`following`)
+        default : optional
+            the value returned for dates which cannot be adjusted, i.e. beyond
+            the first (last) date of the calendar; if no default value is given,
+            it will raise a KeyError
+
+        Returns
+        -------
+        tuple
+            the adjusted dates and whether each date was moved, as a date and a
+            bool, as lists, or as NumPy arrays if passed a NumPy array
+
+        Raises
+        ------
+        KeyError
+            if a date cannot be adjusted (and no default is given)
+        ValueError
+            if the convention is not supported
+
+        Example
+        -------
+        .. code-block::
+
+            >>> adjusted, moved = calendar.roll(payments, "modified_following")
+
+            >>> calendar.roll(datetime.date(2024, 3, 30), "MF")
+            (datetime.date(2024, 3, 28), True)
+        """
+        if convention not in constants.CONVENTIONS:
+            raise ValueError(
+                f"Expected convention to be one of {', '.join(constants.CONVENTIONS)}, received {convention}"
+            )
+        convention = constants.CONVENTIONS[convention]
+
+        if hasattr(dates, "dtype") and dates.dtype.kind == "M":
+            return self.__rollarray__(dates, convention, default)
+
+        scalar = isinstance(dates, datetime.date)
+        adjusted, moved = [], []
+        for date in [dates] if scalar else dates:
+            rolled = self.__roll__(date, convention)
+            if rolled is None:
+                if default == constants.RAISE:
+                    raise KeyError(
+                        f"Out-of-range error: {date} cannot be rolled {convention} in the calendar"
+                    )
+                rolled = default
+            adjusted.append(rolled)
+            moved.append(rolled != date)
+
+        if scalar:
+            return adjusted[0], moved[0]
+        return adjusted, moved
+
+    def __roll__(self, date, convention: str):
+        """
+        Returns the date adjusted following the convention, or None if it cannot
+        be adjusted.
+        """
+        if convention == constants.UNADJUSTED:
+            return date
+        dates = self.__dates__
+        i = dates.bisect_left(date)
+        if i < len(dates) and dates[i] == date:
+            return date
+
+        following = dates[i] if i < len(dates) else None
+        preceding = dates[i - 1] if i > 0 else None
+        if convention == constants.FOLLOWING:
+            return following
+        if convention == constants.PRECEDING:
+            return preceding
+        if convention == constants.MODIFIED_FOLLOWING:
+            if following is None or following.month == date.month:
+                return following
+            return preceding
+        if preceding is None or preceding.month == date.month:
+            return preceding
+        return following
+
+    def __rollarray__(self, dates, convention: str, default):
+        """
+        Vectorized :code:`Calendar.roll` of a NumPy :code:`datetime64` array,
+        searching the sorted ordinals.
+        """
+        import numpy
+
+        values = dates.astype("datetime64[D]")
+        if convention == constants.UNADJUSTED:
+            return values, numpy.zeros(len(values), dtype=bool)
+
+        ordinals = numpy.frombuffer(self.__ordinals__(), dtype="i").astype("i8")
+        ordinals -= storage.EPOCH
+        days = values.astype("i8")
+        n = len(ordinals)
+        if n == 0:
+            following = preceding = days
+            hasfollowing = hasprevious = numpy.zeros(len(days), dtype=bool)
+        else:
+            i = numpy.searchsorted(ordinals, days, side="left")
+            j = numpy.searchsorted(ordinals, days, side="right") - 1
+            hasfollowing, hasprevious = i < n, j >= 0
+            following = ordinals[numpy.clip(i, 0, n - 1)]
+            preceding = ordinals[numpy.clip(j, 0, n - 1)]
+
+        if convention == constants.FOLLOWING:
+            rolled, valid = following, hasfollowing
+        elif convention == constants.PRECEDING:
+            rolled, valid = preceding, hasprevious
+        else:
+            months = values.astype("datetime64[M]")
+            if convention == constants.MODIFIED_FOLLOWING:
+                same = hasfollowing & (
+                    following.astype("datetime64[D]").astype("datetime64[M]") == months
+                )
+                rolled = numpy.where(same, following, preceding)
+                valid = hasfollowing & (same | hasprevious)
+            else:
+                same = hasprevious & (
+                    preceding.astype("datetime64[D]").astype("datetime64[M]") == months
+                )
+                rolled = numpy.where(same, preceding, following)
+                valid = hasprevious & (same | hasfollowing)
+
+        adjusted = rolled.astype("datetime64[D]")
+        if not valid.all():
+            if default == constants.RAISE:
+                raise KeyError(
+                    f"Out-of-range error: {values[~valid][0]} cannot be rolled {convention} in the calendar"
+                )
+            adjusted[~valid] = default
+        return adjusted, adjusted != values
+
     def snap(self, other, fallback="drop") -> "Calendar":
         """
         Combines this calendar with other, such as:
@@ -1350,11 +2601,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), -1, -1):
-            if self[i].month == date.month and self[i].year == date.year:
-                continue
-            return self[i + 1]
-        return self[i]
+        table = self.periodtable("M")
+        return table.first[table.locate(self.index(date))]
 
     def eom(self, date: datetime.date) -> datetime.date:
         """
@@ -1369,11 +2617,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), len(self)):
-            if self[i].month == date.month and self[i].year == date.year:
-                continue
-            return self[i - 1]
-        return self[i]
+        table = self.periodtable("M")
+        return table.last[table.locate(self.index(date))]
 
     def soq(self, date: datetime.date) -> datetime.date:
         """
@@ -1388,14 +2633,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), -1, -1):
-            if (
-                utils.quarter(self[i]) == utils.quarter(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i + 1]
-        return self[i]
+        table = self.periodtable("Q")
+        return table.first[table.locate(self.index(date))]
 
     def eoq(self, date: datetime.date) -> datetime.date:
         """
@@ -1410,14 +2649,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), len(self)):
-            if (
-                utils.quarter(self[i]) == utils.quarter(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i - 1]
-        return self[i]
+        table = self.periodtable("Q")
+        return table.last[table.locate(self.index(date))]
 
     def sot(self, date: datetime.date) -> datetime.date:
         """
@@ -1432,14 +2665,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), -1, -1):
-            if (
-                utils.trimester(self[i]) == utils.trimester(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i + 1]
-        return self[i]
+        table = self.periodtable("T")
+        return table.first[table.locate(self.index(date))]
 
     def eot(self, date: datetime.date) -> datetime.date:
         """
@@ -1454,14 +2681,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), len(self)):
-            if (
-                utils.trimester(self[i]) == utils.trimester(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i - 1]
-        return self[i]
+        table = self.periodtable("T")
+        return table.last[table.locate(self.index(date))]
 
     def sos(self, date: datetime.date) -> datetime.date:
         """
@@ -1476,14 +2697,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), -1, -1):
-            if (
-                utils.semester(self[i]) == utils.semester(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i + 1]
-        return self[i]
+        table = self.periodtable("H")
+        return table.first[table.locate(self.index(date))]
 
     def eos(self, date: datetime.date) -> datetime.date:
         """
@@ -1498,14 +2713,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), len(self)):
-            if (
-                utils.semester(self[i]) == utils.semester(date)
-                and self[i].year == date.year
-            ):
-                continue
-            return self[i - 1]
-        return self[i]
+        table = self.periodtable("H")
+        return table.last[table.locate(self.index(date))]
 
     def soy(self, date: datetime.date) -> datetime.date:
         """
@@ -1520,11 +2729,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), -1, -1):
-            if self[i].year == date.year:
-                continue
-            return self[i + 1]
-        return self[i]
+        table = self.periodtable("Y")
+        return table.first[table.locate(self.index(date))]
 
     def eoy(self, date: datetime.date) -> datetime.date:
         """
@@ -1539,11 +2745,8 @@ class Calendar:
         -------
         datetime.date
         """
-        for i in range(self.index(date), len(self)):
-            if self[i].year == date.year:
-                continue
-            return self[i - 1]
-        return self[i]
+        table = self.periodtable("Y")
+        return table.last[table.locate(self.index(date))]
 
     def pipe(self, callable):
         """
@@ -1558,6 +2761,40 @@ class Calendar:
         return callable(self)
 
 
+def mapped(func, onerror, calendars) -> list:
+    """
+    Applies the function to each calendar, with the onerror policy of
+    :code:`Collection.apply`.
+    """
+    values = []
+    for calendar in calendars:
+        try:
+            values.append(func(calendar))
+        except Exception as e:
+            if onerror == constants.RAISE:
+                raise e
+            elif onerror == "skip" or onerror == "drop":
+                pass
+            elif onerror == "first":
+                values.append(calendar[0])
+            elif onerror == "last":
+                values.append(calendar[-1])
+            elif callable(onerror):
+                values.append(onerror(calendar))
+            else:
+                raise ValueError(
+                    "Expected onerror to be one of 'raise', 'first', 'last' or callable"
+                )
+    return values
+
+
+def selected(func, calendars) -> list:
+    """
+    Returns whether the function returns a truthy value for each calendar.
+    """
+    return [bool(func(calendar)) for calendar in calendars]
+
+
 class Collection:
     """
     Collection of calendars.
@@ -1593,6 +2830,11 @@ class Collection:
         <doubledate.Calendar>
     """
 
+    __slots__ = ("calendars",)
+
+    # collections with fewer calendars are processed sequentially
+    parallelthreshold = 64
+
     def __init__(self, calendars):
         """
         Parameters
@@ -1604,6 +2846,44 @@ class Collection:
             raise TypeError("Expected a list of calendar objects")
         self.calendars = list(calendars)
 
+    def __getstate__(self):
+        """
+        Returns the calendars as a single buffer of delta-encoded ordinals (the
+        "parent" calendar) and the length of each calendar.
+
+        This is only possible if each calendar starts after the end of the
+        previous one (as is the case for collections obtained by resampling a
+        calendar); otherwise the list of calendars is returned.
+        """
+        try:
+            ordinals = [storage.toordinals(c.__dates__) for c in self.calendars]
+        except TypeError:
+            return self.calendars
+
+        parent = array.array("i")
+        for values in ordinals:
+            if len(values) and len(parent) and values[0] <= parent[-1]:
+                return self.calendars
+            parent.extend(values)
+        return storage.encode(parent), [len(values) for values in ordinals]
+
+    def __setstate__(self, state):
+        """
+        Restores the collection from the state returned by :code:`__getstate__`.
+
+        Calendars restored from a parent buffer share its storage.
+        """
+        if isinstance(state, tuple):
+            buffer, lengths = state
+            parent, offset, calendars = memoryview(storage.decode(buffer)), 0, []
+            for length in lengths:
+                calendars.append(
+                    Calendar._fromordinals(parent[offset : offset + length])
+                )
+                offset += length
+            state = calendars
+        self.calendars = list(state)
+
     def first(self, onerror=constants.RAISE) -> Calendar:
         """
         Returns a calendar with the first date each period in the collection.
@@ -1733,36 +3013,61 @@ class Collection:
             f"Expected value to be datetime.date or Calendar, received {type(value).__name__}"
         )
 
-    def apply(self, func, onerror=constants.RAISE) -> "Collection":
+    def apply(
+        self,
+        func,
+        onerror=constants.RAISE,
+        *,
+        executor=None,
+        workers=None,
+        chunksize=None,
+    ) -> "Collection":
         """
         Applies a function to each calendar.
 
+        Parameters
+        ----------
+        func : callable
+            function receiving each calendar and returning a date, a list of
+            dates or a Calendar
+        onerror : str, callable
+            the policy for calendars on which the function raises, one of
+            'raise', 'skip' (or 'drop'), 'first', 'last' or a callable
+            receiving the calendar
+        executor : concurrent.futures.Executor, optional
+            executor on which to run the function, in chunks of calendars
+        workers : int, optional
+            number of processes on which to run the function, in chunks of
+            calendars (a process pool is created for the call)
+        chunksize : int, optional
+            number of calendars per chunk; by default, the calendars are split
+            in about 4 chunks per worker
+
         Returns
         -------
         Collection
+
+        Note
+        ----
+        With an executor or several workers, the calendars are sent to the
+        workers in chunks (in the compact serialized form of collections), and
+        the function (and the onerror callable) must be picklable, e.g. defined
+        at the top level of a module. The order of the results, and the onerror
+        policy, are the same as for the sequential execution, to which
+        collections of fewer than :code:`Collection.parallelthreshold`
+        calendars fall back.
+
+        Example
+        -------
+        >>> calendar.resample("M").apply(solve, workers=8)
+        <doubledate.Collection at 0x7fd0fa52c2e0>
         """
         if not callable(func):
             raise ValueError("Expected func to be a callable function")
 
-        dates = []
-        for calendar in self.calendars:
-            try:
-                dates.append(func(calendar))
-            except Exception as e:
-                if onerror == constants.RAISE:
-                    raise e
-                elif onerror == "skip" or onerror == "drop":
-                    pass
-                elif onerror == "first":
-                    dates.append(calendar[0])
-                elif onerror == "last":
-                    dates.append(calendar[-1])
-                elif callable(onerror):
-                    dates.append(onerror(calendar))
-                else:
-                    raise ValueError(
-                        "Expected onerror to be one of 'raise', 'first', 'last' or callable"
-                    )
+        dates = self.__dispatch__(
+            functools.partial(mapped, func, onerror), executor, workers, chunksize
+        )
 
         for i, value in enumerate(dates):
             if isinstance(value, datetime.date):
@@ -1778,6 +3083,37 @@ class Collection:
 
         return Collection(dates)
 
+    def __dispatch__(self, task, executor, workers, chunksize) -> list:
+        """
+        Runs the task (receiving a sequence of calendars and returning a list)
+        on the calendars, sequentially or in chunks on an executor, and returns
+        the concatenated results.
+        """
+        if executor is not None and workers is not None:
+            raise ValueError("Expected one of executor or workers")
+
+        calendars = self.calendars
+        if (executor is None and (workers is None or workers <= 1)) or len(
+            calendars
+        ) < self.parallelthreshold:
+            return task(calendars)
+
+        if chunksize is None:
+            chunksize = math.ceil(
+                len(calendars) / (4 * (workers or os.cpu_count() or 1))
+            )
+        chunks = [
+            Collection(calendars[i : i + chunksize])
+            for i in range(0, len(calendars), chunksize)
+        ]
+
+        if executor is None:
+            import concurrent.futures
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                return [value for chunk in pool.map(task, chunks) for value in chunk]
+        return [value for chunk in executor.map(task, chunks) for value in chunk]
+
     def combine(self) -> Calendar:
         """
         Combines the calendars of the collection back into a single Calendar object.
@@ -1788,7 +3124,9 @@ class Collection:
         """
         return Calendar([]).union(*self.calendars)
 
-    def filter(self, func) -> "Collection":
+    def filter(
+        self, func, *, executor=None, workers=None, chunksize=None
+    ) -> "Collection":
         """
         Filters out calendars from the collection.
 
@@ -1796,6 +3134,13 @@ class Collection:
         ----------
         func : callable
             filtering function
+        executor : concurrent.futures.Executor, optional
+            executor on which to run the function (see :code:`Collection.apply`)
+        workers : int, optional
+            number of processes on which to run the function (see
+            :code:`Collection.apply`)
+        chunksize : int, optional
+            number of calendars per chunk (see :code:`Collection.apply`)
 
         Returns
         -------
@@ -1803,7 +3148,12 @@ class Collection:
         """
         if not callable(func):
             raise ValueError("Expected func to be a callable function")
-        return Collection([cal for cal in self.calendars if func(cal)])
+        keep = self.__dispatch__(
+            functools.partial(selected, func), executor, workers, chunksize
+        )
+        return Collection(
+            [calendar for calendar, kept in zip(self.calendars, keep) if kept]
+        )
 
     def __len__(self):
         """
@@ -1820,3 +3170,126 @@ class Collection:
         Iterate over each calendar in the collection.
         """
         return iter(self.calendars)
+
+
+class LazyCollection(Collection):
+    """
+    Collection of the consecutive periods of a calendar, which only holds the
+    boundaries of the periods.
+
+    The calendar of each period is only created when it is accessed (by index
+    or iteration); :code:`len`, :code:`first`, :code:`last`, :code:`nth` (with
+    an integer index), :code:`combine`, :code:`index` and :code:`in` (with a
+    date) are answered from the boundaries, without creating any of them.
+
+    Lazy collections are returned by :code:`Calendar.groupby` (and
+    :code:`Calendar.resample`) with a frequency, and can be used wherever a
+    :code:`Collection` is expected.
+
+    Parameters
+    ----------
+    parent : Calendar
+        the calendar of which the periods are slices
+    starts : sequence of int
+        the position of the first date of each period in the parent calendar
+    counts : sequence of int
+        the number of dates in each period
+    memoize : bool
+        whether to keep the calendars once created, so that repeated accesses
+        return the same objects (default is False)
+    """
+
+    __slots__ = ("_calendars", "counts", "memoize", "parent", "starts")
+
+    def __init__(self, parent: Calendar, starts, counts, *, memoize: bool = False):
+        self.parent, self.starts, self.counts = parent, starts, counts
+        self.memoize = memoize
+        self._calendars = [None] * len(starts) if memoize else None
+
+    def __reduce__(self):
+        return (
+            functools.partial(LazyCollection, memoize=self.memoize),
+            (self.parent, self.starts, self.counts),
+        )
+
+    @property
+    def calendars(self) -> list:
+        """
+        Returns the list of the calendars (creating all of them).
+        """
+        return [self.__period__(i) for i in range(len(self.starts))]
+
+    def __period__(self, i: int) -> Calendar:
+        """
+        Returns the calendar of the i'th period.
+        """
+        if self._calendars is not None and self._calendars[i] is not None:
+            return self._calendars[i]
+        start = self.starts[i]
+        calendar = self.parent[start : start + self.counts[i]]
+        if self._calendars is not None:
+            self._calendars[i] = calendar
+        return calendar
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return (self.__period__(i) for i in range(len(self.starts)))
+
+    def __getitem__(self, value) -> Calendar:
+        if isinstance(value, slice):
+            return [self.__period__(i) for i in range(*value.indices(len(self)))]
+        return self.__period__(range(len(self.starts))[value])
+
+    def first(self, onerror=constants.RAISE) -> Calendar:
+        # periods are never empty
+        return self.parent[list(self.starts)]
+
+    def last(self, onerror=constants.RAISE) -> Calendar:
+        return self.parent[
+            [start + count - 1 for start, count in zip(self.starts, self.counts)]
+        ]
+
+    def nth(self, index, *, base=0, onerror=constants.RAISE) -> Calendar:
+        if not isinstance(index, numbers.Integral) or not (
+            onerror in (constants.RAISE, "skip", "drop", "first", "last")
+        ):
+            return super().nth(index, base=base, onerror=onerror)
+
+        index, positions = index - base, []
+        for start, count in zip(self.starts, self.counts):
+            if -count <= index < count:
+                positions.append(start + index % count)
+            elif onerror == constants.RAISE:
+                raise IndexError(
+                    f"Index {index} is out of range in a period of {count} dates"
+                )
+            elif onerror == "first":
+                positions.append(start)
+            elif onerror == "last":
+                positions.append(start + count - 1)
+        return self.parent[positions]
+
+    def combine(self) -> Calendar:
+        if sum(self.counts) == len(self.parent):
+            return self.parent
+        return super().combine()
+
+    def index(self, value) -> int:
+        if isinstance(value, datetime.date):
+            position = self.parent.index(value, default=-1)
+            i = bisect.bisect_right(self.starts, position) - 1
+            if position < 0 or i < 0 or position >= self.starts[i] + self.counts[i]:
+                raise IndexError(f"{value} is not in any of the calendars")
+            return i
+        return super().index(value)
+
+    def __contains__(self, value) -> bool:
+        if isinstance(value, datetime.date):
+            try:
+                self.index(value)
+            except IndexError:
+                return False
+            return True
+        return super().__contains__(value)
@@ -177,3 +177,46 @@ MONTHS = {
     "NOV": 11,
     "DEC": 12,
 }
+
+# business-day roll conventions
+UNADJUSTED = "unadjusted"
+FOLLOWING = "following"
+MODIFIED_FOLLOWING = "modified_following"
+PRECEDING = "preceding"
+MODIFIED_PRECEDING = "modified_preceding"
+
+CONVENTIONS = {
+    UNADJUSTED: UNADJUSTED,
+    FOLLOWING: FOLLOWING,
+    MODIFIED_FOLLOWING: MODIFIED_FOLLOWING,
+    PRECEDING: PRECEDING,
+    MODIFIED_PRECEDING: MODIFIED_PRECEDING,
+    "U": UNADJUSTED,
+    "F": FOLLOWING,
+    "MF": MODIFIED_FOLLOWING,
+    "P": PRECEDING,
+    "MP": MODIFIED_PRECEDING,
+}
+
+# day-count conventions
+ACT360 = "ACT/360"
+ACT365F = "ACT/365F"
+ACTACT = "ACT/ACT"
+THIRTY360 = "30/360"
+THIRTY360US = "30/360 US"
+THIRTYE360 = "30E/360"
+BUS252 = "BUS/252"
+
+DAYCOUNTS = {
+    ACT360: ACT360,
+    ACT365F: ACT365F,
+    ACTACT: ACTACT,
+    THIRTY360: THIRTY360,
+    THIRTY360US: THIRTY360US,
+    THIRTYE360: THIRTYE360,
+    BUS252: BUS252,
+    "ACT/365": ACT365F,
+    "ACT/ACT ISDA": ACTACT,
+    "30/360 BOND": THIRTY360,
+    "30E/360 EUROBOND": THIRTYE360,
+}
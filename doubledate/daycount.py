@@ -0,0 +1,253 @@
+"""
+Day-count fractions (e.g. for accruals) between start and end dates.
+
+Supported conventions (see :code:`doubledate.constants.DAYCOUNTS`):
+
+- :code:`ACT/360`: actual number of days over 360
+- :code:`ACT/365F` (or :code:`ACT/365`): actual number of days over 365
+- :code:`ACT/ACT` (or :code:`ACT/ACT ISDA`): actual number of days in each
+  calendar year over the number of days in that year (365 or 366)
+- :code:`30/360` (or :code:`30/360 BOND`): bond basis, i.e. 31st of the month
+  treated as the 30th, the end date only if the start date is the 30th or 31st
+- :code:`30/360 US`: as :code:`30/360`, the last day of February being treated
+  as the 30th (the end date only if the start date is also the last day of
+  February)
+- :code:`30E/360` (or :code:`30E/360 EUROBOND`): 31st of the month treated as
+  the 30th
+- :code:`BUS/252`: number of business days of the calendar from the start date
+  (included) to the end date (excluded) over 252
+
+Fractions are negative when the end date is before the start date.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> dtwo.daycount.fraction(dtwo.date(2024, 1, 15), dtwo.date(2024, 7, 15), "ACT/360")
+    0.5055555555555555
+
+    # vectorized, with business days
+    >>> dtwo.daycount.fraction(starts, ends, "BUS/252", calendar=businessdays)
+    array([0.5, 0.49603175, ...])
+"""
+
+import datetime
+import itertools
+
+from doubledate import constants, storage, utils
+
+DENOMINATORS = {
+    constants.ACT360: 360,
+    constants.ACT365F: 365,
+    constants.BUS252: 252,
+}
+
+
+def fraction(start, end, convention: str = constants.ACT360, *, calendar=None):
+    """
+    Returns the day-count fraction between the start and end dates.
+
+    Parameters
+    ----------
+    start : datetime.date, iterable
+        the start date, or an iterable (or NumPy :code:`datetime64` array) of
+        start dates
+    end : datetime.date, iterable
+        the end date, or an iterable (or NumPy :code:`datetime64` array) of end
+        dates
+    convention : str
+        the day-count convention (default is :code:`ACT/360`)
+    calendar : Calendar, optional
+        the calendar of business days, required by :code:`BUS/252`
+
+    Returns
+    -------
+    float
+        or a list of floats (NumPy array) if passed iterables (NumPy arrays) of
+        dates; a single date is paired with each of the other dates
+
+    Raises
+    ------
+    ValueError
+        if the convention is not supported, or if :code:`BUS/252` is used
+        without calendar
+    TypeError
+        if :code:`BUS/252` is used with a calendar of datetimes
+
+    Note
+    ----
+    :code:`BUS/252` looks the dates up in the calendar's cumulative business-day
+    rank, which is computed once per calendar and cached, so that each fraction
+    is obtained in constant time.
+    """
+    if convention not in constants.DAYCOUNTS:
+        raise ValueError(
+            f"Expected convention to be one of {', '.join(constants.DAYCOUNTS)}, received {convention}"
+        )
+    convention = constants.DAYCOUNTS[convention]
+    if convention == constants.BUS252 and calendar is None:
+        raise ValueError(f"Expected a calendar with the {convention} convention")
+
+    if any(
+        hasattr(value, "dtype") and value.dtype.kind == "M" for value in (start, end)
+    ):
+        return vectorized(start, end, convention, calendar)
+
+    rank = None
+    if convention == constants.BUS252:
+        rank = ranker(*calendar.__rank__())
+
+    if isinstance(start, datetime.date) and isinstance(end, datetime.date):
+        return yearfraction(start, end, convention, rank)
+
+    starts = itertools.repeat(start) if isinstance(start, datetime.date) else start
+    ends = itertools.repeat(end) if isinstance(end, datetime.date) else end
+    return [
+        yearfraction(start, end, convention, rank) for start, end in zip(starts, ends)
+    ]
+
+
+def ranker(first, ranks):
+    """
+    Returns the function returning the number of dates of the calendar before
+    the ordinal, given the calendar's cumulative rank.
+    """
+    total = ranks[-1] + 1 if ranks else 0
+
+    def rank(ordinal: int) -> int:
+        if first is None or ordinal <= first:
+            return 0
+        if ordinal - first >= len(ranks):
+            return total
+        return ranks[ordinal - first]
+
+    return rank
+
+
+def yearfraction(start, end, convention: str, rank=None) -> float:
+    """
+    Returns the day-count fraction between two dates.
+    """
+    if convention == constants.BUS252:
+        return (rank(end.toordinal()) - rank(start.toordinal())) / 252
+    if convention in DENOMINATORS:
+        return (end.toordinal() - start.toordinal()) / DENOMINATORS[convention]
+    if convention == constants.ACTACT:
+        if end < start:
+            return -yearfraction(end, start, convention)
+        if start.year == end.year:
+            return (end.toordinal() - start.toordinal()) / (
+                366 if utils.isleap(start.year) else 365
+            )
+        return (
+            (datetime.date(start.year + 1, 1, 1).toordinal() - start.toordinal())
+            / (366 if utils.isleap(start.year) else 365)
+            + (end.year - start.year - 1)
+            + (end.toordinal() - datetime.date(end.year, 1, 1).toordinal())
+            / (366 if utils.isleap(end.year) else 365)
+        )
+
+    d1, d2 = start.day, end.day
+    if convention == constants.THIRTYE360:
+        d1, d2 = min(d1, 30), min(d2, 30)
+    else:
+        if convention == constants.THIRTY360US and lastoffebruary(start):
+            if lastoffebruary(end):
+                d2 = 30
+            d1 = 30
+        if d2 == 31 and d1 >= 30:
+            d2 = 30
+        d1 = min(d1, 30)
+    return (
+        360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)
+    ) / 360
+
+
+def vectorized(start, end, convention: str, calendar=None):
+    """
+    Returns the day-count fractions between NumPy :code:`datetime64` arrays of
+    dates.
+    """
+    import numpy
+
+    start, end = numpy.broadcast_arrays(
+        numpy.asarray(start, dtype="datetime64[D]"),
+        numpy.asarray(end, dtype="datetime64[D]"),
+    )
+
+    if convention == constants.BUS252:
+        first, ranks = calendar.__rank__()
+        ranks = numpy.frombuffer(ranks, dtype="i")
+        if first is None:
+            return numpy.zeros(start.shape)
+
+        def rank(values):
+            offsets = values.astype("i8") + storage.EPOCH - first
+            return numpy.where(
+                offsets <= 0,
+                0,
+                numpy.where(
+                    offsets >= len(ranks),
+                    ranks[-1] + 1,
+                    ranks[numpy.clip(offsets, 0, len(ranks) - 1)],
+                ),
+            )
+
+        return (rank(end) - rank(start)) / 252
+
+    if convention in DENOMINATORS:
+        return (end - start).astype("i8") / DENOMINATORS[convention]
+
+    if convention == constants.ACTACT:
+        sign = numpy.where(end < start, -1, 1)
+        start, end = numpy.minimum(start, end), numpy.maximum(start, end)
+        y1, y2 = start.astype("datetime64[Y]"), end.astype("datetime64[Y]")
+        n1 = ((y1 + 1).astype("datetime64[D]") - y1).astype("i8")
+        n2 = ((y2 + 1).astype("datetime64[D]") - y2).astype("i8")
+        same = (end - start).astype("i8") / n1
+        different = (
+            ((y1 + 1).astype("datetime64[D]") - start).astype("i8") / n1
+            + (y2 - y1).astype("i8")
+            - 1
+            + (end - y2.astype("datetime64[D]")).astype("i8") / n2
+        )
+        return sign * numpy.where(y1 == y2, same, different)
+
+    (y1, m1, d1), (y2, m2, d2) = components(start), components(end)
+    if convention == constants.THIRTYE360:
+        d1, d2 = numpy.minimum(d1, 30), numpy.minimum(d2, 30)
+    else:
+        if convention == constants.THIRTY360US:
+            february = lastoffebruary(start)
+            d2 = numpy.where(february & lastoffebruary(end), 30, d2)
+            d1 = numpy.where(february, 30, d1)
+        d2 = numpy.where((d2 == 31) & (d1 >= 30), 30, d2)
+        d1 = numpy.minimum(d1, 30)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360
+
+
+def components(dates) -> tuple:
+    """
+    Returns the years, months and days of a NumPy :code:`datetime64[D]` array.
+    """
+    years, months = dates.astype("datetime64[Y]"), dates.astype("datetime64[M]")
+    return (
+        years.astype("i8") + 1970,
+        (months - years).astype("i8") + 1,
+        (dates - months).astype("i8") + 1,
+    )
+
+
+def lastoffebruary(date):
+    """
+    Returns whether the date (or each date of a NumPy array) is the last day of
+    February.
+    """
+    if isinstance(date, datetime.date):
+        return date.month == 2 and (date + datetime.timedelta(1)).month == 3
+    months = date.astype("datetime64[M]")
+    return ((months - date.astype("datetime64[Y]")).astype("i8") == 1) & (
+        (date + 1).astype("datetime64[M]") != months
+    )
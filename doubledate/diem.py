@@ -1,4 +1,9 @@
+import calendar
+import collections.abc
+import copyreg
 import datetime
+import functools
+import operator
 import re
 
 from . import constants
@@ -18,6 +23,15 @@ DAYCOUNTBYMONTH = {
     12: 31,
 }
 
+MONTHNAMES = "JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC"
+
+# compiled once, see diem.parse
+ISOPATTERN = re.compile(r"(?:--)(\d{1,2})-(\d{1,2})")
+MONTHPATTERN = re.compile(rf"({MONTHNAMES})-?(\d{{1,2}})", re.IGNORECASE)
+
+# intern table, mapping (class, month, day, fold) to the unique instance
+INTERNED = {}
+
 
 class diem:
     """
@@ -36,29 +50,74 @@ class diem:
     ----
     The fold argument determines how to resolve 29 February
     for years which are not leap years
+
+    Note
+    ----
+    diems are immutable and hashable; instances are interned, so that
+    :code:`diem(6, 17) is diem(6, 17)`
     """
 
-    def __init__(self, month, day, *, fold="back"):
+    __slots__ = ("day", "fold", "month")
+
+    def __new__(cls, month, day, *, fold="back"):
+        if type(month) is int and type(day) is int:
+            try:
+                return INTERNED[(cls, month, day, fold)]
+            except (KeyError, TypeError):
+                pass
+
         if not isinstance(month, int):
             raise TypeError("Expected month to be an integer")
 
         if month < 1 or month > 12:
             raise ValueError("month must be in 1..12")
 
-        self.month = month
-
         if not isinstance(day, int):
             raise TypeError("Expected day to be an integer")
 
         if day < 1 or day > DAYCOUNTBYMONTH[month]:
             raise ValueError(f"day must be in 1..{DAYCOUNTBYMONTH[month]}")
 
-        self.day = day
-
         if fold not in ("forward", "back"):
             raise ValueError(f"fold must be one of 'back' or 'forward', '{fold}' given")
 
-        self.fold = fold
+        self = super().__new__(cls)
+        object.__setattr__(self, "month", month)
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "fold", fold)
+
+        # only intern exact integers, so that e.g. diem(True, 1) does not
+        # shadow diem(1, 1)
+        if type(month) is int and type(day) is int:
+            self = INTERNED.setdefault((cls, month, day, fold), self)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        """
+        Return the arguments to re-create (and re-intern) the diem when unpickling.
+        """
+        return (
+            copyreg.__newobj_ex__,
+            (type(self), (self.month, self.day), {"fold": self.fold}),
+        )
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self) -> int:
+        """
+        Return hash(self).
+        """
+        return hash((self.month, self.day, self.fold))
 
     def resolve(self, year, *, fold=None, dtype=datetime.date) -> datetime.date:
         """
@@ -66,8 +125,8 @@ class diem:
 
         Parameters
         ----------
-        year : int
-            the year of the date
+        year : int, iterable
+            the year of the date, or an iterable (or NumPy array) of years
         fold : 'back', 'forward', None (default)
             how to treat 29 Feb
         dtype : type
@@ -75,8 +134,10 @@ class diem:
 
         Returns
         -------
-        date
-            an instance of the dtype with the (year, month, day)
+        date, list
+            an instance of the dtype with the (year, month, day), or a list
+            thereof if given an iterable of years (a NumPy :code:`datetime64[D]`
+            array if given a NumPy array of years)
 
         Note
         ----
@@ -98,27 +159,93 @@ class diem:
 
         >>> diem(2, 29, fold="forward").resolve(2021, fold="back") # override default fold
         datetime.date(2021, 2, 28)
+
+        >>> diem(2, 29).resolve(range(2020, 2023))
+        [datetime.date(2020, 2, 29), datetime.date(2021, 2, 28), datetime.date(2022, 2, 28)]
         """
-        try:
+        if fold not in ("back", "forward", None):
+            raise ValueError(
+                f"Expected fold to be one of 'back', 'forward' or None, received {fold}"
+            )
+
+        fold = self.fold if fold is None else fold
+
+        if hasattr(year, "dtype"):
+            return self.__resolvearray__(year, fold)
+
+        if isinstance(year, collections.abc.Iterable) and not isinstance(year, str):
+            if (self.month, self.day) != (2, 29):
+                return [dtype(y, self.month, self.day) for y in year]
+            return [
+                dtype(y, 2, 29)
+                if calendar.isleap(y)
+                else dtype(y, 2, 28)
+                if fold == "back"
+                else dtype(y, 3, 1)
+                for y in map(operator.index, year)
+            ]
+
+        if (self.month, self.day) != (2, 29):
             return dtype(year, self.month, self.day)
 
-        except ValueError:
-            if not isinstance(year, int):
-                raise TypeError(f"Expected year to be an integer, received {year}")
+        try:
+            year = operator.index(year)
+        except TypeError:
+            raise TypeError(
+                f"Expected year to be an integer, received {year}"
+            ) from None
 
-            if fold not in ("back", "forward", None):
-                raise ValueError(
-                    f"Expected fold to be one of 'back', 'forward' or None, received {fold}"
-                )
+        if calendar.isleap(year):
+            return dtype(year, 2, 29)
 
-            if fold is None:
-                fold = self.fold
+        if fold == "back":
+            return dtype(year, 2, 28)
+        return dtype(year, 3, 1)
 
-            if fold == "back":
-                return dtype(year, 2, 28)
+    def __resolvearray__(self, years, fold: str):
+        """
+        Vectorized :code:`diem.resolve` of a NumPy array of years, returning a
+        :code:`datetime64[D]` array.
+        """
+        import numpy
+
+        years = numpy.asarray(years)
+        if years.dtype.kind not in "iu":
+            raise TypeError(
+                f"Expected years to be integers, received an array of {years.dtype}"
+            )
+        months = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (
+            self.month - 1
+        )
+        dates = months.astype("datetime64[D]") + (self.day - 1)
+        if (self.month, self.day) == (2, 29) and fold == "back":
+            # 1 March in non-leap years
+            dates = numpy.where(
+                dates.astype("datetime64[M]") != months, dates - 1, dates
+            )
+        return dates
 
-            elif fold == "forward":
-                return dtype(year, 3, 1)
+    def __shiftarray__(self, dates, side: str):
+        """
+        Vectorized :code:`diem.lb` (side 'left') and :code:`diem.fa` (side
+        'right') of a NumPy :code:`datetime64` array, comparing the (month, day)
+        of the dates to the diem's to select the year to resolve.
+        """
+        import numpy
+
+        days = dates.astype("datetime64[D]")
+        years, months = days.astype("datetime64[Y]"), days.astype("datetime64[M]")
+        keys = (
+            ((months - years).astype("i8") + 1) * 100 + (days - months).astype("i8") + 1
+        )
+        key, years = self.month * 100 + self.day, years.astype("i8") + 1970
+        if side == "left":
+            return self.__resolvearray__(
+                numpy.where(key < keys, years, years - 1), self.fold
+            )
+        return self.__resolvearray__(
+            numpy.where(key > keys, years, years + 1), self.fold
+        )
 
     def __str__(self) -> str:
         """
@@ -216,40 +343,17 @@ class diem:
 
         >>> diem.parse(datetime.datetime(2020,4,28))
         doubledate.diem(4, 28)
+
+        Note
+        ----
+        Parsed strings are cached (LRU), so that repeatedly parsing
+        the same string does not re-run the regular expressions.
         """
         if isinstance(value, (datetime.date, datetime.datetime)):
             return diem(value.month, value.day)
 
-        if value in constants.MONTHS:
-            return diem(
-                constants.MONTHS[value], DAYCOUNTBYMONTH[constants.MONTHS[value]]
-            )
-
         if isinstance(value, str):
-            if re.search(r"(?:--)\d{1,2}-\d{1,2}", value):
-                month, day = re.search(r"(?:--)(\d{1,2})-(\d{1,2})", value).groups()
-                return diem(int(month), int(day))
-
-            if re.search(
-                r"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)-?(\d{1,2})",
-                value,
-                re.IGNORECASE,
-            ):
-                match = re.search(
-                    r"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)-?(\d{1,2})",
-                    value,
-                    re.IGNORECASE,
-                ).groups()
-
-                month, day = (
-                    r"JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC".split("|").index(
-                        match[0].upper()
-                    )
-                    + 1,
-                    int(match[1]),
-                )
-
-                return diem(month, day)
+            return parse(value)
 
         raise ValueError(f"Could not parse '{value}' ({type(value).__name__})")
 
@@ -259,11 +363,14 @@ class diem:
 
         Parameters
         ---------
-        date : datetime.date
+        date : datetime.date, iterable
+            the reference date, or an iterable (or NumPy :code:`datetime64`
+            array) of reference dates
 
         Returns
         -------
-        datetime.date
+        datetime.date, list
+            or a NumPy :code:`datetime64[D]` array if given a NumPy array
 
         Examples
         --------
@@ -273,6 +380,16 @@ class diem:
         >>> diem(3, 31).lb(datetime.date(2020, 6, 1))
         datetime.date(2020, 3, 31)
         """
+        if hasattr(date, "dtype") and date.dtype.kind == "M":
+            return self.__shiftarray__(date, "left")
+        if isinstance(date, collections.abc.Iterable):
+            key = (self.month, self.day)
+            return [
+                self.resolve(
+                    d.year if key < (d.month, d.day) else d.year - 1, dtype=type(d)
+                )
+                for d in date
+            ]
         if (self.month, self.day) < (date.month, date.day):
             return self.resolve(date.year, dtype=type(date))
         return self.resolve(date.year - 1, dtype=type(date))
@@ -283,11 +400,14 @@ class diem:
 
         Parameters
         ---------
-        date : datetime.date
+        date : datetime.date, iterable
+            the reference date, or an iterable (or NumPy :code:`datetime64`
+            array) of reference dates
 
         Returns
         -------
-        datetime.date
+        datetime.date, list
+            or a NumPy :code:`datetime64[D]` array if given a NumPy array
 
         Examples
         --------
@@ -302,6 +422,16 @@ class diem:
         If the diem is `29 Feb`, the `diem.fa` will resolve based
         on the fold attribute (e.g. back to 28 Feb or forward to 29 Feb)
         """
+        if hasattr(date, "dtype") and date.dtype.kind == "M":
+            return self.__shiftarray__(date, "right")
+        if isinstance(date, collections.abc.Iterable):
+            key = (self.month, self.day)
+            return [
+                self.resolve(
+                    d.year if key > (d.month, d.day) else d.year + 1, dtype=type(d)
+                )
+                for d in date
+            ]
         if (self.month, self.day) > (date.month, date.day):
             return self.resolve(date.year, dtype=type(date))
         return self.resolve(date.year + 1, dtype=type(date))
@@ -312,8 +442,10 @@ class diem:
 
         Parameters
         ----------
-        date: datetime.date
-            the date from which to compute the target date
+        date: datetime.date, iterable
+            the date from which to compute the target date, or an iterable
+            (or NumPy :code:`datetime64` array) of dates, in which case a list
+            (or a NumPy :code:`datetime64[D]` array) is returned
         side : 'left', 'right'
             whether to resolve to the most recent (left) or the first date after (right)
             the given date
@@ -323,6 +455,24 @@ class diem:
         >>> diem(3, 31).asof(datetime.date(2020, 2, 28))
         datetime.date(2019, 3, 31)
         """
+        if side not in ("left", "right"):
+            raise ValueError(f"side should be one of 'left' or 'right', {side} given")
+        if hasattr(date, "dtype") and date.dtype.kind == "M":
+            import numpy
+
+            days = date.astype("datetime64[D]")
+            months = days.astype("datetime64[M]")
+            same = (
+                (months - days.astype("datetime64[Y]")).astype("i8") + 1 == self.month
+            ) & ((days - months).astype("i8") + 1 == self.day)
+            return numpy.where(same, days, self.__shiftarray__(days, side))
+        if isinstance(date, collections.abc.Iterable):
+            date = list(date)
+            shifted = self.lb(date) if side == "left" else self.fa(date)
+            return [
+                d if (d.month, d.day) == (self.month, self.day) else other
+                for d, other in zip(date, shifted)
+            ]
         if (date.month, date.day) == (self.month, self.day):
             return date
         if side == "left":
@@ -345,3 +495,24 @@ class diem:
             how to treat 29 Feb
         """
         return diem(month or self.month, day or self.day, fold=fold or self.fold)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse(value: str) -> diem:
+    """
+    Parse a string as a diem (cached, see :code:`diem.parse`).
+    """
+    if value in constants.MONTHS:
+        return diem(constants.MONTHS[value], DAYCOUNTBYMONTH[constants.MONTHS[value]])
+
+    match = ISOPATTERN.search(value)
+    if match:
+        return diem(int(match.group(1)), int(match.group(2)))
+
+    match = MONTHPATTERN.search(value)
+    if match:
+        return diem(
+            MONTHNAMES.split("|").index(match.group(1).upper()) + 1, int(match.group(2))
+        )
+
+    raise ValueError(f"Could not parse '{value}' ({type(value).__name__})")
@@ -0,0 +1,427 @@
+"""
+Lazily evaluated calendar algebra.
+
+Set operations, date-range slices and filters on an expression (see
+:code:`Calendar.lazy`) build an expression tree rather than new calendars. When
+the result is requested, the tree is optimized and evaluated in a single pass:
+
+- date-range slices are pushed down to the calendars, which are only iterated
+  within the range
+- consecutive filters are fused into a single predicate, and nested unions and
+  intersections are flattened
+- intersections are driven by their smallest operand, the other operands being
+  probed (by binary search) in increasing order of size
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> expression = (
+    ...     a.lazy()
+    ...     .union(b)
+    ...     .difference(c)
+    ...     .intersection(d)[dtwo.date(2024, 1, 1) : dtwo.date(2024, 12, 31)]
+    ...     .weekdays()
+    ... )
+    >>> expression.collect()
+    <doubledate.calendar.Calendar at 0x17045b0f430>
+"""
+
+import datetime
+import heapq
+import itertools
+
+from doubledate import storage
+from doubledate.calendar import Calendar
+
+
+class Expression:
+    """
+    Lazily evaluated calendar expression.
+
+    Expressions are created with :code:`Calendar.lazy` and combined with the
+    methods below, which return new expressions; they are evaluated by
+    :code:`collect` (or by iterating over them).
+    """
+
+    __slots__ = ()
+
+    def union(self, *others) -> "Expression":
+        """
+        Returns the expression of the dates in self or in any of the others.
+        """
+        return Union([self, *map(expression, others)])
+
+    def difference(self, *others) -> "Expression":
+        """
+        Returns the expression of the dates in self and not in any of the others.
+        """
+        return Difference(self, [expression(other) for other in others])
+
+    def intersection(self, *others) -> "Expression":
+        """
+        Returns the expression of the dates in self and in all the others.
+        """
+        return Intersection([self, *map(expression, others)])
+
+    def filter(self, func) -> "Expression":
+        """
+        Returns the expression of the dates for which :code:`func(date)` is True.
+        """
+        if callable(func):
+            return Filter(self, [func])
+        raise ValueError("Expected func to be a callable function")
+
+    def weekdays(self) -> "Expression":
+        """
+        Returns the expression of the dates which are weekdays (Mon, ..., Fri).
+        """
+        return self.filter(lambda date: date.weekday() < 5)
+
+    def weekends(self) -> "Expression":
+        """
+        Returns the expression of the dates which are weekends (Sat, Sun).
+        """
+        return self.filter(lambda date: date.weekday() >= 5)
+
+    def __getitem__(self, value) -> "Expression":
+        """
+        Returns the expression of the dates within the date range (both bounds
+        included, either of which can be None).
+
+        Raises
+        ------
+        TypeError
+            if value is not a slice of dates
+        """
+        if (
+            not isinstance(value, slice)
+            or value.step is not None
+            or not all(
+                bound is None or isinstance(bound, datetime.date)
+                for bound in (value.start, value.stop)
+            )
+        ):
+            raise TypeError(
+                "Expected a slice of dates (positional slices require a Calendar)"
+            )
+        return Range(self, value.start, value.stop)
+
+    def optimize(self) -> "Expression":
+        """
+        Returns the optimized expression.
+        """
+        return self._optimize(None, None)
+
+    def collect(self) -> Calendar:
+        """
+        Evaluates the expression.
+
+        Returns
+        -------
+        Calendar
+        """
+        dates = list(self)
+        try:
+            ordinals = storage.toordinals(dates)
+        except TypeError:
+            return Calendar(dates)
+        # the dates are already sorted and unique
+        return Calendar._fromordinals(ordinals)
+
+    def __iter__(self):
+        """
+        Lazily evaluates the (optimized) expression, yielding its sorted dates.
+        """
+        return self.optimize()._iter()
+
+    def __repr__(self) -> str:
+        return self._repr(0)
+
+    def _optimize(self, start, end) -> "Expression":
+        raise NotImplementedError()
+
+    def _iter(self):
+        raise NotImplementedError()
+
+    def _contains(self, date) -> bool:
+        raise NotImplementedError()
+
+    def _size(self) -> int:
+        raise NotImplementedError()
+
+    def _repr(self, depth: int) -> str:
+        raise NotImplementedError()
+
+
+class Leaf(Expression):
+    """
+    A calendar, restricted to a date range.
+    """
+
+    __slots__ = ("calendar", "end", "start")
+
+    def __init__(self, calendar: Calendar, start=None, end=None):
+        self.calendar, self.start, self.end = calendar, start, end
+
+    def _optimize(self, start, end) -> Expression:
+        return Leaf(self.calendar, *intersect(self.start, self.end, start, end))
+
+    def _iter(self):
+        return self.calendar.iterrange(self.start, self.end)
+
+    def _contains(self, date) -> bool:
+        return (
+            (self.start is None or self.start <= date)
+            and (self.end is None or date <= self.end)
+            and date in self.calendar
+        )
+
+    def _size(self) -> int:
+        dates = self.calendar.__dates__
+        lo = 0 if self.start is None else dates.bisect_left(self.start)
+        hi = len(dates) if self.end is None else dates.bisect_right(self.end)
+        return max(0, hi - lo)
+
+    def _repr(self, depth: int) -> str:
+        bounds = ""
+        if self.start is not None or self.end is not None:
+            bounds = f"[{self.start or ''}:{self.end or ''}]"
+        return f"{'  ' * depth}Calendar({len(self.calendar)} dates){bounds}"
+
+
+class Range(Expression):
+    """
+    Restriction of an expression to a date range.
+    """
+
+    __slots__ = ("child", "end", "start")
+
+    def __init__(self, child: Expression, start=None, end=None):
+        self.child, self.start, self.end = child, start, end
+
+    def _optimize(self, start, end) -> Expression:
+        # pushed down to the leaves
+        return self.child._optimize(*intersect(self.start, self.end, start, end))
+
+    def _iter(self):
+        if isinstance(self.child, Leaf):
+            # bisected in the calendar
+            return self._leaf()._iter()
+        dates = self.child._iter()
+        if self.start is not None:
+            dates = itertools.dropwhile(lambda date: date < self.start, dates)
+        if self.end is not None:
+            dates = itertools.takewhile(lambda date: date <= self.end, dates)
+        return dates
+
+    def _contains(self, date) -> bool:
+        return (
+            (self.start is None or self.start <= date)
+            and (self.end is None or date <= self.end)
+            and self.child._contains(date)
+        )
+
+    def _size(self) -> int:
+        if isinstance(self.child, Leaf):
+            return self._leaf()._size()
+        return self.child._size()
+
+    def _leaf(self) -> Leaf:
+        """
+        Returns the calendar of the child leaf, restricted to the range.
+        """
+        return Leaf(
+            self.child.calendar,
+            *intersect(self.child.start, self.child.end, self.start, self.end),
+        )
+
+    def _repr(self, depth: int) -> str:
+        return (
+            f"{'  ' * depth}Range[{self.start or ''}:{self.end or ''}]\n"
+            + self.child._repr(depth + 1)
+        )
+
+
+class Filter(Expression):
+    """
+    Dates of an expression satisfying all the predicates.
+    """
+
+    __slots__ = ("child", "funcs")
+
+    def __init__(self, child: Expression, funcs: list):
+        self.child, self.funcs = child, funcs
+
+    def _optimize(self, start, end) -> Expression:
+        child = self.child._optimize(start, end)
+        if isinstance(child, Filter):
+            # fused with the child filter
+            return Filter(child.child, child.funcs + self.funcs)
+        return Filter(child, self.funcs)
+
+    def _iter(self):
+        funcs = self.funcs
+        return (
+            date for date in self.child._iter() if all(func(date) for func in funcs)
+        )
+
+    def _contains(self, date) -> bool:
+        return self.child._contains(date) and all(func(date) for func in self.funcs)
+
+    def _size(self) -> int:
+        return self.child._size()
+
+    def _repr(self, depth: int) -> str:
+        return (
+            f"{'  ' * depth}Filter({len(self.funcs)} predicates)\n"
+            + self.child._repr(depth + 1)
+        )
+
+
+class Union(Expression):
+    """
+    Dates in any of the expressions.
+    """
+
+    __slots__ = ("children",)
+
+    def __init__(self, children: list):
+        self.children = children
+
+    def _optimize(self, start, end) -> Expression:
+        children = []
+        for child in self.children:
+            child = child._optimize(start, end)
+            children.extend(child.children if isinstance(child, Union) else [child])
+        return Union(children)
+
+    def _iter(self):
+        # single merge pass over the sorted operands, skipping duplicates
+        return (
+            date
+            for date, _ in itertools.groupby(
+                heapq.merge(*[child._iter() for child in self.children])
+            )
+        )
+
+    def _contains(self, date) -> bool:
+        return any(child._contains(date) for child in self.children)
+
+    def _size(self) -> int:
+        return sum(child._size() for child in self.children)
+
+    def _repr(self, depth: int) -> str:
+        return "\n".join(
+            [f"{'  ' * depth}Union"]
+            + [child._repr(depth + 1) for child in self.children]
+        )
+
+
+class Intersection(Expression):
+    """
+    Dates in all of the expressions.
+    """
+
+    __slots__ = ("children",)
+
+    def __init__(self, children: list):
+        self.children = children
+
+    def _optimize(self, start, end) -> Expression:
+        children = []
+        for child in self.children:
+            child = child._optimize(start, end)
+            children.extend(
+                child.children if isinstance(child, Intersection) else [child]
+            )
+        # the smallest operand drives the evaluation
+        return Intersection(sorted(children, key=lambda child: child._size()))
+
+    def _iter(self):
+        driver, others = self.children[0], self.children[1:]
+        return (
+            date
+            for date in driver._iter()
+            if all(other._contains(date) for other in others)
+        )
+
+    def _contains(self, date) -> bool:
+        return all(child._contains(date) for child in self.children)
+
+    def _size(self) -> int:
+        return min(child._size() for child in self.children)
+
+    def _repr(self, depth: int) -> str:
+        return "\n".join(
+            [f"{'  ' * depth}Intersection"]
+            + [child._repr(depth + 1) for child in self.children]
+        )
+
+
+class Difference(Expression):
+    """
+    Dates in an expression and not in any of the others.
+    """
+
+    __slots__ = ("child", "others")
+
+    def __init__(self, child: Expression, others: list):
+        self.child, self.others = child, others
+
+    def _optimize(self, start, end) -> Expression:
+        return Difference(
+            self.child._optimize(start, end),
+            sorted(
+                [other._optimize(start, end) for other in self.others],
+                key=lambda other: other._size(),
+                reverse=True,
+            ),
+        )
+
+    def _iter(self):
+        others = self.others
+        return (
+            date
+            for date in self.child._iter()
+            if not any(other._contains(date) for other in others)
+        )
+
+    def _contains(self, date) -> bool:
+        return self.child._contains(date) and not any(
+            other._contains(date) for other in self.others
+        )
+
+    def _size(self) -> int:
+        return self.child._size()
+
+    def _repr(self, depth: int) -> str:
+        return "\n".join(
+            [f"{'  ' * depth}Difference", self.child._repr(depth + 1)]
+            + [f"{'  ' * (depth + 1)}except"]
+            + [other._repr(depth + 2) for other in self.others]
+        )
+
+
+def expression(value) -> Expression:
+    """
+    Returns the expression of a calendar, an iterable of dates or an expression.
+    """
+    if isinstance(value, Expression):
+        return value
+    if not isinstance(value, Calendar):
+        value = Calendar(value)
+    return Leaf(value)
+
+
+def intersect(start, end, otherstart, otherend) -> tuple:
+    """
+    Returns the intersection of two date ranges (with None for open bounds).
+    """
+    if otherstart is not None and (start is None or otherstart > start):
+        start = otherstart
+    if otherend is not None and (end is None or otherend < end):
+        end = otherend
+    return start, end
@@ -0,0 +1,166 @@
+"""
+Joint business days across several markets.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> markets = dtwo.Markets({"NYSE": nyse, "LSE": lse, "TSE": tse})
+
+    # business days in all of the markets
+    >>> markets.joint(["NYSE", "LSE"])
+    <doubledate.calendar.Calendar at 0x17045b0f430>
+
+    # settlement date, 2 business days in both markets after the trade date
+    >>> markets.offset(datetime.date(2024, 7, 3), 2, ["NYSE", "LSE"])
+    datetime.date(2024, 7, 8)
+
+    >>> markets.isbusday(datetime.date(2024, 7, 4), ["NYSE", "LSE"])
+    False
+"""
+
+import array
+import heapq
+import itertools
+
+from doubledate import cache, registry
+from doubledate.calendar import Calendar
+
+
+class Markets:
+    """
+    Engine answering business-day queries against any combination of named
+    market calendars.
+
+    The combined calendar of each combination of markets is built once, in a
+    single k-way pass over the markets' sorted dates, and cached (keyed by the
+    set of markets), so that queries on the same combination do not rebuild it.
+
+    Parameters
+    ----------
+    calendars : mapping, Registry, optional
+        the calendars (of business days) of each market, by name; defaults to
+        the process-wide registry (see :code:`doubledate.registry`)
+    maxsize : int, None
+        the maximum number of combined calendars to keep in the cache
+        (default is 1024); None for an unbounded cache
+
+    Note
+    ----
+    Markets can be given as a single name or as an iterable of names; the
+    :code:`how` parameter of each method selects the business days in all of
+    the markets (:code:`"all"`, the default) or in any of them
+    (:code:`"any"`).
+    """
+
+    __slots__ = ("_cache", "calendars")
+
+    def __init__(self, calendars=None, *, maxsize: int = 1024):
+        self.calendars = registry.default if calendars is None else calendars
+        self._cache = cache.Cache(maxsize)
+
+    def joint(self, markets, how: str = "all") -> Calendar:
+        """
+        Returns the business days in all (or any) of the markets.
+
+        Parameters
+        ----------
+        markets : str, iterable
+            the name of the market, or of the markets
+        how : str
+            one of 'all' (default) or 'any'
+
+        Returns
+        -------
+        Calendar
+
+        Raises
+        ------
+        KeyError
+            if a market is unknown
+        ValueError
+            if no market is given, or if how is neither 'all' nor 'any'
+        """
+        if how not in ("all", "any"):
+            raise ValueError(
+                f"Expected how to be one of 'all' or 'any', received {how}"
+            )
+        key = frozenset([markets] if isinstance(markets, str) else markets)
+        if not key:
+            raise ValueError("Expected at least one market")
+        if len(key) == 1:
+            (name,) = key
+            return self.calendars[name]
+        return self._cache.get(
+            (key, how), lambda: combine([self.calendars[name] for name in key], how)
+        )
+
+    def isbusday(self, date, markets, how: str = "all"):
+        """
+        Returns whether the date is a business day in all (or any) of the markets.
+
+        Parameters
+        ----------
+        date : datetime.date, iterable
+            the date, or an iterable (or NumPy :code:`datetime64` array) of dates
+        markets : str, iterable
+            the name of the market, or of the markets
+        how : str
+            one of 'all' (default) or 'any'
+
+        Returns
+        -------
+        bool
+            or a list (NumPy array) of booleans, if passed several dates
+        """
+        calendar = self.joint(markets, how)
+        if isinstance(date, str) or not hasattr(date, "__iter__"):
+            return date in calendar
+        return calendar.isin(date)
+
+    def offset(self, date, days: int, markets, how: str = "all"):
+        """
+        Returns the business day (in all or any of the markets) offset by n days
+        from the given business day, see :code:`Calendar.offset`.
+        """
+        return self.joint(markets, how).offset(date, days)
+
+    def daysbetween(
+        self, this, that, markets, how: str = "all", bounds: str = "left"
+    ) -> int:
+        """
+        Returns the number of business days (in all or any of the markets)
+        between two dates, see :code:`Calendar.daysbetween`.
+        """
+        return self.joint(markets, how).daysbetween(this, that, bounds=bounds)
+
+    def clear(self):
+        """
+        Clears the cached combined calendars (e.g. after a market's calendar was
+        updated).
+        """
+        self._cache.clear()
+
+
+def combine(calendars, how: str = "all") -> Calendar:
+    """
+    Returns the dates in all (or any) of the calendars, merging their sorted
+    ordinals in a single k-way pass.
+    """
+    required = len(calendars) if how == "all" else 1
+    try:
+        sources = [calendar.__ordinals__() for calendar in calendars]
+    except TypeError:
+        # calendars of datetimes
+        sources = None
+
+    values = [
+        value
+        for value, group in itertools.groupby(heapq.merge(*(sources or calendars)))
+        if sum(1 for _ in group) >= required
+    ]
+    if sources is None:
+        return Calendar(values)
+    return Calendar._fromordinals(array.array("i", values))
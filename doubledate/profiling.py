@@ -0,0 +1,284 @@
+"""
+Opt-in instrumentation of the public :code:`Calendar`, :code:`Collection`
+(and :code:`LazyCollection`) and :code:`utils` functions.
+
+When enabled, the public methods and functions are replaced by wrappers recording,
+for each of them, the number of calls, the cumulative time spent and the cumulative
+size of their inputs. When disabled, the original methods and functions are
+restored, so that instrumentation has no overhead at all when it is not used.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    # as a context manager
+    >>> with dtwo.profiling.Profile() as profile:
+    ...     calendar.resample("M").last()
+    >>> profile.stats()
+    {'Calendar.resample': {'calls': 1, 'time': 0.0021, 'size': 1305}, ...}
+
+    # as a global switch, forwarding each call to a metrics pipeline
+    >>> dtwo.profiling.enable(callback=lambda name, time, size: statsd.timing(name, time))
+    >>> ...
+    >>> dtwo.profiling.stats()
+    >>> dtwo.profiling.disable()
+
+Note
+----
+Time is inclusive: methods calling other instrumented methods or functions
+(e.g. :code:`Calendar.resample` calling :code:`Calendar.groupby`) are recorded
+alongside them.
+"""
+
+import collections.abc
+import functools
+import sys
+import threading
+import time
+
+from doubledate import utils
+from doubledate.calendar import Calendar, Collection, LazyCollection
+
+# special methods instrumented alongside the public methods
+SPECIAL = ("__init__", "__getitem__", "__contains__")
+
+# profiles currently recording, and the originals of the patched attributes
+ACTIVE = []
+PATCHED = []
+LOCK = threading.RLock()
+
+
+class Profile:
+    """
+    Records the calls to the public :code:`Calendar`, :code:`Collection` and
+    :code:`utils` functions while it is active.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        function called after each instrumented call with the qualified name of
+        the method or function (e.g. :code:`"Calendar.dayof"`), the time spent
+        (in seconds) and the size of the input
+
+    Note
+    ----
+    The size of the input is the length of the calendar (or collection) for
+    methods and, for functions, the length of the :code:`calendar` argument or of
+    the first sized, non-string positional argument (1 otherwise).
+    """
+
+    __slots__ = ("_lock", "_records", "callback")
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> "Profile":
+        """
+        Starts recording (instrumenting the library if needed).
+        """
+        with LOCK:
+            if self not in ACTIVE:
+                if not ACTIVE:
+                    instrument()
+                ACTIVE.append(self)
+        return self
+
+    def stop(self):
+        """
+        Stops recording (restoring the library if no other profile is active).
+        """
+        with LOCK:
+            if self in ACTIVE:
+                ACTIVE.remove(self)
+                if not ACTIVE:
+                    restore()
+
+    @property
+    def active(self) -> bool:
+        return self in ACTIVE
+
+    def record(self, name: str, elapsed: float, size: int):
+        """
+        Records a call.
+        """
+        with self._lock:
+            record = self._records.get(name)
+            if record is None:
+                record = self._records[name] = [0, 0.0, 0]
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += size
+        if self.callback is not None:
+            self.callback(name, elapsed, size)
+
+    def stats(self) -> dict:
+        """
+        Returns the recorded calls.
+
+        Returns
+        -------
+        dict
+            mapping the qualified name of each called method or function to a
+            dict with keys :code:`calls`, :code:`time` (cumulative, in seconds)
+            and :code:`size` (cumulative size of the inputs), sorted by
+            descending cumulative time
+        """
+        with self._lock:
+            records = sorted(self._records.items(), key=lambda item: -item[1][1])
+            return {
+                name: {"calls": calls, "time": elapsed, "size": size}
+                for name, (calls, elapsed, size) in records
+            }
+
+    def reset(self):
+        """
+        Clears the recorded calls.
+        """
+        with self._lock:
+            self._records.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def sizeof(args, kwargs) -> int:
+    """
+    Returns the size of the input of a function call.
+    """
+    if "calendar" in kwargs:
+        try:
+            return len(kwargs["calendar"])
+        except TypeError:
+            return 1
+    for arg in args:
+        if isinstance(arg, collections.abc.Sized) and not isinstance(arg, str):
+            return len(arg)
+    return 1
+
+
+def wrap(func, name: str, method: bool):
+    """
+    Returns the instrumented version of the function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            try:
+                size = len(args[0]) if method else sizeof(args, kwargs)
+            except Exception:  # noqa: BLE001
+                # e.g. a constructor which failed before setting its attributes:
+                # profiling must not replace the exception raised by the call
+                size = 0
+            # copied, as profiles may be started or stopped meanwhile
+            for profile in tuple(ACTIVE):
+                profile.record(name, elapsed, size)
+
+    wrapper.__instrumented__ = func
+    return wrapper
+
+
+def patch(owner, attribute: str, value):
+    """
+    Replaces the attribute of owner, keeping the original to be restored.
+    """
+    PATCHED.append((owner, attribute, owner.__dict__[attribute]))
+    setattr(owner, attribute, value)
+
+
+def instrument():
+    """
+    Replaces the public methods and functions by their instrumented versions.
+    """
+    for cls in (Calendar, Collection, LazyCollection):
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") and attribute not in SPECIAL:
+                continue
+            name = f"{cls.__name__}.{attribute}"
+            if isinstance(value, classmethod):
+                patch(cls, attribute, classmethod(wrap(value.__func__, name, False)))
+            elif isinstance(value, staticmethod):
+                patch(cls, attribute, staticmethod(wrap(value.__func__, name, False)))
+            elif callable(value) and not isinstance(value, type):
+                patch(cls, attribute, wrap(value, name, True))
+
+    # functions are also re-exported by the package
+    package = sys.modules["doubledate"]
+    for attribute, value in list(vars(utils).items()):
+        if (
+            attribute.startswith("_")
+            or not callable(value)
+            or isinstance(value, type)
+            or getattr(value, "__module__", None) != utils.__name__
+        ):
+            continue
+        wrapper = wrap(value, f"utils.{attribute}", False)
+        patch(utils, attribute, wrapper)
+        if package.__dict__.get(attribute) is value:
+            patch(package, attribute, wrapper)
+
+
+def restore():
+    """
+    Restores the original methods and functions.
+    """
+    while PATCHED:
+        owner, attribute, value = PATCHED.pop()
+        setattr(owner, attribute, value)
+
+
+# process-wide profile, used by the global switch
+default = Profile()
+
+
+def enable(callback=None):
+    """
+    Enables the process-wide instrumentation.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        function called after each instrumented call (see :code:`Profile`)
+    """
+    default.callback = callback
+    default.start()
+
+
+def disable():
+    """
+    Disables the process-wide instrumentation (recorded calls are kept).
+    """
+    default.stop()
+
+
+def enabled() -> bool:
+    """
+    Returns whether the library is currently instrumented.
+    """
+    return bool(ACTIVE)
+
+
+def stats() -> dict:
+    """
+    Returns the calls recorded by the process-wide instrumentation, see
+    :code:`Profile.stats`.
+    """
+    return default.stats()
+
+
+def reset():
+    """
+    Clears the calls recorded by the process-wide instrumentation.
+    """
+    default.reset()
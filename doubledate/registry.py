@@ -0,0 +1,261 @@
+"""
+Registry of named calendars.
+
+Calendars are registered by name with a loader, loaded lazily on first lookup and
+cached process-wide. As calendars are immutable, the cached instances can safely be
+shared between callers and threads.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> dtwo.registry.register("NYSE", "/data/calendars/nyse.cal")
+    >>> dtwo.registry.register("TARGET", lambda: load_target_holidays())
+    >>> dtwo.registry.register(
+    ...     "WEEKDAYS",
+    ...     {"freq": "B", "starting": dtwo.date(2000, 1, 1), "ending": dtwo.date(2050, 12, 31)},
+    ... )
+
+    >>> dtwo.registry.get("NYSE")  # loaded from file on first lookup
+    <doubledate.calendar.Calendar at 0x17045b0f430>
+
+    >>> dtwo.registry.get("NYSE")  # cached
+    <doubledate.calendar.Calendar at 0x17045b0f430>
+"""
+
+import collections
+import collections.abc
+import os
+import threading
+import time
+
+from doubledate.calendar import Calendar
+
+
+class Registry:
+    """
+    Registry of named calendars, with lazy loading and a size-bounded (LRU) cache.
+
+    Parameters
+    ----------
+    maxsize : int, None
+        the maximum number of loaded calendars to keep in the cache
+        (default is 128); None for an unbounded cache
+
+    Note
+    ----
+    A loader can be either:
+
+    - a :code:`Calendar`, which is returned as-is
+    - a path (:code:`str` or path-like) to a file saved with :code:`Calendar.save`
+    - a callable returning a :code:`Calendar` or an iterable of dates
+    - a mapping of keyword arguments for :code:`Calendar.create` (i.e. a rule)
+
+    Evicted calendars are reloaded from their loader on the next lookup.
+
+    Calendars are loaded outside of the registry's lock, once per name:
+    concurrent lookups of a calendar being loaded wait for it, while lookups
+    of other calendars proceed.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_loaders",
+        "_lock",
+        "_pending",
+        "evictions",
+        "hits",
+        "loadtime",
+        "maxsize",
+        "misses",
+    )
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(
+                f"Expected maxsize to be a positive integer, received {maxsize}"
+            )
+        self.maxsize = maxsize
+        self._loaders = {}
+        self._cache = collections.OrderedDict()
+        # names being loaded, mapped to the event set once they are loaded
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.hits, self.misses, self.evictions, self.loadtime = 0, 0, 0, 0.0
+
+    def register(self, name: str, loader, *, replace: bool = False):
+        """
+        Registers a calendar loader under the given name.
+
+        Parameters
+        ----------
+        name : str
+            the calendar's name
+        loader : Calendar, str, path-like, callable, mapping
+            the calendar or the way to load it
+        replace : bool
+            whether to replace an existing loader of the same name
+
+        Raises
+        ------
+        KeyError
+            if the name is already registered and replace is False
+        TypeError
+            if the loader is not supported
+        """
+        if not isinstance(
+            loader, (Calendar, str, os.PathLike, collections.abc.Mapping)
+        ) and not callable(loader):
+            raise TypeError(
+                f"Expected loader to be a Calendar, path, callable or mapping, received {type(loader).__name__}"
+            )
+        with self._lock:
+            if name in self._loaders and not replace:
+                raise KeyError(f"Calendar '{name}' is already registered")
+            self._loaders[name] = loader
+            self._cache.pop(name, None)
+
+    def unregister(self, name: str):
+        """
+        Removes the calendar from the registry (and from the cache).
+
+        Raises
+        ------
+        KeyError
+            if the name is not registered
+        """
+        with self._lock:
+            del self._loaders[name]
+            self._cache.pop(name, None)
+
+    def get(self, name: str) -> Calendar:
+        """
+        Returns the calendar registered under the given name, loading it if it
+        is not in the cache.
+
+        Raises
+        ------
+        KeyError
+            if the name is not registered
+        """
+        while True:
+            with self._lock:
+                if name in self._cache:
+                    self.hits += 1
+                    self._cache.move_to_end(name)
+                    return self._cache[name]
+
+                if name not in self._loaders:
+                    raise KeyError(f"Calendar '{name}' is not registered")
+
+                event = self._pending.get(name)
+                if event is None:
+                    # this thread loads the calendar, others wait for it
+                    event = self._pending[name] = threading.Event()
+                    loader = self._loaders[name]
+                    self.misses += 1
+                    break
+            event.wait()
+
+        # loaded outside of the lock, so that lookups of other calendars are
+        # not blocked by a slow loader
+        try:
+            started = time.perf_counter()
+            calendar = load(loader)
+            elapsed = time.perf_counter() - started
+        except BaseException:
+            with self._lock:
+                del self._pending[name]
+            event.set()
+            raise
+
+        with self._lock:
+            self.loadtime += elapsed
+            del self._pending[name]
+            # not cached if the loader was replaced (or removed) meanwhile
+            if self._loaders.get(name) is loader:
+                self._cache[name] = calendar
+                if self.maxsize is not None and len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        event.set()
+        return calendar
+
+    def __getitem__(self, name: str) -> Calendar:
+        return self.get(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self._loaders
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __iter__(self):
+        return iter(list(self._loaders))
+
+    def clear(self):
+        """
+        Evicts all loaded calendars from the cache (registrations are kept) and
+        resets the counters.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits, self.misses, self.evictions, self.loadtime = 0, 0, 0, 0.0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns
+        -------
+        dict
+            with keys :code:`hits`, :code:`misses`, :code:`evictions`,
+            :code:`loadtime` (cumulative, in seconds), :code:`size`
+            (number of cached calendars) and :code:`maxsize`
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "loadtime": self.loadtime,
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+            }
+
+
+def load(loader) -> Calendar:
+    """
+    Loads a calendar from a loader (see :code:`Registry`).
+    """
+    if isinstance(loader, Calendar):
+        return loader
+    if isinstance(loader, (str, os.PathLike)):
+        return Calendar.load(loader)
+    if isinstance(loader, collections.abc.Mapping):
+        return Calendar.create(**loader)
+    calendar = loader()
+    if not isinstance(calendar, Calendar):
+        calendar = Calendar(calendar)
+    return calendar
+
+
+# process-wide registry
+default = Registry()
+
+
+def register(name: str, loader, *, replace: bool = False):
+    """
+    Registers a calendar loader in the process-wide registry, see
+    :code:`Registry.register`.
+    """
+    default.register(name, loader, replace=replace)
+
+
+def get(name: str) -> Calendar:
+    """
+    Returns a calendar from the process-wide registry, see :code:`Registry.get`.
+    """
+    return default.get(name)
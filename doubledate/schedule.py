@@ -0,0 +1,212 @@
+"""
+Generation of (coupon, reset...) date schedules.
+
+Example
+-------
+.. code-block::
+
+    >>> import doubledate as dtwo
+
+    >>> schedule = dtwo.Schedule(
+    ...     dtwo.date(2024, 1, 31),
+    ...     dtwo.date(2026, 1, 31),
+    ...     "Q",
+    ...     calendar=businessdays,
+    ...     convention="modified_following",
+    ...     eom=True,
+    ... )
+    >>> schedule.unadjusted
+    [datetime.date(2024, 1, 31), datetime.date(2024, 4, 30), ...]
+    >>> schedule.adjusted
+    [datetime.date(2024, 1, 31), datetime.date(2024, 4, 30), ...]
+"""
+
+import datetime
+
+from doubledate import cache, constants, utils
+
+# number of months (or weeks, for W) between dates of each frequency
+FREQUENCIES = {
+    constants.W: 1,
+    constants.M: 1,
+    constants.Q: 3,
+    constants.T: 4,
+    constants.H: 6,
+    constants.Y: 12,
+}
+
+STUBS = ["short_final", "long_final", "short_initial", "long_initial"]
+
+# unadjusted dates of the schedules generated so far
+CACHE = cache.Cache(maxsize=1024)
+
+# adjusted dates of the schedules generated so far, by calendar (which is kept
+# alongside them, so that its id is not reused while they are cached)
+ADJUSTED = cache.Cache(maxsize=1024)
+
+
+class Schedule:
+    """
+    Schedule of dates between an effective and a termination date.
+
+    Parameters
+    ----------
+    effective : datetime.date
+        the first date of the schedule
+    termination : datetime.date
+        the last date of the schedule
+    frequency : str
+        the frequency of the dates, one of :code:`W`, :code:`M`, :code:`Q`,
+        :code:`T`, :code:`H` or :code:`Y` (see :code:`doubledate.constants`)
+    calendar : Calendar, optional
+        the calendar (e.g. of business days) to which dates are adjusted
+    convention : str
+        the roll convention with which dates are adjusted (see
+        :code:`Calendar.roll`), default is :code:`modified_following`
+    stub : str
+        where to place the irregular period, if any: :code:`short_final`
+        (default, dates are generated forward from the effective date),
+        :code:`long_final`, :code:`short_initial` (dates are generated backward
+        from the termination date) or :code:`long_initial`
+    eom : bool
+        whether dates are at the end of their month when the date from which
+        they are generated is (e.g. 30 April, 31 July, ... from 31 January)
+
+    Attributes
+    ----------
+    unadjusted : list
+        the unadjusted dates
+    adjusted : list
+        the dates adjusted to the calendar (the unadjusted dates, if no
+        calendar is given)
+
+    Raises
+    ------
+    ValueError
+        if the termination is not after the effective date, or if the
+        frequency, stub or convention is not supported
+    KeyError
+        if a date cannot be adjusted to the calendar
+
+    Note
+    ----
+    Schedules are memoized: the unadjusted dates of identical schedules are
+    only generated once, and so are their adjusted dates for each calendar and
+    convention (in bounded caches, separate from the calendars' own caches), so
+    that schedules shared across instruments are cheap to create.
+    """
+
+    __slots__ = (
+        "adjusted",
+        "calendar",
+        "convention",
+        "effective",
+        "eom",
+        "frequency",
+        "stub",
+        "termination",
+        "unadjusted",
+    )
+
+    def __init__(
+        self,
+        effective: datetime.date,
+        termination: datetime.date,
+        frequency: str = "Q",
+        *,
+        calendar=None,
+        convention: str = constants.MODIFIED_FOLLOWING,
+        stub: str = "short_final",
+        eom: bool = False,
+    ):
+        if not effective < termination:
+            raise ValueError(
+                f"Expected termination ({termination}) to be after effective date ({effective})"
+            )
+        if frequency not in FREQUENCIES:
+            raise ValueError(
+                f"Expected frequency to be one of {', '.join(FREQUENCIES)}, received {frequency}"
+            )
+        if stub not in STUBS:
+            raise ValueError(
+                f"Expected stub to be one of {', '.join(STUBS)}, received {stub}"
+            )
+        if convention not in constants.CONVENTIONS:
+            raise ValueError(
+                f"Expected convention to be one of {', '.join(constants.CONVENTIONS)}, received {convention}"
+            )
+
+        self.effective, self.termination = effective, termination
+        self.frequency, self.stub, self.eom = frequency, stub, eom
+        self.calendar, self.convention = calendar, constants.CONVENTIONS[convention]
+
+        key = (effective, termination, frequency, stub, eom)
+        unadjusted = CACHE.get(key, lambda: generate(*key))
+        self.unadjusted = list(unadjusted)
+
+        if calendar is None:
+            self.adjusted = list(unadjusted)
+        else:
+            _, adjusted = ADJUSTED.get(
+                (id(calendar), unadjusted, self.convention),
+                lambda: (
+                    calendar,
+                    tuple(calendar.roll(unadjusted, self.convention)[0]),
+                ),
+            )
+            self.adjusted = list(adjusted)
+
+    def __len__(self) -> int:
+        return len(self.adjusted)
+
+    def __iter__(self):
+        return iter(self.adjusted)
+
+    def periods(self, adjusted: bool = True) -> list:
+        """
+        Returns the periods of the schedule.
+
+        Parameters
+        ----------
+        adjusted : bool
+            whether to return the adjusted (default) or unadjusted dates
+
+        Returns
+        -------
+        list
+            of (start, end) tuples
+        """
+        dates = self.adjusted if adjusted else self.unadjusted
+        return list(zip(dates[:-1], dates[1:]))
+
+
+def generate(effective, termination, frequency, stub, eom) -> tuple:
+    """
+    Returns the unadjusted dates of a schedule (see :code:`Schedule`).
+    """
+    backward = stub.endswith("initial")
+    anchor = termination if backward else effective
+    sign = -1 if backward else 1
+    step = FREQUENCIES[frequency]
+    endofmonth = eom and frequency != constants.W and anchor == utils.eom(anchor)
+
+    dates, k = [], 1
+    while True:
+        if frequency == constants.W:
+            date = anchor + datetime.timedelta(weeks=sign * k * step)
+        else:
+            date = utils.offset(anchor, months=sign * k * step)
+            if endofmonth:
+                date = utils.eom(date)
+        if (date >= termination) if not backward else (date <= effective):
+            break
+        dates.append(date)
+        k += 1
+
+    # the irregular period, if any, is merged into its neighbour
+    if stub.startswith("long") and dates and date not in (effective, termination):
+        dates.pop()
+
+    if backward:
+        dates.reverse()
+    return (effective, *dates, termination)
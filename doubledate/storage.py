@@ -0,0 +1,261 @@
+"""
+Compact storage of calendars as arrays of ordinals.
+
+A calendar of :code:`datetime.date` objects can be represented by the sorted
+array of the dates' proleptic Gregorian ordinals (see :code:`datetime.date.toordinal`),
+which takes 4 bytes per date and can be serialized, memory-mapped or shared
+without creating any Python objects.
+
+Binary format
+-------------
+All integers are little-endian.
+
+======  ======  ==========================================================
+offset  size    content
+======  ======  ==========================================================
+0       5       magic bytes :code:`b"DDCAL"`
+5       1       format version (currently 1)
+6       1       encoding of the payload: 0 for delta, 1 for raw
+7       1       reserved (0)
+8       4       number of dates (unsigned)
+12      4       CRC-32 checksum of the payload (unsigned)
+16      ...     payload
+======  ======  ==========================================================
+
+With the :code:`delta` encoding, the payload is the first ordinal followed by the
+differences between consecutive ordinals, each written as an unsigned LEB128
+variable-length integer (i.e. 1 byte per date for business-day calendars).
+
+With the :code:`raw` encoding, the payload is the array of ordinals as 4-byte signed
+integers, starting at a 4-byte aligned offset so that it can be memory-mapped.
+"""
+
+import array
+import bisect
+import datetime
+import mmap
+import struct
+import sys
+import zlib
+
+MAGIC = b"DDCAL"
+VERSION = 1
+HEADER = struct.Struct("<5sBBBII")
+
+ENCODINGS = {"delta": 0, "raw": 1}
+
+# ordinal of 1970-01-01, i.e. of day 0 of numpy.datetime64[D]
+EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+class OrdinalSet:
+    """
+    Read-only sorted set of dates backed by an array of ordinals.
+
+    Exposes the subset of the :code:`sortedcontainers.SortedSet` interface used by
+    :code:`Calendar`, so that it can be used as the calendar's storage.
+
+    Parameters
+    ----------
+    ordinals : array, memoryview
+        strictly increasing ordinals (not checked)
+    """
+
+    __slots__ = ("ordinals",)
+
+    def __init__(self, ordinals):
+        self.ordinals = ordinals
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def __iter__(self):
+        return map(datetime.date.fromordinal, self.ordinals)
+
+    def __reversed__(self):
+        return map(datetime.date.fromordinal, reversed(self.ordinals))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [datetime.date.fromordinal(o) for o in self.ordinals[index]]
+        return datetime.date.fromordinal(self.ordinals[index])
+
+    def islice(self, start=None, stop=None, reverse=False):
+        start, stop, _ = slice(start, stop).indices(len(self.ordinals))
+        positions = range(start, stop)
+        if reverse:
+            positions = reversed(positions)
+        ordinals = self.ordinals
+        return (datetime.date.fromordinal(ordinals[i]) for i in positions)
+
+    def __contains__(self, value):
+        if not isinstance(value, datetime.date) or isinstance(value, datetime.datetime):
+            return False
+        ordinal = value.toordinal()
+        i = bisect.bisect_left(self.ordinals, ordinal)
+        return i < len(self.ordinals) and self.ordinals[i] == ordinal
+
+    def index(self, value):
+        if value not in self:
+            raise ValueError(f"{value!r} is not in list")
+        return bisect.bisect_left(self.ordinals, value.toordinal())
+
+    def bisect_left(self, value):
+        return bisect.bisect_left(self.ordinals, key(value))
+
+    def bisect_right(self, value):
+        return bisect.bisect_right(self.ordinals, key(value))
+
+    def union(self, *others):
+        return set(self).union(*others)
+
+    def difference(self, *others):
+        return set(self).difference(*others)
+
+    def intersection(self, *others):
+        return set(self).intersection(*others)
+
+
+def key(value):
+    """
+    Returns the ordinal of a date, refusing datetimes (which cannot be compared to
+    dates).
+    """
+    if isinstance(value, datetime.datetime):
+        raise TypeError("can't compare datetime.datetime to datetime.date")
+    return value.toordinal()
+
+
+def toordinals(dates):
+    """
+    Returns the ordinals of the dates as an :code:`array.array`.
+
+    Raises
+    ------
+    TypeError
+        if any of the dates is a datetime (whose time would be lost)
+    """
+    if isinstance(dates, OrdinalSet):
+        return dates.ordinals
+    ordinals = array.array("i")
+    for date in dates:
+        if isinstance(date, datetime.datetime):
+            raise TypeError(
+                "Expected a calendar of datetime.date objects, received a datetime"
+            )
+        ordinals.append(date.toordinal())
+    return ordinals
+
+
+def encode(ordinals, encoding: str = "delta") -> bytes:
+    """
+    Encodes strictly increasing ordinals in the binary format described above.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Expected encoding to be one of 'delta' or 'raw', received {encoding}"
+        )
+
+    if encoding == "raw":
+        payload = array.array("i", ordinals)
+        if sys.byteorder != "little":
+            payload.byteswap()
+        payload = payload.tobytes()
+    else:
+        payload, previous = bytearray(), 0
+        for ordinal in ordinals:
+            delta, previous = ordinal - previous, ordinal
+            while delta >= 0x80:
+                payload.append((delta & 0x7F) | 0x80)
+                delta >>= 7
+            payload.append(delta)
+        payload = bytes(payload)
+
+    return (
+        HEADER.pack(
+            MAGIC, VERSION, ENCODINGS[encoding], 0, len(ordinals), zlib.crc32(payload)
+        )
+        + payload
+    )
+
+
+def header(buffer):
+    """
+    Validates and returns the (encoding, count, checksum) from the header.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("Invalid calendar: buffer is too short")
+
+    magic, version, encoding, _, count, checksum = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Invalid calendar: unrecognized magic bytes")
+    if version != VERSION:
+        raise ValueError(f"Unsupported calendar format version {version}")
+    if encoding not in ENCODINGS.values():
+        raise ValueError(f"Invalid calendar: unknown encoding {encoding}")
+    return encoding, count, checksum
+
+
+def decode(buffer):
+    """
+    Decodes a buffer produced by :code:`encode` into an array of ordinals.
+
+    Raises
+    ------
+    ValueError
+        if the buffer is not a valid calendar, or if the checksum does not match
+    """
+    encoding, count, checksum = header(buffer)
+
+    payload = memoryview(buffer)[HEADER.size :]
+    if zlib.crc32(payload) != checksum:
+        raise ValueError("Invalid calendar: checksum mismatch")
+
+    if encoding == ENCODINGS["raw"]:
+        if len(payload) != 4 * count:
+            raise ValueError("Invalid calendar: unexpected payload size")
+        ordinals = array.array("i")
+        ordinals.frombytes(payload)
+        if sys.byteorder != "little":
+            ordinals.byteswap()
+        return ordinals
+
+    ordinals, ordinal, delta, shift = array.array("i"), 0, 0, 0
+    for byte in payload:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        ordinal += delta
+        ordinals.append(ordinal)
+        delta, shift = 0, 0
+
+    if shift or len(ordinals) != count:
+        raise ValueError("Invalid calendar: unexpected payload size")
+    return ordinals
+
+
+def memorymap(path):
+    """
+    Memory-maps a file with the :code:`raw` encoding and returns a read-only view
+    of its ordinals, without reading the payload.
+
+    Note
+    ----
+    The checksum is not verified, as that would require reading the whole file.
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    encoding, count, _ = header(mapped)
+    if encoding != ENCODINGS["raw"]:
+        raise ValueError(
+            "Only calendars saved with encoding='raw' can be memory-mapped"
+        )
+    if len(mapped) != HEADER.size + 4 * count:
+        raise ValueError("Invalid calendar: unexpected payload size")
+
+    if sys.byteorder != "little" or array.array("i").itemsize != 4:
+        # the file cannot be viewed natively, fallback to a copy
+        return decode(mapped)
+    return memoryview(mapped)[HEADER.size :].cast("i")
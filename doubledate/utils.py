@@ -1,9 +1,8 @@
 import calendar
 import datetime
-import dateutil.parser
 import numbers
 
-import doubledate.constants as constants
+from doubledate import constants, storage
 
 
 def today():
@@ -742,9 +741,17 @@ def isleap(year) -> bool:
 def parse(date, dayfirst=True, yearfirst=True, fuzzy=True):
     """
     Parses a string into a datetime.date format.
+
+    Note
+    ----
+    :code:`dateutil.parser` is imported on the first call
+    to this function rather than when importing doubledate.
     """
     if isinstance(date, (datetime.date, datetime.datetime)):
         return date
+
+    import dateutil.parser
+
     return dateutil.parser.parse(
         date, dayfirst=dayfirst, yearfirst=yearfirst, fuzzy=fuzzy
     ).date()
@@ -981,6 +988,8 @@ class datemap:
         <doubledate.utils.datemap at 0x7fd0fa4cfa60>
     """
 
+    __slots__ = ("_mapping",)
+
     def __init__(self, mapping):
         self._mapping = {date: mapping[date] for date in sorted(mapping)}
 
@@ -1001,6 +1010,97 @@ class datemap:
                 raise KeyError(f"{value} not in datemap")
         return [self[v] for v in value]
 
+    def to_arrow_table(self, *, names=("date", "value")):
+        """
+        Returns the mapping as an Apache Arrow table of dates and values.
+
+        Parameters
+        ----------
+        names : tuple
+            the names of the columns of dates and values
+
+        Returns
+        -------
+        pyarrow.Table
+            with a column of dates (:code:`date32`, or timestamps for
+            datetimes) and a column of values
+
+        Note
+        ----
+        Requires pyarrow.
+
+        Example
+        -------
+        .. code-block::
+
+            >>> calendar.dayof("M").to_arrow_table()
+            pyarrow.Table
+            date: date32[day]
+            value: int64
+        """
+        import pyarrow
+
+        # pyarrow converts lists of dates natively, which is faster than
+        # computing (in Python) the ordinals of the dates of the mapping
+        return pyarrow.table(
+            {
+                names[0]: pyarrow.array(list(self._mapping)),
+                names[1]: pyarrow.array(list(self._mapping.values())),
+            }
+        )
+
+    @classmethod
+    def from_arrow_table(cls, table, *, names=("date", "value")) -> "datemap":
+        """
+        Creates a datemap from an Apache Arrow table of dates and values (see
+        :code:`datemap.to_arrow_table`).
+
+        Note
+        ----
+        Requires pyarrow. Dates of :code:`date32` columns are created from their
+        ordinals, computed with a single vectorized addition.
+        """
+        import pyarrow
+        import pyarrow.compute
+
+        dates, values = table.column(names[0]), table.column(names[1]).to_pylist()
+        if dates.type != pyarrow.date32() or dates.null_count:
+            return cls(dict(zip(dates.to_pylist(), values)))
+        ordinals = pyarrow.compute.add(
+            dates.combine_chunks().view(pyarrow.int32()),
+            pyarrow.scalar(storage.EPOCH, pyarrow.int32()),
+        )
+        return cls(
+            dict(zip(map(datetime.date.fromordinal, ordinals.to_pylist()), values))
+        )
+
+    def to_parquet(self, path, *, names=("date", "value")):
+        """
+        Writes the mapping to a Parquet file (see :code:`datemap.to_arrow_table`).
+
+        Note
+        ----
+        Requires pyarrow.
+        """
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow_table(names=names), str(path))
+
+    @classmethod
+    def from_parquet(cls, path, *, names=("date", "value")) -> "datemap":
+        """
+        Reads a datemap from a Parquet file (see :code:`datemap.to_parquet`).
+
+        Note
+        ----
+        Requires pyarrow.
+        """
+        import pyarrow.parquet
+
+        return cls.from_arrow_table(
+            pyarrow.parquet.read_table(str(path), columns=list(names)), names=names
+        )
+
 
 def dayof(frequency: str, dates=None, *, calendar=None, base=1):
     """
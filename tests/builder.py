@@ -0,0 +1,86 @@
+import datetime
+import pickle
+
+import pytest
+
+import doubledate as dtwo
+
+
+def weekdays(start, count):
+    dates = []
+    while len(dates) < count:
+        if start.weekday() < 5:
+            dates.append(start)
+        start += datetime.timedelta(1)
+    return dates
+
+
+def test_append():
+    dates = weekdays(datetime.date(2024, 1, 1), 100)
+    builder = dtwo.CalendarBuilder(dates[:10])
+    for date in dates[10:]:
+        builder.append(date)
+
+    assert len(builder) == 100
+    assert builder.last == dates[-1]
+    assert dates[50] in builder
+    assert datetime.date(2024, 1, 6) not in builder
+    assert builder.freeze() == dtwo.Calendar(dates)
+
+    # duplicates are ignored
+    builder.append(dates[-1]).append(dates[3])
+    assert len(builder) == 100
+
+    # out-of-order dates are inserted
+    builder.extend([datetime.date(2024, 1, 6), datetime.date(2023, 12, 31)])
+    assert builder.freeze() == dtwo.Calendar(
+        dates + [datetime.date(2024, 1, 6), datetime.date(2023, 12, 31)]
+    )
+
+    with pytest.raises(TypeError):
+        builder.append(datetime.datetime(2024, 1, 1))
+    with pytest.raises(IndexError):
+        _ = dtwo.CalendarBuilder().last
+
+
+def test_snapshots_are_immutable():
+    dates = weekdays(datetime.date(2024, 1, 1), 40)
+    builder = dtwo.CalendarBuilder(dates[:20])
+
+    first = builder.freeze()
+    assert builder.freeze() is first
+
+    builder.extend(dates[20:])
+    second = builder.freeze()
+    builder.append(datetime.date(2024, 1, 6))
+    third = builder.freeze()
+
+    assert first == dtwo.Calendar(dates[:20])
+    assert second == dtwo.Calendar(dates)
+    assert third == dtwo.Calendar(dates + [datetime.date(2024, 1, 6)])
+    assert pickle.loads(pickle.dumps(second)) == second
+
+
+def test_tracked(monkeypatch):
+    with pytest.raises(ValueError):
+        dtwo.CalendarBuilder(track=["X"])
+
+    dates = weekdays(datetime.date(2024, 1, 1), 80)
+    builder = dtwo.CalendarBuilder(dates[:50], track=["M", "W-WED"])
+    first = builder.freeze()
+    builder.extend(dates[50:]).append(datetime.date(2024, 2, 3))
+    second = builder.freeze()
+
+    expected = {
+        calendar: {
+            frequency: list(dtwo.Calendar(list(calendar)).dayof(frequency))
+            for frequency in ("M", "W-WED")
+        }
+        for calendar in (first, second)
+    }
+
+    # tracked datemaps are not recomputed
+    monkeypatch.setattr(dtwo.utils, "dayof", None)
+    for calendar in (first, second):
+        for frequency in ("M", "W-WED"):
+            assert list(calendar.dayof(frequency)) == expected[calendar][frequency]
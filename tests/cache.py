@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from doubledate.cache import Cache
+
+
+def test_get():
+    cache = Cache()
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("a", lambda: 2) == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+    cache.clear()
+    assert "a" not in cache
+    assert cache.get("a", lambda: 2) == 2
+
+
+def test_lru():
+    cache = Cache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert cache.keys() == ["a", "c"]
+
+    with pytest.raises(ValueError):
+        Cache(maxsize=0)
+
+    cache = Cache(maxsize=None)
+    for i in range(100):
+        cache.get(i, lambda i=i: i)
+    assert len(cache) == 100
+
+
+def test_exception():
+    cache = Cache()
+
+    def fail():
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        cache.get("a", fail)
+    assert "a" not in cache
+    assert cache.get("a", lambda: 1) == 1
+
+
+def test_single_flight():
+    cache, calls = Cache(), []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("a", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 8
+    assert len(calls) == 1
+
+
+def test_seed():
+    cache = Cache()
+    cache.seed("a", lambda: "seeded")
+    assert cache.get("a", lambda: "computed") == "seeded"
+
+    # seeds do not replace cached values
+    cache.seed("a", lambda: "other")
+    assert cache.get("a", lambda: "computed") == "seeded"
+
+    cache.seed("b", lambda: "seeded")
+    cache.clear()
+    assert cache.get("b", lambda: "computed") == "computed"
@@ -1,3 +1,7 @@
+import array
+import itertools
+import random
+
 import pytest
 import datetime
 import doubledate as dtwo
@@ -66,6 +70,300 @@ def test_slicing():
     assert len(calendar[: datetime.date(2019, 8, 1)]) == 0
 
 
+def test_fancy_indexing(backend):
+    dates = [datetime.date(2019, 8, 15) + datetime.timedelta(i) for i in range(5)]
+    calendar = backend(dates)
+
+    assert calendar[[0, -1]] == dtwo.Calendar([dates[0], dates[-1]])
+    assert calendar[[3, 1, 3]] == dtwo.Calendar([dates[1], dates[3]])
+    assert calendar[(2,)] == dtwo.Calendar([dates[2]])
+    assert len(calendar[[]]) == 0
+
+    mask = [True, False, True, False, True]
+    assert calendar[mask] == dtwo.Calendar(dates[::2])
+    assert len(calendar[[False] * 5]) == 0
+
+    with pytest.raises(IndexError):
+        calendar[[0, 5]]
+    with pytest.raises(IndexError):
+        calendar[[True, False]]
+    with pytest.raises(TypeError):
+        calendar[[True, 1]]
+    with pytest.raises(TypeError):
+        calendar[[dates[0]]]
+
+
+def test_fancy_indexing_numpy(backend):
+    numpy = pytest.importorskip("numpy")
+
+    dates = [datetime.date(2019, 8, 15) + datetime.timedelta(i) for i in range(5)]
+    calendar = backend(dates)
+
+    signal = numpy.array([1.0, -1.0, 2.0, 0.0, 3.0])
+    assert calendar[signal > 0] == dtwo.Calendar(dates[::2])
+    assert calendar[numpy.array([4, 0, -1])] == dtwo.Calendar([dates[0], dates[4]])
+    assert calendar[numpy.int64(1)] == dates[1]
+
+    with pytest.raises(IndexError):
+        calendar[numpy.array([True, False])]
+    with pytest.raises(IndexError):
+        calendar[numpy.array([10])]
+    with pytest.raises(TypeError):
+        calendar[signal]
+
+
+def test_stepped_slices(backend):
+    numpy = pytest.importorskip("numpy")
+
+    dates = [datetime.date(2019, 8, 15) + datetime.timedelta(i) for i in range(10)]
+    calendar = backend(dates)
+
+    for sliced, expected in [
+        (calendar[::2], dates[::2]),
+        (calendar[1:8:3], dates[1:8:3]),
+        (calendar[datetime.date(2019, 8, 16) :: 4], dates[1::4]),
+    ]:
+        assert list(sliced) == expected
+        values = numpy.array(expected, dtype="datetime64[D]")
+        assert (sliced.to_numpy() == values).all()
+        assert sliced.isin(values).all()
+        assert sliced.index(values).tolist() == list(range(len(expected)))
+        assert sliced[numpy.array([0])] == dtwo.Calendar(expected[:1])
+
+
+def test_index_and_isin(backend):
+    dates = [
+        datetime.date(2019, 8, 15) + datetime.timedelta(i) for i in range(0, 10, 2)
+    ]
+    calendar = backend(dates)
+
+    queries = [
+        dates[3],
+        datetime.date(2019, 8, 16),
+        dates[0],
+        datetime.date(2020, 1, 1),
+    ]
+    assert calendar.index(dates[::-1]) == [4, 3, 2, 1, 0]
+    assert calendar.index(iter(dates[:2])) == [0, 1]
+    assert calendar.index(queries, default=-1) == [3, -1, 0, -1]
+    assert calendar.index(datetime.date(2019, 8, 16), default=None) is None
+    assert calendar.isin(queries) == [True, False, True, False]
+    assert calendar.isin([]) == []
+
+    with pytest.raises(ValueError):
+        calendar.index(queries)
+    with pytest.raises(ValueError):
+        calendar.index(datetime.date(2019, 8, 16))
+
+
+def test_index_and_isin_numpy(backend):
+    numpy = pytest.importorskip("numpy")
+
+    dates = [
+        datetime.date(2019, 8, 15) + datetime.timedelta(i) for i in range(0, 10, 2)
+    ]
+    calendar = backend(dates)
+
+    queries = numpy.array(
+        ["2019-08-21", "2019-08-16", "2019-08-15", "2020-01-01"], dtype="datetime64[D]"
+    )
+    assert calendar.index(queries, default=-1).tolist() == [3, -1, 0, -1]
+    assert calendar.index(queries[[0, 2]]).tolist() == [3, 0]
+    assert calendar.isin(queries).tolist() == [True, False, True, False]
+
+    with pytest.raises(ValueError):
+        calendar.index(queries)
+
+    # scalars are searched as single dates
+    assert calendar.index(queries[0]) == 3
+    assert calendar.index(numpy.datetime64("2019-08-15")) == 0
+    assert calendar.index(numpy.array(queries[2])) == 0
+    assert calendar.index(queries[1], default=None) is None
+    with pytest.raises(ValueError):
+        calendar.index(queries[3])
+
+
+def test_iterrange(backend):
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(i) for i in range(0, 60, 2)]
+    calendar = backend(dates)
+
+    assert list(calendar.iterrange()) == dates
+    assert list(calendar.iterrange(3, 10, 2)) == dates[3:10:2]
+    assert list(calendar.iterrange(-5, reverse=True)) == dates[-5:][::-1]
+    assert list(calendar.iterrange(step=4, reverse=True)) == dates[::-1][::4]
+    assert list(calendar.iterrange(10, 3)) == []
+    assert list(
+        calendar.iterrange(datetime.date(2024, 1, 2), datetime.date(2024, 1, 9))
+    ) == list(calendar[datetime.date(2024, 1, 2) : datetime.date(2024, 1, 9)])
+
+    with pytest.raises(ValueError):
+        calendar.iterrange(step=0)
+
+
+def test_iterperiods(calendar):
+    periods = list(calendar.iterperiods("M"))
+    months = calendar.groupby("M")
+    assert len(periods) == len(months)
+    assert periods == [
+        ((month[0].year, month[0].month), month[0], month[-1]) for month in months
+    ]
+
+    dates = [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 2),
+        datetime.date(2024, 1, 16),
+        datetime.date(2024, 2, 1),
+        datetime.date(2024, 2, 20),
+    ]
+    assert list(dtwo.Calendar(dates).iterperiods(lambda date: date.day < 15)) == [
+        (True, dates[0], dates[1]),
+        (False, dates[2], dates[2]),
+        (True, dates[3], dates[3]),
+        (False, dates[4], dates[4]),
+    ]
+    assert list(dtwo.Calendar([]).iterperiods("Y")) == []
+
+    with pytest.raises(ValueError):
+        calendar.iterperiods("X")
+    with pytest.raises(ValueError):
+        calendar.iterperiods(3)
+
+
+def test_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    values = numpy.arange("2024-01", "2024-03", dtype="datetime64[D]")
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(i) for i in range(60)]
+
+    calendar = dtwo.Calendar.from_numpy(values)
+    assert calendar == dtwo.Calendar(dates)
+    assert calendar.to_numpy().dtype == numpy.dtype("datetime64[D]")
+    assert (calendar.to_numpy() == values).all()
+    assert (dtwo.Calendar(dates).to_numpy() == values).all()
+    assert len(dtwo.Calendar([]).to_numpy()) == 0
+
+    shuffled = numpy.concatenate([values[::-1], values[:5]]).astype("datetime64[ns]")
+    assert dtwo.Calendar.from_numpy(shuffled, sort=True) == calendar
+
+    with pytest.raises(ValueError):
+        dtwo.Calendar.from_numpy(numpy.array(["NaT"], dtype="datetime64[D]"))
+
+
+def test_pandas():
+    pandas = pytest.importorskip("pandas")
+
+    index = pandas.date_range("2024-01-01", "2024-02-29", freq="B")
+    calendar = dtwo.Calendar.from_pandas(index)
+    assert calendar == dtwo.Calendar([timestamp.date() for timestamp in index])
+    assert list(calendar.to_pandas()) == list(index)
+
+    shuffled = pandas.Series(index[::-1].append(index[:3]) + pandas.Timedelta("6h"))
+    assert dtwo.Calendar.from_pandas(shuffled) == calendar
+    assert dtwo.Calendar.from_pandas(index.tz_localize("Asia/Tokyo")) == calendar
+
+
+def test_arrow(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(i) for i in range(0, 90, 3)]
+    calendar = dtwo.Calendar(dates)
+
+    values = calendar.to_arrow()
+    assert values.type == pyarrow.date32()
+    assert values.to_pylist() == dates
+
+    assert dtwo.Calendar.from_arrow(values) == calendar
+    assert list(dtwo.Calendar.from_arrow(values[5:9])) == dates[5:9]
+    shuffled = pyarrow.chunked_array([values[10:], values[:12]])
+    assert dtwo.Calendar.from_arrow(shuffled, sort=True) == calendar
+    assert dtwo.Calendar.from_arrow(values).to_arrow().equals(values)
+
+    with pytest.raises(ValueError):
+        dtwo.Calendar.from_arrow(pyarrow.array([None], type=pyarrow.date32()))
+
+    calendar.to_parquet(tmp_path / "calendar.parquet")
+    assert dtwo.Calendar.from_parquet(tmp_path / "calendar.parquet") == calendar
+
+    mapping = calendar.dayof("M")
+    table = mapping.to_arrow_table()
+    assert table.column_names == ["date", "value"]
+    assert table.column("date").type == pyarrow.date32()
+    assert dict(zip(*table.to_pydict().values())) == dict(zip(calendar, mapping))
+    assert list(dtwo.datemap.from_arrow_table(table)) == list(mapping)
+    assert dtwo.datemap.from_arrow_table(table)[dates[4]] == mapping[dates[4]]
+    assert dtwo.datemap({}).to_arrow_table().num_rows == 0
+
+    datetimes = dtwo.datemap({datetime.datetime(2024, 1, 1, 12): "noon"})
+    table = datetimes.to_arrow_table()
+    assert table.column("date").type == pyarrow.timestamp("us")
+    assert (
+        dtwo.datemap.from_arrow_table(table)[datetime.datetime(2024, 1, 1, 12)]
+        == "noon"
+    )
+
+    mapping.to_parquet(tmp_path / "dayof.parquet", names=("day", "dayof"))
+    assert list(
+        dtwo.datemap.from_parquet(tmp_path / "dayof.parquet", names=("day", "dayof"))
+    ) == list(mapping)
+
+
+@pytest.fixture
+def businessdays():
+    # weekdays of March and April 2024, excluding Good Friday and Easter Monday
+    return dtwo.Calendar(
+        [
+            datetime.date(2024, 3, 1) + datetime.timedelta(i)
+            for i in range(61)
+            if (datetime.date(2024, 3, 1) + datetime.timedelta(i)).weekday() < 5
+        ]
+    ).difference([datetime.date(2024, 3, 29), datetime.date(2024, 4, 1)])
+
+
+def test_roll(businessdays):
+    saturday, friday = datetime.date(2024, 3, 30), datetime.date(2024, 3, 29)
+    tuesday = datetime.date(2024, 4, 2)
+    thursday = datetime.date(2024, 3, 28)
+
+    assert businessdays.roll(saturday) == (tuesday, True)
+    assert businessdays.roll(saturday, "modified_following") == (thursday, True)
+    assert businessdays.roll(friday, "P") == (thursday, True)
+    assert businessdays.roll(datetime.date(2024, 4, 1), "MP") == (tuesday, True)
+    assert businessdays.roll(tuesday, "MF") == (tuesday, False)
+    assert businessdays.roll(saturday, "unadjusted") == (saturday, False)
+
+    dates = [datetime.date(2024, 3, 16), tuesday, datetime.date(2024, 5, 1)]
+    assert businessdays.roll(dates, "F", default=None) == (
+        [datetime.date(2024, 3, 18), tuesday, None],
+        [True, False, True],
+    )
+
+    with pytest.raises(KeyError):
+        businessdays.roll(dates, "F")
+    with pytest.raises(KeyError):
+        businessdays.roll(datetime.date(2024, 2, 29), "MP")
+    with pytest.raises(ValueError):
+        businessdays.roll(dates, "nearest")
+
+
+def test_roll_numpy(businessdays):
+    numpy = pytest.importorskip("numpy")
+
+    dates = [
+        datetime.date(2024, 2, 25) + datetime.timedelta(i) for i in range(0, 75, 2)
+    ]
+    values = numpy.array(dates, dtype="datetime64[D]")
+    for convention in ["U", "F", "MF", "P", "MP"]:
+        expected = businessdays.roll(dates, convention, default=None)
+        adjusted, moved = businessdays.roll(values, convention, default=None)
+        assert [
+            None if numpy.isnat(value) else value.astype(object) for value in adjusted
+        ] == expected[0]
+        assert moved.tolist() == expected[1]
+
+    with pytest.raises(KeyError):
+        businessdays.roll(values, "F")
+
+
 def test_first_last():
     dates = [
         datetime.date(2019, 8, 15),
@@ -114,6 +412,92 @@ def test_groupby():
     )
 
 
+def test_periodtable(calendar):
+    table = calendar.periodtable("M")
+    groups = calendar.groupby(lambda date: (date.year, date.month))
+    assert len(table) == len(groups)
+    assert table.keys == [(group[0].year, group[0].month) for group in groups]
+    assert table.first == [group[0] for group in groups]
+    assert table.last == [group[-1] for group in groups]
+    assert list(table.count) == [len(group) for group in groups]
+    assert all(
+        calendar[start] == first for first, start in zip(table.first, table.start)
+    )
+    assert table[0] == (
+        table.keys[0],
+        table.first[0],
+        table.last[0],
+        table.count[0],
+        0,
+    )
+    assert list(table)[-1] == table[-1]
+    assert table.locate(0) == 0
+    assert table.locate(len(calendar) - 1) == len(table) - 1
+
+    # cached
+    assert calendar.periodtable("M") is table
+    assert len(dtwo.Calendar([]).periodtable("Q")) == 0
+
+    with pytest.raises(ValueError):
+        calendar.periodtable("D")
+
+
+def test_periodtable_weeks():
+    # ISO week 1 of 2025 starts on Monday 30 December 2024
+    cdr = dtwo.Calendar(
+        [
+            datetime.date(2024, 1, 2),
+            datetime.date(2024, 12, 30),
+            datetime.date(2025, 1, 2),
+            datetime.date(2025, 1, 6),
+        ]
+    )
+    assert cdr.periodtable("W").keys == [(2024, 1), (2025, 1), (2025, 2)]
+    assert [len(week) for week in cdr.groupby("W")] == [1, 2, 1]
+    assert [len(trimester) for trimester in cdr.groupby("T")] == [1, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "frequency", ["W", "W-MON", "W-WED", "W-SUN", "M", "Q", "T", "H", "Y"]
+)
+def test_periods_ordinals(frequency):
+    random.seed(frequency)
+    start = datetime.date(2019, 12, 1)
+    dates = sorted(
+        {start + datetime.timedelta(random.randint(0, 2000)) for _ in range(700)}
+    )
+    key = dtwo.calendar.keyfunc(frequency)
+    expected = [
+        (k, group[0], group[-1])
+        for k, group in (
+            (k, list(group)) for k, group in itertools.groupby(dates, key=key)
+        )
+    ]
+
+    # backed by a sorted set, by ordinals and datetimes (compared key by key)
+    for calendar in (
+        dtwo.Calendar(dates),
+        dtwo.Calendar._fromordinals(
+            array.array("i", map(datetime.date.toordinal, dates))
+        ),
+    ):
+        assert list(calendar.iterperiods(frequency)) == expected
+        table = calendar.periodtable(frequency)
+        assert list(zip(table.keys, table.first, table.last)) == expected
+        assert [(len(g), g[0]) for g in calendar.groupby(frequency)] == [
+            (len([d for d in dates if first <= d <= last]), first)
+            for _, first, last in expected
+        ]
+
+    datetimes = dtwo.Calendar(
+        [datetime.datetime.combine(date, datetime.time(12)) for date in dates]
+    )
+    assert [
+        (first.date(), last.date())
+        for _, first, last in datetimes.iterperiods(frequency)
+    ] == [(first, last) for _, first, last in expected]
+
+
 def test_fa():
     dates = [
         datetime.date(2019, 8, 15),
@@ -502,3 +886,55 @@ def test_create():
         freq="D", starting=datetime.date(2020, 1, 1), ending=datetime.date(2023, 12, 31)
     )
     assert len(cdr) == 4 * 365 + 1
+
+
+def test_slots():
+    calendar = dtwo.Calendar([datetime.date(2019, 8, 15)])
+    assert not hasattr(calendar, "__dict__")
+
+    # the cache is only allocated on first use
+    assert calendar.__cache__ is None
+    assert calendar.dayof("M")[datetime.date(2019, 8, 15)] == 1
+    assert ("dayof", "M", 1) in calendar.__cache__
+
+
+def test_from_diems():
+    calendar = dtwo.Calendar.from_diems(
+        [dtwo.diem(6, 15), "--12-15", dtwo.diem(2, 29)], range(2020, 2022)
+    )
+    assert calendar.dates == [
+        datetime.date(2020, 2, 29),
+        datetime.date(2020, 6, 15),
+        datetime.date(2020, 12, 15),
+        datetime.date(2021, 2, 28),
+        datetime.date(2021, 6, 15),
+        datetime.date(2021, 12, 15),
+    ]
+
+    calendar = dtwo.Calendar.from_diems(dtwo.diem(2, 29), 2021, fold="forward")
+    assert calendar.dates == [datetime.date(2021, 3, 1)]
+
+
+def test_cache(calendar):
+    assert calendar.dayof("M") is calendar.dayof("M")
+    assert calendar.dayof("M") is not calendar.dayof("M", base=0)
+
+    calendar.clearcache()
+    assert len(calendar.__cache__) == 0
+
+    calendar.warm(dayof=["M", "Q"], daysfrom=["MS"], daysto=["ME", "YE"])
+    assert calendar.__cache__.keys() == [
+        ("dayof", "M", 1),
+        ("dayof", "Q", 1),
+        ("daysfrom", "MS"),
+        ("daysto", "ME"),
+        ("daysto", "YE"),
+    ]
+
+
+def test_cache_bounded(calendar, monkeypatch):
+    monkeypatch.setattr(dtwo.Calendar, "cachesize", 2)
+    calendar = calendar[:]
+
+    calendar.warm(dayof=["M", "Q", "Y"])
+    assert calendar.__cache__.keys() == [("dayof", "Q", 1), ("dayof", "Y", 1)]
@@ -1,6 +1,123 @@
+import concurrent.futures
 import datetime
+import pickle
+
+import pytest
+
+import doubledate as dtwo
 
 
 def test_index(calendar):
     assert datetime.date(2014, 12, 16) in calendar.groupby("M")
     assert datetime.date(2014, 12, 25) not in calendar.groupby("M")
+
+
+def third(period):
+    if period[0].month == 12:
+        raise ValueError("December")
+    return period[2]
+
+
+def long(period):
+    return len(period) > 20
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"workers": 2},
+        {"workers": 2, "chunksize": 1},
+        {"executor": True},
+    ],
+)
+def test_parallel(calendar, monkeypatch, options):
+    monkeypatch.setattr(dtwo.calendar.Collection, "parallelthreshold", 2)
+
+    if options.get("executor"):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            parallel(calendar, {"executor": executor})
+    else:
+        parallel(calendar, options)
+
+
+def parallel(calendar, options):
+    weeks = calendar.resample("W")
+
+    for onerror in ["skip", "first", "last"]:
+        expected = weeks.apply(third, onerror=onerror)
+        result = weeks.apply(third, onerror=onerror, **options)
+        assert [list(c) for c in result] == [list(c) for c in expected]
+
+    with pytest.raises(ValueError, match="December"):
+        weeks.apply(third, **options)
+
+    months = calendar.resample("M")
+    assert [list(c) for c in months.filter(long, **options)] == [
+        list(c) for c in months.filter(long)
+    ]
+
+
+def test_parallel_fallback(calendar):
+    # small collections are processed sequentially (lambdas cannot be pickled)
+    quarters = calendar.resample("Q")
+    assert len(quarters) < dtwo.calendar.Collection.parallelthreshold
+    assert quarters.apply(lambda period: period[0], workers=4).combine() == (
+        quarters.first()
+    )
+
+    executor = concurrent.futures.ThreadPoolExecutor(2)
+    with executor, pytest.raises(ValueError):
+        quarters.apply(third, workers=2, executor=executor)
+
+
+def test_lazy(calendar, monkeypatch):
+    months = calendar.resample("M")
+    assert isinstance(months, dtwo.calendar.LazyCollection)
+    assert isinstance(months, dtwo.calendar.Collection)
+    expected = dtwo.calendar.Collection(
+        calendar.groupby(lambda date: (date.year, date.month)).calendars
+    )
+
+    def created(self, i):
+        raise AssertionError("calendar created")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(dtwo.calendar.LazyCollection, "__period__", created)
+        assert len(months) == len(expected)
+        assert months.first() == expected.first()
+        assert months.last() == expected.last()
+        assert months.combine() is calendar
+        for index in [0, 5, -1, 25]:
+            for onerror in ["skip", "first", "last"]:
+                assert months.nth(index, onerror=onerror) == expected.nth(
+                    index, onerror=onerror
+                )
+        assert months.nth(5, base=1) == expected.nth(5, base=1)
+        assert months.index(datetime.date(2014, 12, 16)) == 1
+        assert datetime.date(2014, 12, 25) not in months
+        with pytest.raises(IndexError):
+            months.nth(25)
+        with pytest.raises(IndexError):
+            months.index(datetime.date(2014, 12, 25))
+
+    assert [list(c) for c in months] == [list(c) for c in expected]
+    assert months[-1] == expected[-1]
+    assert months[1:3] == expected[1:3]
+    assert months[0] is not months[0]
+    assert months.index(months[2]) == 2
+    assert months.nth(slice(0, 2)) == expected.nth(slice(0, 2))
+    assert months.apply(lambda period: period[1:]).combine() == (
+        expected.apply(lambda period: period[1:]).combine()
+    )
+    with pytest.raises(IndexError):
+        months[len(months)]
+
+
+def test_lazy_memoize(calendar):
+    months = calendar.resample("M", memoize=True)
+    assert months[3] is months[3]
+    assert list(months)[3] is months[3]
+
+    restored = pickle.loads(pickle.dumps(months))
+    assert restored.memoize
+    assert [list(c) for c in restored] == [list(c) for c in months]
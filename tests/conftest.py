@@ -1,3 +1,5 @@
+import itertools
+
 import pytest
 import doubledate as dtwo
 
@@ -58,3 +60,25 @@ def calendar():
         .inverse(starting=dtwo.date(2014, 11, 17), ending=dtwo.date(2019, 11, 15))
         .weekdays()
     )
+
+
+@pytest.fixture(params=["sortedset", "ordinals", "mmap"])
+def backend(request, tmp_path):
+    """
+    Returns a function creating a calendar of the given dates, backed by
+    either storage (a sorted set, or the compact array of ordinals, in memory
+    or memory-mapped from a file).
+    """
+    paths = (tmp_path / f"{i}.cal" for i in itertools.count())
+
+    def create(dates):
+        calendar = dtwo.Calendar(dates)
+        if request.param == "ordinals":
+            return dtwo.Calendar.from_bytes(calendar.to_bytes())
+        if request.param == "mmap":
+            path = next(paths)
+            calendar.save(path, encoding="raw")
+            return dtwo.Calendar.load(path, mmap=True)
+        return calendar
+
+    return create
@@ -0,0 +1,158 @@
+import datetime
+import random
+
+import pytest
+
+import doubledate as dtwo
+from doubledate import daycount
+
+
+@pytest.fixture
+def businessdays():
+    return dtwo.Calendar(
+        [datetime.date(2023, 12, 1) + datetime.timedelta(i) for i in range(1000)]
+    ).weekdays()
+
+
+def test_actual():
+    start, end = datetime.date(2024, 1, 15), datetime.date(2024, 7, 15)
+    assert daycount.fraction(start, end) == 182 / 360
+    assert daycount.fraction(start, end, "ACT/365F") == 182 / 365
+    assert daycount.fraction(start, end, "ACT/365") == 182 / 365
+    assert daycount.fraction(end, start, "ACT/360") == -182 / 360
+
+    assert daycount.fraction(start, end, "ACT/ACT") == 182 / 366
+    assert daycount.fraction(
+        datetime.date(2023, 11, 1), datetime.date(2024, 3, 1), "ACT/ACT"
+    ) == pytest.approx(61 / 365 + 60 / 366)
+    assert daycount.fraction(
+        datetime.date(2022, 7, 1), datetime.date(2025, 7, 1), "ACT/ACT"
+    ) == pytest.approx(184 / 365 + 2 + 181 / 365)
+    assert daycount.fraction(
+        datetime.date(2024, 3, 1), datetime.date(2023, 11, 1), "ACT/ACT"
+    ) == pytest.approx(-(61 / 365 + 60 / 366))
+
+
+def test_thirty():
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 1, 31), datetime.date(2024, 3, 31), "30/360"
+        )
+        == 60 / 360
+    )
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 1, 15), datetime.date(2024, 3, 31), "30/360"
+        )
+        == 76 / 360
+    )
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 1, 15), datetime.date(2024, 3, 31), "30E/360"
+        )
+        == 75 / 360
+    )
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 2, 29), datetime.date(2024, 8, 31), "30/360 US"
+        )
+        == 180 / 360
+    )
+    assert (
+        daycount.fraction(
+            datetime.date(2023, 2, 28), datetime.date(2024, 2, 29), "30/360 US"
+        )
+        == 1
+    )
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 2, 29), datetime.date(2024, 8, 31), "30/360"
+        )
+        == 182 / 360
+    )
+
+
+def test_business(businessdays):
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 8)
+    assert daycount.fraction(start, end, "BUS/252", calendar=businessdays) == 5 / 252
+    assert (
+        daycount.fraction(
+            datetime.date(2024, 1, 6), end, "BUS/252", calendar=businessdays
+        )
+        == 0
+    )
+    # beyond the calendar
+    assert (
+        daycount.fraction(
+            datetime.date(2000, 1, 1),
+            datetime.date(2030, 1, 1),
+            "BUS/252",
+            calendar=businessdays,
+        )
+        == len(businessdays) / 252
+    )
+
+    for _ in range(100):
+        this = datetime.date(2023, 11, 1) + datetime.timedelta(random.randint(0, 1100))
+        that = datetime.date(2023, 11, 1) + datetime.timedelta(random.randint(0, 1100))
+        expected = businessdays.daysbetween(this, that) * (1 if this <= that else -1)
+        assert (
+            daycount.fraction(this, that, "BUS/252", calendar=businessdays)
+            == expected / 252
+        )
+
+    with pytest.raises(ValueError):
+        daycount.fraction(start, end, "BUS/252")
+    with pytest.raises(TypeError):
+        daycount.fraction(
+            start,
+            end,
+            "BUS/252",
+            calendar=dtwo.Calendar([datetime.datetime(2024, 1, 1, 12)]),
+        )
+
+
+def test_iterables():
+    starts = [datetime.date(2024, 1, 15), datetime.date(2024, 2, 15)]
+    assert daycount.fraction(starts, datetime.date(2024, 3, 15)) == [
+        60 / 360,
+        29 / 360,
+    ]
+    assert daycount.fraction(
+        starts, [datetime.date(2024, 2, 15), datetime.date(2024, 3, 15)], "30/360"
+    ) == [30 / 360, 30 / 360]
+
+
+@pytest.mark.parametrize("convention", sorted(dtwo.constants.DAYCOUNTS))
+def test_numpy(convention, businessdays):
+    numpy = pytest.importorskip("numpy")
+
+    random.seed(convention)
+    starts, ends = [], []
+    for _ in range(500):
+        starts.append(
+            datetime.date(2023, 11, 1) + datetime.timedelta(random.randint(0, 1100))
+        )
+        ends.append(
+            datetime.date(2023, 11, 1) + datetime.timedelta(random.randint(0, 1100))
+        )
+    # ends of month, and of February
+    starts += [datetime.date(2024, 2, 29), datetime.date(2024, 1, 31)]
+    ends += [datetime.date(2025, 2, 28), datetime.date(2024, 3, 31)]
+
+    expected = daycount.fraction(starts, ends, convention, calendar=businessdays)
+    result = daycount.fraction(
+        numpy.array(starts, dtype="datetime64[D]"),
+        numpy.array(ends, dtype="datetime64[D]"),
+        convention,
+        calendar=businessdays,
+    )
+    assert isinstance(result, numpy.ndarray)
+    assert result.tolist() == pytest.approx(expected)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        daycount.fraction(
+            datetime.date(2024, 1, 1), datetime.date(2024, 2, 1), "ACT/364"
+        )
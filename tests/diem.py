@@ -191,3 +191,111 @@ def test_asof():
 def test_replace():
     d = diem(3, 31).replace(month=4, day=30)
     assert d == diem(4, 30)
+
+
+def test_hashable():
+    assert hash(diem(3, 31)) == hash(diem(3, 31))
+    assert len({diem(3, 31), diem(3, 31), diem(3, 30)}) == 2
+    assert {diem(2, 29): 1}[diem(2, 29)] == 1
+    assert diem(2, 29) != diem(2, 29, fold="forward")
+
+
+def test_interned():
+    assert diem(6, 17) is diem(6, 17)
+    assert diem(2, 29) is not diem(2, 29, fold="forward")
+    assert diem(6, 17).replace(day=18) is diem(6, 18)
+    assert diem.parse("--6-17") is diem(6, 17)
+
+
+def test_immutable():
+    day = diem(6, 17)
+    with pytest.raises(AttributeError):
+        day.month = 7
+    with pytest.raises(AttributeError):
+        del day.day
+    assert day == diem(6, 17)
+
+
+def test_pickle():
+    import copy
+    import pickle
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        day = diem(2, 29, fold="forward")
+        assert pickle.loads(pickle.dumps(day, protocol=protocol)) is day
+    assert copy.deepcopy(diem(6, 17)) is diem(6, 17)
+
+
+def test_resolve_many():
+    assert diem(6, 17).resolve(range(2019, 2022)) == [
+        datetime.date(2019, 6, 17),
+        datetime.date(2020, 6, 17),
+        datetime.date(2021, 6, 17),
+    ]
+    assert diem(2, 29).resolve([2020, 2021]) == [
+        datetime.date(2020, 2, 29),
+        datetime.date(2021, 2, 28),
+    ]
+    assert diem(2, 29, fold="forward").resolve([2020, 2021]) == [
+        datetime.date(2020, 2, 29),
+        datetime.date(2021, 3, 1),
+    ]
+    assert diem(2, 29).resolve([2021], fold="forward") == [datetime.date(2021, 3, 1)]
+
+    with pytest.raises(ValueError):
+        diem(6, 17).resolve(2020, fold="sideways")
+
+
+def test_lb_fa_asof_many():
+    dates = [datetime.date(2020, 2, 14), datetime.date(2020, 3, 31)]
+    assert diem(3, 31).lb(dates) == [
+        datetime.date(2019, 3, 31),
+        datetime.date(2019, 3, 31),
+    ]
+    assert diem(3, 31).fa(dates) == [
+        datetime.date(2020, 3, 31),
+        datetime.date(2021, 3, 31),
+    ]
+    assert diem(3, 31).asof(dates) == [
+        datetime.date(2019, 3, 31),
+        datetime.date(2020, 3, 31),
+    ]
+    assert diem(3, 31).asof(dates, side="right") == [
+        datetime.date(2020, 3, 31),
+        datetime.date(2020, 3, 31),
+    ]
+
+
+@pytest.mark.parametrize(
+    "day", [diem(3, 31), diem(1, 1), diem(2, 29), diem(2, 29, fold="forward")]
+)
+def test_numpy(day):
+    numpy = pytest.importorskip("numpy")
+
+    start = datetime.date(2019, 1, 1)
+    dates = [start + datetime.timedelta(i) for i in range(0, 2200, 3)]
+    dates += [datetime.date(2020, 2, 29), datetime.date(2021, 2, 28)]
+    values = numpy.array(dates, dtype="datetime64[D]")
+
+    years = numpy.arange(2018, 2026)
+    result = day.resolve(years)
+    assert result.dtype == numpy.dtype("datetime64[D]")
+    assert result.tolist() == day.resolve(years.tolist())
+    assert day.resolve(years, fold="forward").tolist() == day.resolve(
+        years.tolist(), fold="forward"
+    )
+
+    assert day.lb(values).tolist() == day.lb(dates)
+    assert day.fa(values).tolist() == day.fa(dates)
+    assert day.asof(values).tolist() == day.asof(dates)
+    assert day.asof(values, side="right").tolist() == day.asof(dates, side="right")
+    assert day.lb(dates) == [day.lb(date) for date in dates]
+    assert day.asof(dates) == [day.asof(date) for date in dates]
+
+
+def test_integral_years():
+    numpy = pytest.importorskip("numpy")
+    assert diem(2, 29).resolve(numpy.int64(2021)) == datetime.date(2021, 2, 28)
+    assert diem(2, 29).resolve([numpy.int64(2020)]) == [datetime.date(2020, 2, 29)]
+    with pytest.raises(TypeError):
+        diem(2, 29).resolve(numpy.array([2020.0]))
@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# heavy (or optional) dependencies that `import doubledate` must not import
+DEFERRED = ["dateutil", "numpy", "pandas", "pyarrow", "sortedcontainers"]
+
+
+def imported(code):
+    """
+    Runs the code in a fresh interpreter and returns the names of the modules
+    imported by then.
+    """
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code + "; import json, sys; print(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(process.stdout.splitlines()[-1]))
+
+
+def test_import_is_lazy():
+    modules = imported("import doubledate")
+
+    assert "doubledate" in modules
+    for name in modules:
+        assert name.split(".")[0] not in DEFERRED
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        ("import doubledate; doubledate.parse('2020-01-01')", "dateutil.parser"),
+        ("import doubledate; doubledate.Calendar([])", "sortedcontainers"),
+        (
+            (
+                "import doubledate; doubledate.Calendar.create("
+                "starting=doubledate.date(2020, 1, 1), ending=doubledate.date(2020, 1, 2))"
+            ),
+            "dateutil.rrule",
+        ),
+    ],
+)
+def test_deferred_imports(code, module):
+    assert module in imported(code)
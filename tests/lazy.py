@@ -0,0 +1,98 @@
+import datetime
+import random
+
+import pytest
+
+import doubledate as dtwo
+from doubledate import lazy
+
+
+@pytest.fixture
+def calendars():
+    generator = random.Random(7)
+    dates = [datetime.date(2020, 1, 1) + datetime.timedelta(i) for i in range(1500)]
+    return [
+        dtwo.Calendar(generator.sample(dates, size)) for size in (800, 300, 400, 1000)
+    ]
+
+
+def test_expression(calendars):
+    a, b, c, d = calendars
+    start, end = datetime.date(2021, 1, 1), datetime.date(2022, 6, 30)
+
+    expected = a.union(b).difference(c).intersection(d)[start:end].weekdays()
+    expression = a.lazy().union(b).difference(c).intersection(d)[start:end].weekdays()
+
+    assert isinstance(expression, lazy.Expression)
+    assert expression.collect() == expected
+    assert list(expression) == list(expected)
+
+    expression = (
+        a.lazy()[start:][:end].weekends().filter(lambda date: date.day < 10).union([])
+    )
+    assert expression.collect() == a[start:end].weekends().filter(
+        lambda date: date.day < 10
+    )
+
+    assert a.lazy().intersection(b.lazy(), c).collect() == a.intersection(b, c)
+    assert a.lazy().difference(b, c).collect() == a.difference(b, c)
+    assert len(a.lazy()[end:start].collect()) == 0
+
+
+def test_optimize(calendars):
+    a, b, c, d = calendars
+    start, end = datetime.date(2021, 1, 1), datetime.date(2022, 6, 30)
+
+    optimized = (
+        a.lazy()
+        .union(b)
+        .intersection(d.lazy().intersection(c))[start:end]
+        .weekdays()
+        .filter(lambda date: date.month == 1)
+        .optimize()
+    )
+
+    # filters are fused, and ranges pushed down to the leaves
+    assert isinstance(optimized, lazy.Filter)
+    assert len(optimized.funcs) == 2
+
+    # nested intersections are flattened, and ordered by size
+    intersection = optimized.child
+    assert isinstance(intersection, lazy.Intersection)
+    assert len(intersection.children) == 3
+    sizes = [child._size() for child in intersection.children]
+    assert sizes == sorted(sizes)
+
+    leaves = [intersection.children[0], *intersection.children[-1].children]
+    for leaf in leaves:
+        assert isinstance(leaf, lazy.Leaf)
+        assert (leaf.start, leaf.end) == (start, end)
+
+    assert "Intersection" in repr(optimized)
+
+
+def test_unoptimized(calendars):
+    a, b, c, _ = calendars
+    start, end = datetime.date(2021, 1, 1), datetime.date(2021, 6, 30)
+
+    # ranges are evaluated directly, without pushing them down
+    for expression, expected in [
+        (a.lazy()[start:end], a[start:end]),
+        (a.lazy().union(b)[start:end], a.union(b)[start:end]),
+        (a.lazy().difference(c)[start:], a.difference(c)[start:]),
+        (a.lazy()[start:end][:end], a[start:end]),
+    ]:
+        assert list(expression._iter()) == list(expected)
+        assert expression._size() >= len(expected)
+        assert all(expression._contains(date) for date in expected)
+        assert not expression._contains(datetime.date(2019, 12, 31))
+
+
+def test_errors(calendars):
+    expression = calendars[0].lazy()
+    with pytest.raises(TypeError):
+        expression[0:10]
+    with pytest.raises(TypeError):
+        expression[datetime.date(2021, 1, 1) :: 2]
+    with pytest.raises(ValueError):
+        expression.filter(None)
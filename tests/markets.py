@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+import doubledate as dtwo
+
+
+@pytest.fixture
+def markets():
+    weekdays = dtwo.Calendar(
+        [datetime.date(2024, 1, 1) + datetime.timedelta(i) for i in range(366)]
+    ).weekdays()
+    return dtwo.Markets(
+        {
+            "NY": weekdays.difference([datetime.date(2024, 7, 4)]),
+            "LN": weekdays.difference([datetime.date(2024, 8, 26)]),
+            "TK": weekdays.difference(
+                [datetime.date(2024, 7, 15), datetime.date(2024, 8, 26)]
+            ),
+        }
+    )
+
+
+def test_joint(markets):
+    calendars = markets.calendars
+    assert markets.joint("NY") is calendars["NY"]
+    assert markets.joint(["NY", "LN", "TK"]) == calendars["NY"].intersection(
+        calendars["LN"], calendars["TK"]
+    )
+    assert markets.joint(["NY", "TK"], how="any") == calendars["NY"].union(
+        calendars["TK"]
+    )
+
+    # combined calendars are cached by set of markets
+    assert markets.joint(["NY", "LN"]) is markets.joint(("LN", "NY"))
+    assert markets.joint(["NY", "LN"]) is not markets.joint(["NY", "LN"], how="any")
+    markets.clear()
+    assert markets.joint(["NY", "LN"]) == markets.joint(("LN", "NY"))
+
+    with pytest.raises(KeyError):
+        markets.joint(["NY", "XX"])
+    with pytest.raises(ValueError):
+        markets.joint([])
+    with pytest.raises(ValueError):
+        markets.joint(["NY", "LN"], how="some")
+
+
+def test_queries(markets):
+    assert markets.isbusday(datetime.date(2024, 7, 3), ["NY", "LN"])
+    assert not markets.isbusday(datetime.date(2024, 7, 4), ["NY", "LN"])
+    assert markets.isbusday(datetime.date(2024, 7, 4), ["NY", "LN"], how="any")
+    assert markets.isbusday(
+        [datetime.date(2024, 7, 4), datetime.date(2024, 7, 5)], ["NY", "LN"]
+    ) == [False, True]
+
+    # trade on Wednesday, settle 2 business days later in both markets
+    assert markets.offset(datetime.date(2024, 7, 3), 2, ["NY", "LN"]) == (
+        datetime.date(2024, 7, 8)
+    )
+    assert markets.offset(datetime.date(2024, 7, 3), 2, "LN") == (
+        datetime.date(2024, 7, 5)
+    )
+
+    assert (
+        markets.daysbetween(
+            datetime.date(2024, 7, 1), datetime.date(2024, 7, 31), ["NY", "TK"]
+        )
+        == 20
+    )
+
+
+def test_registry():
+    registry = dtwo.Registry()
+    registry.register(
+        "A", lambda: [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)]
+    )
+    registry.register(
+        "B", lambda: [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)]
+    )
+    markets = dtwo.Markets(registry)
+    assert list(markets.joint(["A", "B"])) == [datetime.date(2024, 1, 2)]
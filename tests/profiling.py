@@ -0,0 +1,115 @@
+import datetime
+import threading
+
+import pytest
+
+import doubledate as dtwo
+from doubledate import profiling
+
+
+def test_disabled_has_no_overhead():
+    assert not profiling.enabled()
+    assert not hasattr(dtwo.Calendar.dayof, "__instrumented__")
+    assert not hasattr(dtwo.utils.offset, "__instrumented__")
+    assert not hasattr(dtwo.offset, "__instrumented__")
+
+
+def test_profile(calendar):
+    originals = (dtwo.Calendar.__dict__["create"], dtwo.Calendar.resample, dtwo.eom)
+
+    with profiling.Profile() as profile:
+        assert profiling.enabled()
+        calendar.resample("M").last()
+        calendar.dayof("M")
+        calendar.dayof("M")
+        dtwo.eom(datetime.date(2020, 1, 15))
+        dtwo.utils.offset(datetime.date(2020, 1, 15), months=1)
+        dtwo.Calendar.create("D", starting=dtwo.date(2020, 1, 1), count=3)
+
+    assert not profiling.enabled()
+    assert originals == (
+        dtwo.Calendar.__dict__["create"],
+        dtwo.Calendar.resample,
+        dtwo.eom,
+    )
+
+    stats = profile.stats()
+    assert stats["Calendar.resample"]["calls"] == 1
+    assert stats["Calendar.resample"]["size"] == len(calendar)
+    assert stats["Calendar.dayof"] == {
+        "calls": 2,
+        "time": stats["Calendar.dayof"]["time"],
+        "size": 2 * len(calendar),
+    }
+    assert stats["LazyCollection.last"]["calls"] == 1
+    assert stats["utils.eom"]["calls"] >= 1
+    assert stats["utils.offset"]["calls"] >= 1
+    assert stats["Calendar.create"]["calls"] >= 1
+    assert all(record["time"] >= 0 for record in stats.values())
+
+    times = [record["time"] for record in stats.values()]
+    assert times == sorted(times, reverse=True)
+
+    # calls made after the profile is stopped are not recorded
+    calendar.dayof("M")
+    assert profile.stats()["Calendar.dayof"]["calls"] == 2
+
+    profile.reset()
+    assert profile.stats() == {}
+
+
+def test_global_switch(calendar):
+    calls = []
+    profiling.enable(callback=lambda *args: calls.append(args))
+    try:
+        assert profiling.enabled()
+        calendar.fa(datetime.date(2019, 1, 1))
+        assert datetime.date(2019, 1, 1) not in calendar
+    finally:
+        profiling.disable()
+
+    assert not profiling.enabled()
+    assert profiling.stats()["Calendar.fa"]["calls"] == 1
+    assert profiling.stats()["Calendar.__contains__"]["calls"] >= 1
+    assert ("Calendar.fa", calls[-2][1], len(calendar)) in calls
+
+    profiling.reset()
+    assert profiling.stats() == {}
+
+
+def test_nested_profiles(calendar):
+    with profiling.Profile() as outer:
+        with profiling.Profile() as inner:
+            calendar.weekdays()
+        assert profiling.enabled()
+        calendar.weekdays()
+    assert not profiling.enabled()
+
+    assert inner.stats()["Calendar.weekdays"]["calls"] == 1
+    assert outer.stats()["Calendar.weekdays"]["calls"] == 2
+
+
+def test_exceptions_are_preserved():
+    # constructors failing before their attributes are set cannot be sized
+    with profiling.Profile() as profile:
+        with pytest.raises(TypeError):
+            dtwo.Calendar([1, 2])
+        with pytest.raises(TypeError):
+            dtwo.calendar.Collection([1])
+
+    assert profile.stats()["Calendar.__init__"]["calls"] == 1
+
+
+def test_threads(calendar):
+    def work():
+        for _ in range(50):
+            calendar.dayof("M")
+
+    with profiling.Profile() as profile:
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert profile.stats()["Calendar.dayof"]["calls"] == 200
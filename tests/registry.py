@@ -0,0 +1,168 @@
+import datetime
+import threading
+
+import pytest
+
+import doubledate as dtwo
+
+
+def test_loaders(calendar, tmp_path):
+    registry = dtwo.Registry()
+
+    path = tmp_path / "calendar.cal"
+    calendar.save(path)
+
+    registry.register("instance", calendar)
+    registry.register("path", path)
+    registry.register("string", str(path))
+    registry.register("callable", lambda: calendar.dates)
+    registry.register(
+        "rule",
+        {
+            "freq": "D",
+            "starting": datetime.datetime(2020, 1, 1),
+            "ending": datetime.datetime(2020, 1, 31),
+        },
+    )
+
+    assert registry.get("instance") is calendar
+    assert registry["path"] == calendar
+    assert registry["string"] == calendar
+    assert registry["callable"] == calendar
+    assert len(registry["rule"]) == 31
+
+    assert "path" in registry
+    assert len(registry) == 5
+    assert list(registry) == ["instance", "path", "string", "callable", "rule"]
+
+
+def test_register_errors(calendar):
+    registry = dtwo.Registry()
+    registry.register("cal", calendar)
+
+    with pytest.raises(KeyError):
+        registry.register("cal", calendar)
+
+    registry.register("cal", lambda: [datetime.date(2020, 1, 1)], replace=True)
+    assert len(registry["cal"]) == 1
+
+    with pytest.raises(TypeError):
+        registry.register("other", 42)
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+    registry.unregister("cal")
+    with pytest.raises(KeyError):
+        registry.get("cal")
+
+
+def test_lazy_and_cached(calendar):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return calendar
+
+    registry = dtwo.Registry()
+    registry.register("cal", loader)
+    assert calls == []
+
+    assert registry["cal"] is registry["cal"]
+    assert len(calls) == 1
+
+    stats = registry.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["loadtime"] >= 0
+
+    registry.clear()
+    assert registry.stats()["size"] == 0
+    registry["cal"]
+    assert len(calls) == 2
+
+
+def test_eviction(calendar):
+    registry = dtwo.Registry(maxsize=2)
+    for name in "abc":
+        registry.register(name, lambda: calendar)
+
+    registry["a"], registry["b"], registry["a"], registry["c"]
+
+    # b is the least recently used
+    stats = registry.stats()
+    assert (stats["evictions"], stats["size"]) == (1, 2)
+    registry["a"]
+    assert registry.stats()["hits"] == 2
+    registry["b"]
+    assert registry.stats()["misses"] == 4
+
+    with pytest.raises(ValueError):
+        dtwo.Registry(maxsize=0)
+
+
+def test_threads(calendar):
+    calls = []
+    registry = dtwo.Registry()
+    registry.register("cal", lambda: calls.append(1) or calendar)
+
+    threads = [threading.Thread(target=registry.get, args=("cal",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+def test_slow_loader(calendar):
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return calendar
+
+    registry = dtwo.Registry()
+    registry.register("slow", slow)
+    registry.register("fast", calendar)
+    registry.get("fast")
+
+    threads = [threading.Thread(target=registry.get, args=("slow",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+
+    # other calendars are not blocked by the slow loader
+    assert registry.get("fast") is calendar
+    registry.register("other", lambda: calendar)
+    assert registry.get("other") is calendar
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert registry.get("slow") is calendar
+
+
+def test_failed_loader(calendar):
+    calls = []
+
+    def failing():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("unavailable")
+        return calendar
+
+    registry = dtwo.Registry()
+    registry.register("cal", failing)
+    with pytest.raises(OSError):
+        registry.get("cal")
+    assert registry.get("cal") is calendar
+
+
+def test_default_registry(calendar):
+    dtwo.registry.register("test_default_registry", calendar)
+    try:
+        assert dtwo.registry.get("test_default_registry") is calendar
+    finally:
+        dtwo.registry.default.unregister("test_default_registry")
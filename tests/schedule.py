@@ -0,0 +1,195 @@
+import datetime
+
+import pytest
+
+import doubledate as dtwo
+from doubledate import schedule
+
+
+@pytest.fixture
+def businessdays():
+    return dtwo.Calendar(
+        [datetime.date(2023, 12, 1) + datetime.timedelta(i) for i in range(1000)]
+    ).weekdays()
+
+
+def test_regular():
+    result = dtwo.Schedule(datetime.date(2024, 1, 15), datetime.date(2025, 1, 15), "Q")
+    assert result.unadjusted == [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 4, 15),
+        datetime.date(2024, 7, 15),
+        datetime.date(2024, 10, 15),
+        datetime.date(2025, 1, 15),
+    ]
+    assert result.adjusted == result.unadjusted
+    assert len(result) == 5
+    assert list(result) == result.adjusted
+    assert result.periods()[0] == (
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 4, 15),
+    )
+
+    weekly = dtwo.Schedule(datetime.date(2024, 1, 1), datetime.date(2024, 1, 29), "W")
+    assert weekly.unadjusted == [
+        datetime.date(2024, 1, 1) + datetime.timedelta(weeks=i) for i in range(5)
+    ]
+
+
+def test_stubs():
+    effective, termination = datetime.date(2024, 1, 15), datetime.date(2024, 12, 1)
+    assert dtwo.Schedule(effective, termination, "Q").unadjusted == [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 4, 15),
+        datetime.date(2024, 7, 15),
+        datetime.date(2024, 10, 15),
+        datetime.date(2024, 12, 1),
+    ]
+    assert dtwo.Schedule(effective, termination, "Q", stub="long_final").unadjusted == [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 4, 15),
+        datetime.date(2024, 7, 15),
+        datetime.date(2024, 12, 1),
+    ]
+    assert dtwo.Schedule(
+        effective, termination, "Q", stub="short_initial"
+    ).unadjusted == [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 3, 1),
+        datetime.date(2024, 6, 1),
+        datetime.date(2024, 9, 1),
+        datetime.date(2024, 12, 1),
+    ]
+    assert dtwo.Schedule(
+        effective, termination, "Q", stub="long_initial"
+    ).unadjusted == [
+        datetime.date(2024, 1, 15),
+        datetime.date(2024, 6, 1),
+        datetime.date(2024, 9, 1),
+        datetime.date(2024, 12, 1),
+    ]
+
+    # no irregular period to merge
+    assert (
+        len(
+            dtwo.Schedule(
+                datetime.date(2024, 1, 15),
+                datetime.date(2025, 1, 15),
+                "Q",
+                stub="long_final",
+            )
+        )
+        == 5
+    )
+
+
+def test_eom():
+    effective, termination = datetime.date(2024, 1, 31), datetime.date(2024, 7, 31)
+    assert dtwo.Schedule(effective, termination, "M").unadjusted[1:4] == [
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 3, 31),
+        datetime.date(2024, 4, 30),
+    ]
+    # dates do not drift after a short month
+    assert dtwo.Schedule(
+        datetime.date(2024, 1, 30), datetime.date(2024, 4, 30), "M"
+    ).unadjusted == [
+        datetime.date(2024, 1, 30),
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 3, 30),
+        datetime.date(2024, 4, 30),
+    ]
+    assert dtwo.Schedule(
+        datetime.date(2024, 2, 29), datetime.date(2024, 8, 31), "Q", eom=True
+    ).unadjusted == [
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 5, 31),
+        datetime.date(2024, 8, 31),
+    ]
+    assert dtwo.Schedule(
+        datetime.date(2024, 2, 29), datetime.date(2024, 8, 29), "Q"
+    ).unadjusted[1] == datetime.date(2024, 5, 29)
+
+
+def test_adjusted(businessdays):
+    result = dtwo.Schedule(
+        datetime.date(2024, 3, 30),
+        datetime.date(2024, 9, 30),
+        "Q",
+        calendar=businessdays,
+        convention="MF",
+    )
+    assert result.unadjusted == [
+        datetime.date(2024, 3, 30),
+        datetime.date(2024, 6, 30),
+        datetime.date(2024, 9, 30),
+    ]
+    assert result.adjusted == [
+        datetime.date(2024, 3, 29),
+        datetime.date(2024, 6, 28),
+        datetime.date(2024, 9, 30),
+    ]
+    assert result.convention == "modified_following"
+
+    following = dtwo.Schedule(
+        datetime.date(2024, 3, 30),
+        datetime.date(2024, 9, 30),
+        "Q",
+        calendar=businessdays,
+        convention="following",
+    )
+    assert following.adjusted[:2] == [
+        datetime.date(2024, 4, 1),
+        datetime.date(2024, 7, 1),
+    ]
+
+    with pytest.raises(KeyError):
+        dtwo.Schedule(
+            datetime.date(2024, 3, 30),
+            datetime.date(2040, 9, 30),
+            "Y",
+            calendar=businessdays,
+        )
+
+
+def test_memoization(businessdays, monkeypatch):
+    calls = []
+    generate = schedule.generate
+
+    def counted(*args):
+        calls.append(args)
+        return generate(*args)
+
+    monkeypatch.setattr(schedule, "generate", counted)
+    schedule.CACHE.clear()
+    schedule.ADJUSTED.clear()
+
+    args = (datetime.date(2024, 1, 15), datetime.date(2026, 1, 15), "H")
+    first = dtwo.Schedule(*args, calendar=businessdays)
+    second = dtwo.Schedule(*args, calendar=businessdays)
+    assert first.adjusted == second.adjusted
+    assert len(calls) == 1
+
+    # the calendar's own cache of derived data is left untouched
+    assert businessdays.__cache__ is None or not any(
+        key[0] == "schedule" for key in businessdays.__cache__._values
+    )
+
+    # results are not shared between schedules
+    first.adjusted.append(None)
+    assert None not in dtwo.Schedule(*args, calendar=businessdays).adjusted
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        dtwo.Schedule(datetime.date(2024, 1, 1), datetime.date(2024, 1, 1), "M")
+    with pytest.raises(ValueError):
+        dtwo.Schedule(datetime.date(2024, 1, 1), datetime.date(2025, 1, 1), "D")
+    with pytest.raises(ValueError):
+        dtwo.Schedule(
+            datetime.date(2024, 1, 1), datetime.date(2025, 1, 1), stub="middle"
+        )
+    with pytest.raises(ValueError):
+        dtwo.Schedule(
+            datetime.date(2024, 1, 1), datetime.date(2025, 1, 1), convention="nearest"
+        )
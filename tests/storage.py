@@ -0,0 +1,138 @@
+import datetime
+
+import pytest
+
+import doubledate as dtwo
+from doubledate import storage
+
+
+@pytest.mark.parametrize("encoding", ["delta", "raw"])
+def test_roundtrip(calendar, encoding):
+    buffer = calendar.to_bytes(encoding)
+    assert buffer[:5] == b"DDCAL"
+
+    loaded = dtwo.Calendar.from_bytes(buffer)
+    assert loaded == calendar
+    assert loaded.dates == calendar.dates
+    assert len(loaded) == len(calendar)
+
+
+def test_compact(calendar):
+    # business days are at most a few days apart: 1 byte per date, except
+    # for the first ordinal which takes 3 bytes
+    assert len(calendar.to_bytes("delta")) == storage.HEADER.size + len(calendar) + 2
+    assert len(calendar.to_bytes("raw")) == storage.HEADER.size + 4 * len(calendar)
+
+
+def test_empty():
+    for encoding in ["delta", "raw"]:
+        assert len(dtwo.Calendar.from_bytes(dtwo.Calendar([]).to_bytes(encoding))) == 0
+
+
+def test_invalid(calendar):
+    buffer = bytearray(calendar.to_bytes())
+
+    with pytest.raises(ValueError):
+        dtwo.Calendar.from_bytes(b"DDCAL")
+
+    with pytest.raises(ValueError):
+        dtwo.Calendar.from_bytes(b"XXXXX" + bytes(buffer[5:]))
+
+    buffer[-1] ^= 0xFF
+    with pytest.raises(ValueError):
+        dtwo.Calendar.from_bytes(bytes(buffer))
+
+    with pytest.raises(ValueError):
+        calendar.to_bytes("zip")
+
+
+def test_datetimes():
+    calendar = dtwo.Calendar([datetime.datetime(2020, 1, 1, 12)])
+    with pytest.raises(TypeError):
+        calendar.to_bytes()
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load(calendar, tmp_path, mmap):
+    path = tmp_path / "calendar.cal"
+    calendar.save(path, encoding="raw")
+
+    loaded = dtwo.Calendar.load(path, mmap=mmap)
+    assert loaded.dates == calendar.dates
+
+
+def test_mmap_requires_raw(calendar, tmp_path):
+    path = tmp_path / "calendar.cal"
+    calendar.save(path)
+
+    assert dtwo.Calendar.load(path) == calendar
+    with pytest.raises(ValueError):
+        dtwo.Calendar.load(path, mmap=True)
+
+
+def test_ordinal_backed(calendar, tmp_path):
+    path = tmp_path / "calendar.cal"
+    calendar.save(path, encoding="raw")
+    loaded = dtwo.Calendar.load(path, mmap=True)
+
+    date = datetime.date(2018, 3, 29)
+    assert date in loaded
+    assert datetime.date(2018, 3, 30) not in loaded
+    assert datetime.datetime(2018, 3, 29) not in loaded
+    assert loaded.index(date) == calendar.index(date)
+    assert loaded[date:] == calendar[date:]
+    assert loaded[5:50:3].dates == calendar[5:50:3].dates
+    assert loaded[::-1] == calendar
+    assert loaded.asof(datetime.date(2018, 3, 30)) == date
+    assert loaded.fa(date) == calendar.fa(date)
+    assert loaded.union(calendar) == calendar
+    assert len(loaded.difference(calendar)) == 0
+    assert loaded.resample("M").first() == calendar.resample("M").first()
+    assert loaded.dayof("M")[date] == calendar.dayof("M")[date]
+
+
+def test_pickle_calendar(calendar):
+    import pickle
+
+    calendar.dayof("M")
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        buffer = pickle.dumps(calendar, protocol=protocol)
+        loaded = pickle.loads(buffer)
+        assert loaded.dates == calendar.dates
+        assert loaded.__cache__ is None
+
+    # about 1 byte per date, rather than a pickled date object per date
+    assert len(pickle.dumps(calendar)) < 2 * len(calendar) + 200
+
+
+def test_pickle_datetimes():
+    import pickle
+
+    calendar = dtwo.Calendar(
+        [datetime.datetime(2020, 1, 1, 12), datetime.datetime(2020, 1, 1, 18)]
+    )
+    assert pickle.loads(pickle.dumps(calendar)).dates == calendar.dates
+
+
+def test_pickle_mmap(calendar, tmp_path):
+    import pickle
+
+    path = tmp_path / "calendar.cal"
+    calendar.save(path, encoding="raw")
+    loaded = dtwo.Calendar.load(path, mmap=True)
+    assert pickle.loads(pickle.dumps(loaded)) == calendar
+
+
+def test_pickle_collection(calendar):
+    import pickle
+
+    collection = calendar.resample("M")
+    loaded = pickle.loads(pickle.dumps(collection))
+    assert len(loaded) == len(collection)
+    for this, that in zip(loaded, collection):
+        assert this.dates == that.dates
+
+    # interleaved calendars cannot be stored as a single parent
+    collection = calendar.groupby(lambda date: date.weekday())
+    loaded = pickle.loads(pickle.dumps(collection))
+    assert [c.dates for c in loaded] == [c.dates for c in collection]